@@ -0,0 +1,43 @@
+"""Benchmark union_area and overlap_area on random parts scattered over a sheet
+
+Run with ``python benchmarks/bench_coverage.py [--sizes 10000 100000 1000000]``.
+"""
+
+import argparse
+import math
+import random
+import time
+
+from shapes.coverage import overlap_area, union_area
+from shapes.rectangle import PositionedRectangle
+
+
+def parts(count: int, seed: int) -> list[PositionedRectangle]:
+    """Scatter rectangles over a square sheet sized so they cover about half of it"""
+    rng = random.Random(seed)
+    side = math.sqrt(count * 30.25 * 2)
+    return [
+        PositionedRectangle(
+            rng.uniform(1, 10), rng.uniform(1, 10), rng.uniform(0, side), rng.uniform(0, side)
+        )
+        for _ in range(count)
+    ]
+
+
+def main() -> None:
+    """Time both areas for each size and print rectangles per second"""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    args = parser.parse_args()
+    print(f"{'case':<14} {'rectangles':>10} {'seconds':>10} {'rectangles/s':>14}")
+    for size in args.sizes:
+        rectangles = parts(size, seed=size)
+        for case in (union_area, overlap_area):
+            start = time.perf_counter()
+            case(rectangles)
+            elapsed = time.perf_counter() - start
+            print(f"{case.__name__:<14} {size:>10} {elapsed:>10.3f} {size / elapsed:>14,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""Benchmark enclosing_circle and bounding_rectangle on Gaussian point clouds
+
+Run with ``python benchmarks/bench_enclosing.py [--sizes 10000 100000 1000000]``.
+"""
+
+import argparse
+import random
+import time
+from array import array
+from collections.abc import Callable
+
+from shapes.enclosing import bounding_rectangle, enclosing_circle
+
+CASES: dict[str, Callable[[array, array], object]] = {
+    "enclosing_circle": lambda xs, ys: enclosing_circle(xs, ys, seed=0),
+    "bounding_rectangle": lambda xs, ys: bounding_rectangle(xs, ys),
+    "bounding_rectangle(oriented=False)": lambda xs, ys: bounding_rectangle(
+        xs, ys, oriented=False
+    ),
+}
+
+
+def cloud(count: int, seed: int) -> tuple[array, array]:
+    """Draw a Gaussian point cloud as coordinate buffers"""
+    rng = random.Random(seed)
+    xs = array("d", [rng.gauss(0, 1) for _ in range(count)])
+    ys = array("d", [rng.gauss(0, 1) for _ in range(count)])
+    return xs, ys
+
+
+def main() -> None:
+    """Time every case for each size and print points per second"""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--repeat", type=int, default=3, help="runs per size; the best is kept")
+    args = parser.parse_args()
+    print(f"{'case':<36} {'points':>10} {'seconds':>10} {'points/s':>12}")
+    for size in args.sizes:
+        xs, ys = cloud(size, seed=size)
+        for name, case in CASES.items():
+            best = float("inf")
+            for _ in range(args.repeat):
+                start = time.perf_counter()
+                case(xs, ys)
+                best = min(best, time.perf_counter() - start)
+            print(f"{name:<36} {size:>10} {best:>10.3f} {size / best:>12,.0f}")
+
+
+if __name__ == "__main__":
+    main()
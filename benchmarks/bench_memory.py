@@ -0,0 +1,152 @@
+"""Measure bytes per instance and allocations per operation for every shape class
+
+Run with ``python benchmarks/bench_memory.py [--count 10000] [--update] [--tolerance 0.05]``.
+Results are compared with ``benchmarks/memory_baseline.json`` and the script exits with status 1
+if the retained bytes or the peak bytes of a case grow by more than the tolerance, or if it
+keeps more than half a block more per object. Run with ``--update`` to record new baselines.
+Sizes depend on the Python version, so baselines recorded with another version are only shown.
+"""
+
+import argparse
+import json
+import platform
+import sys
+import tracemalloc
+from collections.abc import Callable
+from pathlib import Path
+
+from shapes import (
+    AcuteTriangle,
+    Circle,
+    ObtuseTriangle,
+    PositionedCircle,
+    PositionedRectangle,
+    PositionedTriangle,
+    Rectangle,
+    RightTriangle,
+    Square,
+)
+
+# Baselines checked in next to this script
+_BASELINE = Path(__file__).with_name("memory_baseline.json")
+
+# Factories building a distinct instance of every class from a row number
+_CLASSES: dict[str, Callable[[int], object]] = {
+    "Circle": lambda i: Circle(1.5 + i),
+    "PositionedCircle": lambda i: PositionedCircle(1.5 + i, 0.5 * i, 0.25 * i),
+    "Rectangle": lambda i: Rectangle(1.5 + i, 2.5 + i),
+    "Square": lambda i: Square(1.5 + i),
+    "PositionedRectangle": lambda i: PositionedRectangle(1.5 + i, 2.5 + i, 0.5 * i, 0.25 * i),
+    "RightTriangle": lambda i: RightTriangle(3.5 + i, 4.5 + i),
+    "AcuteTriangle": lambda i: AcuteTriangle(4 * (1.5 + i), 5 * (1.5 + i), 6 * (1.5 + i)),
+    "ObtuseTriangle": lambda i: ObtuseTriangle(3 * (1.5 + i), 4 * (1.5 + i), 6 * (1.5 + i)),
+    "PositionedTriangle": lambda i: PositionedTriangle(
+        (0.5 * i, 0.0), (3.5 + 0.5 * i, 0.0), (0.5 * i, 4.5)
+    ),
+}
+
+# Operations that build a new shape, each applied to every instance of every class
+_OPERATIONS: dict[str, Callable[[object], object]] = {
+    "*": lambda shape: shape * 2.0,  # type: ignore[operator]
+    "/": lambda shape: shape / 2.0,  # type: ignore[operator]
+}
+
+
+def measure(count: int, make: Callable[[int], object]) -> dict[str, float]:
+    """Measure the memory an object keeps and the high-water mark of building it
+    Args:
+        count: number of objects built for each figure
+        make: call building a new object from a row number
+    Returns:
+        bytes and memory blocks kept per object, and the median of the peak bytes traced while
+        one object is built; peak minus bytes is what the temporary objects of the call cost
+    Note:
+        The list holding the objects is left out of every figure.
+    """
+    tracemalloc.start()
+    try:
+        before = sys.getallocatedblocks()
+        start = tracemalloc.get_traced_memory()[0]
+        objects = [make(i) for i in range(count)]
+        current = tracemalloc.get_traced_memory()[0]
+        blocks = sys.getallocatedblocks() - before - 1
+        kept = current - start - sys.getsizeof(objects)
+        del objects
+        peaks = []
+        for i in range(count):
+            start = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+            make(i)
+            peaks.append(tracemalloc.get_traced_memory()[1] - start)
+        # The median ignores the rare build that also grows an allocator pool or free list
+        peak = sorted(peaks)[count // 2]
+    finally:
+        tracemalloc.stop()
+    return {
+        "bytes": round(kept / count, 1),
+        "blocks": round(blocks / count, 1),
+        "peak": float(peak),
+    }
+
+
+def run(count: int) -> dict[str, dict[str, float]]:
+    """Measure every class and every operation on it"""
+    results = {}
+    for name, factory in _CLASSES.items():
+        results[name] = measure(count, factory)
+        shapes = [factory(i) for i in range(count)]
+        for symbol, operation in _OPERATIONS.items():
+            results[f"{name} {symbol} 2"] = measure(
+                count, lambda i, operation=operation: operation(shapes[i])
+            )
+    return results
+
+
+def _change(current: float, previous: float) -> float:
+    """Get the relative change of a figure from its baseline"""
+    return current / previous - 1 if previous else 0.0
+
+
+def main() -> None:
+    """Print the memory figures next to the baselines and flag regressions"""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=10_000)
+    parser.add_argument("--update", action="store_true", help="record the results as baselines")
+    parser.add_argument("--tolerance", type=float, default=0.05)
+    args = parser.parse_args()
+    version = ".".join(platform.python_version_tuple()[:2])
+    results = run(args.count)
+    baseline = json.loads(_BASELINE.read_text()) if _BASELINE.exists() else {}
+    comparable = baseline.get("python") == version
+    if baseline and not comparable:
+        print(f"Baselines were recorded with Python {baseline.get('python')}, not {version}")
+    regressions = []
+    header = f"{'case':<26} {'bytes':>8} {'blocks':>7} {'peak':>8}"
+    print(f"{header} {'baseline':>9} {'change':>8} {'peak change':>12}")
+    for case, figures in results.items():
+        previous = baseline.get("results", {}).get(case) if comparable else None
+        line = f"{case:<26} {figures['bytes']:>8.1f} {figures['blocks']:>7.1f}"
+        line += f" {figures['peak']:>8.1f}"
+        if previous:
+            change = _change(figures["bytes"], previous["bytes"])
+            line += f" {previous['bytes']:>9.1f} {change:>+8.1%}"
+            # The peak covers the temporaries of one build, which retained bytes do not show
+            peak = _change(figures["peak"], previous["peak"])
+            line += f" {peak:>+12.1%}"
+            if (
+                change > args.tolerance
+                or peak > args.tolerance
+                or figures["blocks"] > previous["blocks"] + 0.5
+            ):
+                regressions.append(case)
+        print(line)
+    if args.update:
+        _BASELINE.write_text(json.dumps({"python": version, "results": results}, indent=2) + "\n")
+        print(f"Baselines written to {_BASELINE.name}")
+    elif regressions:
+        print(f"Memory regressions: {', '.join(regressions)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
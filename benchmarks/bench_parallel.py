@@ -0,0 +1,49 @@
+"""Benchmark ParallelEvaluator scaling with the number of threads
+
+Run with ``python benchmarks/bench_parallel.py [--sizes 1000000] [--threads 1 2 4 8]``.
+Threads only scale evaluation on free-threaded builds; with the GIL enabled the timings stay
+roughly flat as threads are added.
+"""
+
+import argparse
+import time
+
+from shapes.frame import ShapeType
+from shapes.generate import ShapeGenerator
+from shapes.parallel import ParallelEvaluator, gil_enabled
+
+# Rectangles and the three triangle types, whose metrics go through the heavier kernels
+_WEIGHTS = {
+    ShapeType.RECTANGLE: 1.0,
+    ShapeType.RIGHT_TRIANGLE: 1.0,
+    ShapeType.ACUTE_TRIANGLE: 1.0,
+    ShapeType.OBTUSE_TRIANGLE: 1.0,
+}
+
+
+def main() -> None:
+    """Time a triangle-heavy metric for each size and thread count and print the speedup"""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000_000])
+    parser.add_argument("--threads", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--metric", default="inradius")
+    args = parser.parse_args()
+    print(f"GIL enabled: {gil_enabled()}")
+    print(f"{'shapes':>10} {'threads':>8} {'seconds':>10} {'shapes/s':>14} {'speedup':>8}")
+    for size in args.sizes:
+        frame = ShapeGenerator(seed=size, weights=_WEIGHTS).frame(size)
+        baseline = None
+        for threads in args.threads:
+            with ParallelEvaluator(threads) as evaluator:
+                start = time.perf_counter()
+                evaluator.metric(frame, args.metric)
+                elapsed = time.perf_counter() - start
+            baseline = baseline or elapsed
+            print(
+                f"{size:>10} {threads:>8} {elapsed:>10.3f} {size / elapsed:>14,.0f}"
+                f" {baseline / elapsed:>8.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
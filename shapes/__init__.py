@@ -1,9 +1,11 @@
 """Shapes module"""
 
-from .triangle import RightTriangle, AcuteTriangle, ObtuseTriangle, Triangle
-from .circle import Circle
-from .rectangle import Rectangle, Square
+from .triangle import RightTriangle, AcuteTriangle, ObtuseTriangle, Triangle, PositionedTriangle
+from .circle import Circle, PositionedCircle
+from .rectangle import Rectangle, Square, PositionedRectangle
+from .frame import ShapeFrame, ShapeType
 
-__all__ = ['Triangle', 'RightTriangle', 'AcuteTriangle', 'ObtuseTriangle',
-           'Circle',
-           'Rectangle', 'Square']
+__all__ = ['Triangle', 'RightTriangle', 'AcuteTriangle', 'ObtuseTriangle', 'PositionedTriangle',
+           'Circle', 'PositionedCircle',
+           'Rectangle', 'Square', 'PositionedRectangle',
+           'ShapeFrame', 'ShapeType']
@@ -0,0 +1,5 @@
+"""Backend module"""
+
+from .backend import Backend, available, get_backend, register, set_backend
+
+__all__ = ["Backend", "available", "get_backend", "register", "set_backend"]
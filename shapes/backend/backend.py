@@ -0,0 +1,164 @@
+"""Module to select the implementation of batch metric kernels at runtime"""
+
+import math
+from array import array
+from collections.abc import Callable, Mapping, Sequence
+
+try:
+    import numpy
+except ImportError:
+    numpy = None  # type: ignore[assignment]
+
+Kernel = Callable[..., array]
+
+# Kernels every backend must provide; rectangle, square and most circle metrics are plain
+# arithmetic in ShapeFrame and need no kernel, but still run under whichever backend is selected
+_KERNELS: tuple[str, ...] = ("heron", "opposite_angle", "segment_area")
+
+
+class Backend:
+    """Named set of batch metric kernels that map columns of floats to an array of doubles"""
+
+    def __init__(self, name: str, kernels: Mapping[str, Kernel]) -> None:
+        """Initialize the Backend
+        Args:
+            name: name the backend is registered and selected under
+            kernels: implementation of every kernel, keyed by kernel name
+        Raises:
+            ValueError: if a kernel is missing or unknown
+        """
+        if set(kernels) != set(_KERNELS):
+            raise ValueError(f"Backends must implement exactly the kernels {_KERNELS}")
+        self._name: str = name
+        self._kernels: dict[str, Kernel] = dict(kernels)
+
+    def name(self) -> str:
+        """Get the name of the backend"""
+        return self._name
+
+    def heron(self, a: Sequence[float], b: Sequence[float], c: Sequence[float]) -> array:
+        """Calculate triangle areas from side columns with Heron's formula"""
+        return self._kernels["heron"](a, b, c)
+
+    def opposite_angle(self, x: Sequence[float], y: Sequence[float], z: Sequence[float]) -> array:
+        """Calculate the angles opposite side z, in radians, with the law of cosines"""
+        return self._kernels["opposite_angle"](x, y, z)
+
+    def segment_area(self, radius: Sequence[float], angle: Sequence[float]) -> array:
+        """Calculate circular segment areas from radius and central angle columns"""
+        return self._kernels["segment_area"](radius, angle)
+
+    def __str__(self) -> str:
+        """String representation of the Backend"""
+        return f"Backend(name={self._name})"
+
+    def __repr__(self) -> str:
+        """String representation of the Backend"""
+        return f"name={self._name}"
+
+
+def _python_heron(a: Sequence[float], b: Sequence[float], c: Sequence[float]) -> array:
+    """Heron's formula with the standard library"""
+    areas = array("d")
+    for x, y, z in zip(a, b, c):
+        s = (x + y + z) / 2
+        areas.append(math.sqrt(s * (s - x) * (s - y) * (s - z)))
+    return areas
+
+
+def _python_opposite_angle(x: Sequence[float], y: Sequence[float], z: Sequence[float]) -> array:
+    """Law of cosines with the standard library"""
+    return array(
+        "d", [math.acos((p * p + q * q - r * r) / (2 * p * q)) for p, q, r in zip(x, y, z)]
+    )
+
+
+def _python_segment_area(radius: Sequence[float], angle: Sequence[float]) -> array:
+    """Circular segment areas with the standard library"""
+    return array("d", [0.5 * r**2 * (t - math.sin(t)) for r, t in zip(radius, angle)])
+
+
+def _numpy_heron(a: Sequence[float], b: Sequence[float], c: Sequence[float]) -> array:
+    """Heron's formula vectorized with NumPy"""
+    x, y, z = (numpy.asarray(column, dtype=numpy.float64) for column in (a, b, c))
+    s = (x + y + z) / 2
+    return array("d", numpy.sqrt(s * (s - x) * (s - y) * (s - z)).tobytes())
+
+
+def _numpy_opposite_angle(x: Sequence[float], y: Sequence[float], z: Sequence[float]) -> array:
+    """Law of cosines vectorized with NumPy"""
+    p, q, r = (numpy.asarray(column, dtype=numpy.float64) for column in (x, y, z))
+    return array("d", numpy.arccos((p * p + q * q - r * r) / (2 * p * q)).tobytes())
+
+
+def _numpy_segment_area(radius: Sequence[float], angle: Sequence[float]) -> array:
+    """Circular segment areas vectorized with NumPy"""
+    r = numpy.asarray(radius, dtype=numpy.float64)
+    t = numpy.asarray(angle, dtype=numpy.float64)
+    return array("d", (0.5 * r**2 * (t - numpy.sin(t))).tobytes())
+
+
+_BACKENDS: dict[str, Backend] = {
+    "python": Backend(
+        "python",
+        {
+            "heron": _python_heron,
+            "opposite_angle": _python_opposite_angle,
+            "segment_area": _python_segment_area,
+        },
+    )
+}
+if numpy is not None:
+    _BACKENDS["numpy"] = Backend(
+        "numpy",
+        {
+            "heron": _numpy_heron,
+            "opposite_angle": _numpy_opposite_angle,
+            "segment_area": _numpy_segment_area,
+        },
+    )
+
+# Backend used by get_backend() when no name is given; NumPy when it is installed
+_current: Backend = _BACKENDS["numpy" if numpy is not None else "python"]
+
+
+def register(backend: Backend) -> None:
+    """Make a backend selectable by its name
+    Raises:
+        ValueError: if a backend with the same name is already registered
+    """
+    if backend.name() in _BACKENDS:
+        raise ValueError(f"Backend '{backend.name()}' is already registered")
+    _BACKENDS[backend.name()] = backend
+
+
+def available() -> list[str]:
+    """Get the names of the registered backends"""
+    return list(_BACKENDS)
+
+
+def get_backend(name: str | None = None) -> Backend:
+    """Get a registered backend
+    Args:
+        name: name of the backend; None for the current backend
+    Raises:
+        ValueError: if no backend is registered under the name
+    """
+    if name is None:
+        return _current
+    if name not in _BACKENDS:
+        raise ValueError(f"Unknown backend '{name}'; available backends are {available()}")
+    return _BACKENDS[name]
+
+
+def set_backend(name: str) -> Backend:
+    """Select the backend used by ShapeFrame metrics and get_backend()
+    Returns:
+        the backend that was current before, so it can be restored
+    Raises:
+        ValueError: if no backend is registered under the name
+    """
+    global _current
+    previous = _current
+    _current = get_backend(name)
+    return previous
@@ -0,0 +1 @@
+"""Tests for Backend package"""
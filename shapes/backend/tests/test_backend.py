@@ -0,0 +1,164 @@
+"""Test cases for the compute backend registry"""
+
+import math
+
+import pytest
+
+from shapes import (
+    AcuteTriangle,
+    Circle,
+    ObtuseTriangle,
+    Rectangle,
+    RightTriangle,
+    ShapeFrame,
+    Square,
+)
+from shapes.backend import Backend, available, get_backend, register, set_backend
+from shapes.backend import backend as registry
+from shapes.generate import ShapeGenerator
+
+BACKENDS = available()
+
+
+def triangles():
+    """Create a mix of valid acute and obtuse triangles"""
+    return [AcuteTriangle(5, 6, 7), ObtuseTriangle(3, 4, 6), AcuteTriangle(4, 5, 6)] + [
+        triangle
+        for triangle in ShapeGenerator(seed=3).shapes(200)
+        if isinstance(triangle, (AcuteTriangle, ObtuseTriangle))
+    ]
+
+
+def sides(shapes):
+    """Split triangles into side columns"""
+    return [t.a for t in shapes], [t.b for t in shapes], [t.c for t in shapes]
+
+
+@pytest.fixture
+def restore_backend():
+    """Restore the current backend after a test changes it"""
+    previous = get_backend()
+    yield
+    set_backend(previous.name())
+
+
+@pytest.mark.parametrize("name", BACKENDS)
+class TestBackendConformance:
+    """Test that every backend matches the scalar shape methods"""
+
+    def test_heron(self, name):
+        """Test Heron areas against the triangle classes"""
+        shapes = triangles()
+        areas = get_backend(name).heron(*sides(shapes))
+        assert list(areas) == pytest.approx([t.area() for t in shapes], rel=1e-12)
+
+    def test_opposite_angle(self, name):
+        """Test law-of-cosines angles against the triangle classes"""
+        shapes = triangles()
+        a, b, c = sides(shapes)
+        backend = get_backend(name)
+        assert list(backend.opposite_angle(b, c, a)) == pytest.approx(
+            [t.angle_a() for t in shapes], rel=1e-12
+        )
+        assert list(backend.opposite_angle(a, b, c)) == pytest.approx(
+            [t.angle_c() for t in shapes], rel=1e-12
+        )
+
+    def test_segment_area(self, name):
+        """Test segment areas against Circle.segment_area"""
+        radii = [0.5, 1, 2.5, 10]
+        angles = [0.1, math.pi / 2, math.pi, 2 * math.pi]
+        areas = get_backend(name).segment_area(radii, angles)
+        expected = [Circle(r).segment_area(t) for r, t in zip(radii, angles)]
+        assert list(areas) == pytest.approx(expected, rel=1e-12)
+
+    def test_empty_columns(self, name):
+        """Test that empty columns give an empty array"""
+        assert len(get_backend(name).heron([], [], [])) == 0
+
+    def test_frame_metrics(self, name, restore_backend):
+        """Test that ShapeFrame metrics computed on the backend match the scalar methods"""
+        shapes = triangles() + [RightTriangle(3, 4)]
+        set_backend(name)
+        frame = ShapeFrame(shapes)
+        assert list(frame.metric("area")) == pytest.approx([t.area() for t in shapes])
+        assert list(frame.metric("angle_b")) == pytest.approx([t.angle_b() for t in shapes])
+
+    @pytest.mark.parametrize(
+        "shapes, metrics",
+        [
+            ([Rectangle(1, 2), Rectangle(3.5, 0.25)], ["area", "perimeter", "diagonal"]),
+            ([Square(1), Square(2.5), Square(0.1)], ["area", "perimeter", "diagonal"]),
+            ([Circle(0.5), Circle(1), Circle(12.25)], ["area", "circumference", "diameter"]),
+        ],
+    )
+    def test_frame_metrics_other_shapes(self, name, restore_backend, shapes, metrics):
+        """Test that rectangle, square and circle metrics match the scalar methods on the backend"""
+        set_backend(name)
+        frame = ShapeFrame(shapes)
+        for metric in metrics:
+            expected = [getattr(shape, metric)() for shape in shapes]
+            assert list(frame.metric(metric)) == pytest.approx(expected, rel=1e-12)
+
+
+class TestBackendRegistry:
+    """Test registering and selecting backends"""
+
+    def test_python_always_available(self):
+        """Test that the standard library backend is always registered"""
+        assert "python" in available()
+        assert get_backend("python").name() == "python"
+
+    def test_default_prefers_numpy(self):
+        """Test that NumPy is the default when it is installed"""
+        expected = "numpy" if "numpy" in available() else "python"
+        assert registry._current.name() == expected
+
+    def test_set_backend_returns_previous(self, restore_backend):
+        """Test selecting a backend and restoring the previous one"""
+        previous = set_backend("python")
+        assert get_backend().name() == "python"
+        assert set_backend(previous.name()).name() == "python"
+
+    def test_unknown_backend(self):
+        """Test that an unknown name raises ValueError"""
+        with pytest.raises(ValueError):
+            get_backend("fortran")
+        with pytest.raises(ValueError):
+            set_backend("fortran")
+
+    def test_register(self, restore_backend, monkeypatch):
+        """Test registering and selecting a custom backend"""
+        monkeypatch.setattr(registry, "_BACKENDS", dict(registry._BACKENDS))
+        python = get_backend("python")
+        calls = []
+
+        def heron(a, b, c):
+            calls.append(len(a))
+            return python.heron(a, b, c)
+
+        register(
+            Backend(
+                "traced",
+                {
+                    "heron": heron,
+                    "opposite_angle": python.opposite_angle,
+                    "segment_area": python.segment_area,
+                },
+            )
+        )
+        set_backend("traced")
+        ShapeFrame([AcuteTriangle(5, 6, 7)]).metric("area")
+        assert calls == [1]
+        with pytest.raises(ValueError):
+            register(Backend("traced", registry._BACKENDS["python"]._kernels))
+
+    def test_missing_kernel(self):
+        """Test that a backend without every kernel raises ValueError"""
+        with pytest.raises(ValueError):
+            Backend("partial", {"heron": get_backend("python").heron})
+
+    def test_str(self):
+        """Test the str and repr of a Backend"""
+        assert str(get_backend("python")) == "Backend(name=python)"
+        assert repr(get_backend("python")) == "name=python"
@@ -1,5 +1,5 @@
 """Circle module"""
 
-from .circle import Circle
+from .circle import Circle, PositionedCircle
 
-__all__ = ["Circle"]
+__all__ = ["Circle", "PositionedCircle"]
@@ -106,6 +106,10 @@ class Circle:
             raise TypeError("Can only compare Circle with another Circle")
         return self.area() < other.area()
 
+    def __reduce__(self) -> tuple[type, tuple[float, ...]]:
+        """Pickle the Circle as its constructor arguments instead of its instance dictionary"""
+        return (type(self), (self._radius,))
+
     def __str__(self) -> str:
         """String representation of the Circle"""
         return f"Circle(radius={self._radius})"
@@ -113,3 +117,87 @@ class Circle:
     def __repr__(self) -> str:
         """String representation of the Circle"""
         return f"radius={self._radius}"
+
+
+@total_ordering
+class PositionedCircle(Circle):
+    """PositionedCircle class to represent a circle placed at a center point
+    Note:
+        == compares the center only when both shapes are positioned; against a Circle without a
+        position only the size is compared. Equality is therefore not transitive: two shapes
+        placed apart both equal the same unplaced shape but not each other.
+    """
+
+    def __init__(self, radius: int | float, x: int | float = 0.0, y: int | float = 0.0) -> None:
+        """Initialize the PositionedCircle with a radius and a center
+        Args:
+            radius: radius of the circle
+            x: x coordinate of the center
+            y: y coordinate of the center
+        Raises:
+            ValueError: if radius is not positive
+        """
+        super().__init__(radius)
+        self._x: float = float(x)
+        self._y: float = float(y)
+
+    def center(self) -> tuple[float, float]:
+        """Get the center of the circle"""
+        return (self._x, self._y)
+
+    def move_to(self, x: int | float, y: int | float) -> None:
+        """Move the center of the circle to a new point"""
+        self._x = float(x)
+        self._y = float(y)
+
+    def translate(self, dx: int | float, dy: int | float) -> None:
+        """Move the center of the circle by an offset"""
+        self._x += dx
+        self._y += dy
+
+    def __reduce__(self) -> tuple[type, tuple[float, ...]]:
+        """Pickle the PositionedCircle as its constructor arguments"""
+        return (type(self), (self._radius, self._x, self._y))
+
+    def bounds(self) -> tuple[float, float, float, float]:
+        """Get the axis-aligned bounding box as (min_x, min_y, max_x, max_y)"""
+        r = self._radius
+        return (self._x - r, self._y - r, self._x + r, self._y + r)
+
+    def contains_point(self, x: int | float, y: int | float) -> bool:
+        """Check if a point lies inside or on the circle"""
+        dx = x - self._x
+        dy = y - self._y
+        return dx * dx + dy * dy <= self._radius * self._radius
+
+    def distance_to(self, x: int | float, y: int | float) -> float:
+        """Calculate the distance from a point to the circle, 0 if the point is inside"""
+        return max(0.0, math.hypot(x - self._x, y - self._y) - self._radius)
+
+    def __mul__(self, scale: int | float) -> "PositionedCircle":
+        """Scale the area of the circle by a factor, keeping the center"""
+        new = PositionedCircle(self._radius, self._x, self._y)
+        new *= scale
+        return new
+
+    def __truediv__(self, scale: int | float) -> "PositionedCircle":
+        """Scale the area of the circle down by a factor, keeping the center"""
+        new = PositionedCircle(self._radius, self._x, self._y)
+        new /= scale
+        return new
+
+    def __eq__(self, other: object) -> bool:
+        """Equality comparison for PositionedCircle, including the center when both are placed"""
+        if not super().__eq__(other):
+            return False
+        if isinstance(other, PositionedCircle):
+            return math.isclose(self._x, other._x) and math.isclose(self._y, other._y)
+        return True
+
+    def __str__(self) -> str:
+        """String representation of the PositionedCircle"""
+        return f"PositionedCircle(radius={self._radius}, center=({self._x}, {self._y}))"
+
+    def __repr__(self) -> str:
+        """String representation of the PositionedCircle"""
+        return f"radius={self._radius}, center=({self._x}, {self._y})"
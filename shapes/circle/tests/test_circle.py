@@ -1,10 +1,11 @@
 """Test cases for Circle class"""
 
 import math
+import pickle
 
 import pytest
 
-from shapes import Circle
+from shapes import Circle, PositionedCircle
 
 
 class TestCircleBasics:
@@ -289,3 +290,94 @@ class TestCircleEdgeCases:
         """Test segment area with zero angle"""
         circle = Circle(5)
         assert math.isclose(circle.segment_area(0), 0)
+
+
+# PositionedCircle Tests
+
+
+class TestPositionedCircle:
+    """Test circles placed at a center point"""
+
+    def test_initialization(self):
+        """Test positioned circle initialization"""
+        circle = PositionedCircle(2, 3, 4)
+        assert circle.radius() == 2
+        assert circle.center() == (3, 4)
+
+    def test_default_center(self):
+        """Test that the center defaults to the origin"""
+        assert PositionedCircle(1).center() == (0, 0)
+
+    def test_invalid_radius(self):
+        """Test that a non-positive radius raises ValueError"""
+        with pytest.raises(ValueError):
+            PositionedCircle(0, 1, 1)
+
+    def test_bounds(self):
+        """Test the bounding box"""
+        assert PositionedCircle(2, 3, 4).bounds() == (1, 2, 5, 6)
+
+    def test_move(self):
+        """Test moving the center"""
+        circle = PositionedCircle(1, 0, 0)
+        circle.move_to(5, 5)
+        circle.translate(1, -2)
+        assert circle.center() == (6, 3)
+
+    def test_contains_point(self):
+        """Test point containment, including the boundary"""
+        circle = PositionedCircle(5, 1, 1)
+        assert circle.contains_point(1, 1)
+        assert circle.contains_point(4, 5)
+        assert not circle.contains_point(5, 5)
+
+    def test_distance_to(self):
+        """Test the distance from a point"""
+        circle = PositionedCircle(1, 0, 0)
+        assert circle.distance_to(0, 0) == 0
+        assert math.isclose(circle.distance_to(3, 4), 4)
+
+    def test_scaling_keeps_center(self):
+        """Test that scaling keeps the type and the center"""
+        scaled = PositionedCircle(1, 2, 3) * 4
+        assert isinstance(scaled, PositionedCircle)
+        assert scaled.radius() == 2
+        assert scaled.center() == (2, 3)
+        assert (scaled / 4).center() == (2, 3)
+
+    def test_equality(self):
+        """Test that centers are compared between positioned circles"""
+        assert PositionedCircle(1, 2, 3) == PositionedCircle(1, 2, 3)
+        assert PositionedCircle(1, 2, 3) != PositionedCircle(1, 0, 0)
+        assert PositionedCircle(1, 2, 3) == Circle(1)
+
+    def test_equality_not_transitive(self):
+        """Test that unplaced circles equal positioned ones at any center, as documented"""
+        placed, other, plain = PositionedCircle(1, 2, 3), PositionedCircle(1, 0, 0), Circle(1)
+        assert placed == plain and plain == other
+        assert placed != other
+
+    def test_is_circle(self):
+        """Test that positioned circles are ordinary circles too"""
+        assert PositionedCircle(1, 5, 5) < Circle(2)
+        assert math.isclose(PositionedCircle(1, 5, 5).area(), math.pi)
+
+    def test_str(self):
+        """Test string representations"""
+        assert str(PositionedCircle(1, 2, 3)) == "PositionedCircle(radius=1.0, center=(2.0, 3.0))"
+        assert repr(PositionedCircle(1, 2, 3)) == "radius=1.0, center=(2.0, 3.0)"
+
+
+class TestCirclePickling:
+    """Test pickling circles"""
+
+    def test_roundtrip(self):
+        """Test that unpickled circles keep their class and values"""
+        for circle in (Circle(2.5), PositionedCircle(1, 2, 3)):
+            copy = pickle.loads(pickle.dumps(circle))
+            assert type(copy) is type(circle)
+            assert vars(copy) == vars(circle)
+
+    def test_pickle_holds_arguments_only(self):
+        """Test that the pickle stores constructor arguments rather than attribute names"""
+        assert b"_radius" not in pickle.dumps(PositionedCircle(1, 2, 3))
@@ -0,0 +1,5 @@
+"""Collision module"""
+
+from .collision import SweepAndPrune, overlaps
+
+__all__ = ["SweepAndPrune", "overlaps"]
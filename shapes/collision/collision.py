@@ -0,0 +1,164 @@
+"""Module to detect overlapping positioned circles and rectangles"""
+
+import math
+from collections.abc import Iterable
+
+from shapes.circle import PositionedCircle
+from shapes.rectangle import PositionedRectangle
+
+Body = PositionedCircle | PositionedRectangle
+
+
+def _circle_rectangle(circle: PositionedCircle, rect: PositionedRectangle) -> bool:
+    """Check if a circle overlaps a rectangle by clamping its center to the rectangle"""
+    cx, cy = circle.center()
+    min_x, min_y, max_x, max_y = rect.bounds()
+    dx = cx - min(max(cx, min_x), max_x)
+    dy = cy - min(max(cy, min_y), max_y)
+    r = circle.radius()
+    return dx * dx + dy * dy < r * r
+
+
+def overlaps(first: Body, second: Body) -> bool:
+    """Exact test for whether two positioned shapes overlap; touching shapes do not overlap
+    Args:
+        first: a PositionedCircle or PositionedRectangle
+        second: a PositionedCircle or PositionedRectangle
+    Raises:
+        TypeError: if either shape is not a positioned circle or rectangle
+    """
+    if isinstance(first, PositionedCircle) and isinstance(second, PositionedCircle):
+        (x1, y1), (x2, y2) = first.center(), second.center()
+        reach = first.radius() + second.radius()
+        return (x1 - x2) ** 2 + (y1 - y2) ** 2 < reach * reach
+    if isinstance(first, PositionedRectangle) and isinstance(second, PositionedRectangle):
+        a, b = first.bounds(), second.bounds()
+        return a[0] < b[2] and b[0] < a[2] and a[1] < b[3] and b[1] < a[3]
+    if isinstance(first, PositionedCircle) and isinstance(second, PositionedRectangle):
+        return _circle_rectangle(first, second)
+    if isinstance(first, PositionedRectangle) and isinstance(second, PositionedCircle):
+        return _circle_rectangle(second, first)
+    raise TypeError("Can only test PositionedCircle and PositionedRectangle for overlap")
+
+
+class SweepAndPrune:
+    """Broad-phase collision engine that sweeps bodies sorted along x within horizontal bands"""
+
+    def __init__(
+        self, bodies: Iterable[Body] = (), band_height: int | float | None = None
+    ) -> None:
+        """Initialize the SweepAndPrune engine with optional bodies
+        Args:
+            bodies: positioned circles and rectangles to add
+            band_height: height of the horizontal bands; by default four times the mean body
+                height, chosen at the first step
+        Raises:
+            ValueError: if band_height is not positive
+        """
+        if band_height is not None and band_height <= 0:
+            raise ValueError("Band height must be positive")
+        self._band_height: float | None = None if band_height is None else float(band_height)
+        self._bodies: dict[int, Body] = {}
+        self._bands: dict[int, list[int]] = {}
+        self._spans: dict[int, tuple[int, int]] = {}
+        self._next_handle: int = 0
+        for body in bodies:
+            self.add(body)
+
+    def add(self, body: Body) -> int:
+        """Add a body to the engine
+        Returns:
+            handle identifying the body in reported pairs
+        Raises:
+            TypeError: if the body is not a positioned circle or rectangle
+        """
+        if not isinstance(body, (PositionedCircle, PositionedRectangle)):
+            raise TypeError("Bodies must be PositionedCircle or PositionedRectangle")
+        handle = self._next_handle
+        self._next_handle += 1
+        self._bodies[handle] = body
+        return handle
+
+    def remove(self, handle: int) -> None:
+        """Remove a body from the engine
+        Raises:
+            KeyError: if the handle is unknown
+        """
+        del self._bodies[handle]
+        span = self._spans.pop(handle, None)
+        if span is not None:
+            for band in range(span[0], span[1] + 1):
+                self._bands[band].remove(handle)
+
+    def body(self, handle: int) -> Body:
+        """Get the body for a handle"""
+        return self._bodies[handle]
+
+    def __len__(self) -> int:
+        """Number of bodies in the engine"""
+        return len(self._bodies)
+
+    def _assign_bands(self, bounds: dict[int, tuple[float, float, float, float]]) -> float:
+        """Move bodies whose vertical extent changed band into their new bands"""
+        if self._band_height is None:
+            mean_height = sum(b[3] - b[1] for b in bounds.values()) / len(bounds)
+            self._band_height = 4 * mean_height
+        height = self._band_height
+        bands = self._bands
+        spans = self._spans
+        for handle, b in bounds.items():
+            span = (math.floor(b[1] / height), math.floor(b[3] / height))
+            old = spans.get(handle)
+            if old == span:
+                continue
+            if old is not None:
+                for band in range(old[0], old[1] + 1):
+                    bands[band].remove(handle)
+            for band in range(span[0], span[1] + 1):
+                bands.setdefault(band, []).append(handle)
+            spans[handle] = span
+        return height
+
+    def step(self) -> list[tuple[int, int]]:
+        """Report every pair of overlapping bodies at their current positions
+        Returns:
+            pairs of handles, each with the smaller handle first
+        Note:
+            Bodies are only compared with neighbours sharing an x range and a band. Each band
+            keeps its x order from the previous step and is re-sorted; bodies that only move a
+            little leave it almost sorted, which the adaptive sort handles in near-linear time.
+        """
+        bodies = self._bodies
+        if not bodies:
+            return []
+        bounds = {handle: body.bounds() for handle, body in bodies.items()}
+        height = self._assign_bands(bounds)
+        pairs = []
+        for band, order in self._bands.items():
+            order.sort(key=lambda handle: bounds[handle][0])
+            count = len(order)
+            for position in range(count):
+                first = order[position]
+                a = bounds[first]
+                for other in range(position + 1, count):
+                    second = order[other]
+                    b = bounds[second]
+                    if b[0] >= a[2]:
+                        break
+                    if b[1] >= a[3] or a[1] >= b[3]:
+                        continue
+                    # A pair sharing several bands is reported only by the band holding
+                    # the bottom of their common vertical range
+                    if math.floor(max(a[1], b[1]) / height) != band:
+                        continue
+                    if overlaps(bodies[first], bodies[second]):
+                        pairs.append((first, second) if first < second else (second, first))
+        return pairs
+
+    def __str__(self) -> str:
+        """String representation of the SweepAndPrune engine"""
+        return f"SweepAndPrune(bodies={len(self._bodies)})"
+
+    def __repr__(self) -> str:
+        """String representation of the SweepAndPrune engine"""
+        return f"bodies={len(self._bodies)}"
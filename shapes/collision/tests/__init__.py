@@ -0,0 +1 @@
+"""Tests for Collision package"""
@@ -0,0 +1,121 @@
+"""Test cases for the SweepAndPrune engine and the overlaps function"""
+
+import itertools
+import random
+
+import pytest
+
+from shapes import Circle, PositionedCircle, PositionedRectangle
+from shapes.collision import SweepAndPrune, overlaps
+
+
+def random_bodies(count, seed=1, extent=50):
+    """Create a reproducible mix of positioned circles and rectangles"""
+    rng = random.Random(seed)
+    bodies = []
+    for i in range(count):
+        x, y = rng.uniform(0, extent), rng.uniform(0, extent)
+        if i % 2:
+            bodies.append(PositionedCircle(rng.uniform(0.2, 1.5), x, y))
+        else:
+            bodies.append(PositionedRectangle(rng.uniform(0.2, 3), rng.uniform(0.2, 3), x, y))
+    return bodies
+
+
+def brute_force(bodies):
+    """Find overlapping pairs by testing every pair"""
+    pairs = itertools.combinations(enumerate(bodies), 2)
+    return {(i, j) for (i, a), (j, b) in pairs if overlaps(a, b)}
+
+
+class TestOverlaps:
+    """Test the narrow-phase overlap test"""
+
+    def test_circles(self):
+        """Test circle against circle"""
+        assert overlaps(PositionedCircle(1, 0, 0), PositionedCircle(1, 1.9, 0))
+        assert not overlaps(PositionedCircle(1, 0, 0), PositionedCircle(1, 2, 0))
+
+    def test_rectangles(self):
+        """Test rectangle against rectangle"""
+        assert overlaps(PositionedRectangle(2, 2, 0, 0), PositionedRectangle(2, 2, 1, 1))
+        assert not overlaps(PositionedRectangle(2, 2, 0, 0), PositionedRectangle(2, 2, 2, 0))
+
+    def test_circle_and_rectangle(self):
+        """Test circle against rectangle in both orders"""
+        rect = PositionedRectangle(2, 2, 0, 0)
+        assert overlaps(PositionedCircle(1, 2.5, 1), rect)
+        assert overlaps(rect, PositionedCircle(0.5, 1, 1))
+        # Near the corner the bounding boxes overlap but the shapes do not
+        assert not overlaps(PositionedCircle(1, 2.8, 2.8), rect)
+
+    def test_unsupported(self):
+        """Test that unplaced shapes raise TypeError"""
+        with pytest.raises(TypeError):
+            overlaps(Circle(1), PositionedCircle(1, 0, 0))
+
+
+class TestSweepAndPrune:
+    """Test the broad-phase engine"""
+
+    def test_empty(self):
+        """Test stepping with no bodies"""
+        assert SweepAndPrune().step() == []
+
+    def test_simple_pair(self):
+        """Test that a single overlap is reported by handle"""
+        engine = SweepAndPrune()
+        first = engine.add(PositionedCircle(1, 0, 0))
+        engine.add(PositionedCircle(1, 10, 10))
+        third = engine.add(PositionedRectangle(1, 1, 0.5, 0))
+        assert engine.step() == [(first, third)]
+        assert len(engine) == 3
+
+    @pytest.mark.parametrize("band_height", [None, 0.5, 5, 1000])
+    def test_matches_brute_force(self, band_height):
+        """Test that every band height finds exactly the overlapping pairs"""
+        bodies = random_bodies(600)
+        engine = SweepAndPrune(bodies, band_height=band_height)
+        assert set(engine.step()) == brute_force(bodies)
+
+    def test_no_duplicate_pairs(self):
+        """Test that pairs spanning several bands are reported once"""
+        bodies = [PositionedRectangle(1, 10, 0, 0), PositionedRectangle(1, 10, 0.5, 0)]
+        pairs = SweepAndPrune(bodies, band_height=1).step()
+        assert pairs == [(0, 1)]
+
+    def test_incremental_steps(self):
+        """Test that moving bodies between steps keeps results exact"""
+        bodies = random_bodies(400, seed=3)
+        engine = SweepAndPrune(bodies)
+        rng = random.Random(4)
+        for _ in range(5):
+            for body in bodies:
+                body.translate(rng.uniform(-0.5, 0.5), rng.uniform(-0.5, 0.5))
+            assert set(engine.step()) == brute_force(bodies)
+
+    def test_remove(self):
+        """Test removing a body"""
+        engine = SweepAndPrune()
+        first = engine.add(PositionedCircle(1, 0, 0))
+        second = engine.add(PositionedCircle(1, 1, 0))
+        assert engine.step() == [(first, second)]
+        engine.remove(second)
+        assert engine.step() == []
+        assert engine.body(first).center() == (0, 0)
+        with pytest.raises(KeyError):
+            engine.remove(second)
+
+    def test_invalid_body(self):
+        """Test that unplaced shapes raise TypeError"""
+        with pytest.raises(TypeError):
+            SweepAndPrune([Circle(1)])
+
+    def test_invalid_band_height(self):
+        """Test that a non-positive band height raises ValueError"""
+        with pytest.raises(ValueError):
+            SweepAndPrune(band_height=0)
+
+    def test_str(self):
+        """Test str of an engine"""
+        assert str(SweepAndPrune(random_bodies(3))) == "SweepAndPrune(bodies=3)"
@@ -0,0 +1,5 @@
+"""Containment module"""
+
+from .containment import contains, contains_any, hit_lists
+
+__all__ = ["contains", "contains_any", "hit_lists"]
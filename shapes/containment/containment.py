@@ -0,0 +1,133 @@
+"""Module to test many query points against positioned shapes in bulk"""
+
+import math
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterable, Sequence
+
+from shapes.circle import PositionedCircle
+from shapes.rectangle import PositionedRectangle
+from shapes.triangle import PositionedTriangle
+
+Region = PositionedCircle | PositionedRectangle | PositionedTriangle
+
+
+def _check_points(xs: Sequence[float], ys: Sequence[float]) -> None:
+    """Check that the coordinate buffers describe the same number of points"""
+    if len(xs) != len(ys):
+        raise ValueError("Coordinate buffers must have the same length")
+
+
+def _mask(shape: Region, xs: Sequence[float], ys: Sequence[float]) -> bytearray:
+    """Test every point against one shape with the shape's parameters hoisted out of the loop"""
+    points = zip(xs, ys)
+    if isinstance(shape, PositionedCircle):
+        cx, cy = shape.center()
+        r2 = shape.radius() ** 2
+        return bytearray((x - cx) ** 2 + (y - cy) ** 2 <= r2 for x, y in points)
+    if isinstance(shape, PositionedRectangle):
+        min_x, min_y, max_x, max_y = shape.bounds()
+        return bytearray(min_x <= x <= max_x and min_y <= y <= max_y for x, y in points)
+    if isinstance(shape, PositionedTriangle):
+        (a1, b1, c1), (a2, b2, c2), (a3, b3, c3) = shape.edges()
+        return bytearray(
+            a1 * x + b1 * y + c1 >= 0 and a2 * x + b2 * y + c2 >= 0 and a3 * x + b3 * y + c3 >= 0
+            for x, y in points
+        )
+    raise TypeError("Shapes must be PositionedCircle, PositionedRectangle or PositionedTriangle")
+
+
+def _strip(y: float, low_y: float, height: float, strips: int) -> int:
+    """Get the strip holding a y coordinate, clamped to the strips that exist
+    Note:
+        Points and shape bounds must share this formula; floor division and true division
+        round differently on strip boundaries, e.g. 0.5 // 0.1 is 4.0 but 0.5 / 0.1 is 5.0.
+    """
+    return min(max(int((y - low_y) / height), 0), strips - 1)
+
+
+def _hits_by_shape(
+    shapes: Iterable[Region], xs: Sequence[float], ys: Sequence[float]
+) -> Iterable[tuple[list[int], int]]:
+    """Yield the points inside each shape, testing only the points under its bounding box"""
+    _check_points(xs, ys)
+    count = len(xs)
+    if count == 0:
+        return
+    # Bucket the points into horizontal strips, each sorted by x, so a shape only visits the
+    # strips it spans and bisects the x range of its bounding box within each of them
+    strips = max(1, math.isqrt(count) // 4)
+    low_y = min(ys)
+    height = (max(ys) - low_y) / strips or 1.0
+    strip_of = [_strip(y, low_y, height, strips) for y in ys]
+    order = sorted(range(count), key=xs.__getitem__)
+    order.sort(key=strip_of.__getitem__)
+    sorted_xs = [xs[index] for index in order]
+    sorted_ys = [ys[index] for index in order]
+    starts = [0] * (strips + 1)
+    for strip in strip_of:
+        starts[strip + 1] += 1
+    for strip in range(strips):
+        starts[strip + 1] += starts[strip]
+    for number, shape in enumerate(shapes):
+        if not isinstance(shape, (PositionedCircle, PositionedRectangle, PositionedTriangle)):
+            raise TypeError(
+                "Shapes must be PositionedCircle, PositionedRectangle or PositionedTriangle"
+            )
+        min_x, min_y, max_x, max_y = shape.bounds()
+        first = _strip(min_y, low_y, height, strips)
+        last = _strip(max_y, low_y, height, strips)
+        inside = []
+        for strip in range(first, last + 1):
+            low = bisect_left(sorted_xs, min_x, starts[strip], starts[strip + 1])
+            high = bisect_right(sorted_xs, max_x, low, starts[strip + 1])
+            if low < high:
+                mask = _mask(shape, sorted_xs[low:high], sorted_ys[low:high])
+                inside.extend(order[low + offset] for offset, hit in enumerate(mask) if hit)
+        if inside:
+            yield inside, number
+
+
+def contains(shape: Region, xs: Sequence[float], ys: Sequence[float]) -> bytearray:
+    """Test a buffer of points against one positioned shape
+    Args:
+        shape: a PositionedCircle, PositionedRectangle or PositionedTriangle
+        xs: x coordinates of the query points
+        ys: y coordinates of the query points
+    Returns:
+        mask with 1 for every point inside or on the shape and 0 otherwise
+    Raises:
+        ValueError: if xs and ys differ in length
+        TypeError: if the shape is not positioned
+    """
+    _check_points(xs, ys)
+    return _mask(shape, xs, ys)
+
+
+def contains_any(shapes: Iterable[Region], xs: Sequence[float], ys: Sequence[float]) -> bytearray:
+    """Test a buffer of points against many positioned shapes
+    Returns:
+        mask with 1 for every point inside or on at least one shape and 0 otherwise
+    Raises:
+        ValueError: if xs and ys differ in length
+        TypeError: if a shape is not positioned
+    """
+    mask = bytearray(len(xs))
+    for hits, _ in _hits_by_shape(shapes, xs, ys):
+        for index in hits:
+            mask[index] = 1
+    return mask
+
+
+def hit_lists(shapes: Iterable[Region], xs: Sequence[float], ys: Sequence[float]) -> list[list[int]]:
+    """Find, for every query point, the positioned shapes containing it
+    Returns:
+        one list per point holding the indices of the shapes that contain it, in shape order
+    Raises:
+        ValueError: if xs and ys differ in length
+        TypeError: if a shape is not positioned
+    """
+    hits: list[list[int]] = [[] for _ in range(len(xs))]
+    for inside, number in _hits_by_shape(shapes, xs, ys):
+        for index in inside:
+            hits[index].append(number)
+    return hits
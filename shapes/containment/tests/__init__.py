@@ -0,0 +1 @@
+"""Tests for Containment package"""
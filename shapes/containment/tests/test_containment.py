@@ -0,0 +1,117 @@
+"""Test cases for bulk point containment"""
+
+import random
+from array import array
+
+import pytest
+
+from shapes import Circle, PositionedCircle, PositionedRectangle, PositionedTriangle
+from shapes.containment import contains, contains_any, hit_lists
+
+
+def random_points(count, seed=1):
+    """Create reproducible query point buffers"""
+    rng = random.Random(seed)
+    xs = array("d", (rng.uniform(-5, 25) for _ in range(count)))
+    ys = array("d", (rng.uniform(-5, 25) for _ in range(count)))
+    return xs, ys
+
+
+def random_regions(count, seed=2):
+    """Create a reproducible mix of positioned shapes"""
+    rng = random.Random(seed)
+    regions = []
+    for i in range(count):
+        x, y = rng.uniform(0, 20), rng.uniform(0, 20)
+        if i % 3 == 0:
+            regions.append(PositionedCircle(rng.uniform(0.5, 3), x, y))
+        elif i % 3 == 1:
+            regions.append(PositionedRectangle(rng.uniform(0.5, 4), rng.uniform(0.5, 4), x, y))
+        else:
+            regions.append(
+                PositionedTriangle((x, y), (x + rng.uniform(1, 4), y), (x, y + rng.uniform(1, 4)))
+            )
+    return regions
+
+
+class TestContains:
+    """Test masks for a single shape"""
+
+    def test_circle(self):
+        """Test the circle mask, including the boundary"""
+        mask = contains(PositionedCircle(1, 0, 0), [0, 1, 1], [0, 0, 1])
+        assert list(mask) == [1, 1, 0]
+
+    def test_rectangle(self):
+        """Test the rectangle mask"""
+        mask = contains(PositionedRectangle(2, 1, 0, 0), [1, 2, 3], [0.5, 1, 0.5])
+        assert list(mask) == [1, 1, 0]
+
+    def test_triangle(self):
+        """Test the triangle mask"""
+        mask = contains(PositionedTriangle((0, 0), (4, 0), (0, 3)), [1, 3, 0], [1, 3, 3])
+        assert list(mask) == [1, 0, 1]
+
+    @pytest.mark.parametrize("index", range(9))
+    def test_matches_contains_point(self, index):
+        """Test masks against the scalar containment test"""
+        region = random_regions(9)[index]
+        xs, ys = random_points(2000)
+        expected = [int(region.contains_point(x, y)) for x, y in zip(xs, ys)]
+        assert list(contains(region, xs, ys)) == expected
+
+    def test_length_mismatch(self):
+        """Test that buffers of different lengths raise ValueError"""
+        with pytest.raises(ValueError):
+            contains(PositionedCircle(1), [0, 1], [0])
+
+    def test_unpositioned_shape(self):
+        """Test that unplaced shapes raise TypeError"""
+        with pytest.raises(TypeError):
+            contains(Circle(1), [0], [0])
+
+
+class TestHitLists:
+    """Test containment against many shapes"""
+
+    def test_matches_brute_force(self):
+        """Test hit lists against testing every pair"""
+        regions = random_regions(60)
+        xs, ys = random_points(3000)
+        expected = [
+            [number for number, region in enumerate(regions) if region.contains_point(x, y)]
+            for x, y in zip(xs, ys)
+        ]
+        assert hit_lists(regions, xs, ys) == expected
+
+    def test_contains_any(self):
+        """Test the union mask against the hit lists"""
+        regions = random_regions(30, seed=5)
+        xs, ys = random_points(2000, seed=6)
+        hits = hit_lists(regions, xs, ys)
+        assert list(contains_any(regions, xs, ys)) == [int(bool(h)) for h in hits]
+
+    def test_points_on_edges_at_strip_boundaries(self):
+        """Test that points on a shape's edges are found when the edges lie on strip boundaries"""
+        rng = random.Random(3)
+        xs = array("d", [rng.uniform(0, 1) for _ in range(1600)] + [0.25])
+        ys = array("d", [rng.uniform(0, 1) for _ in range(1600)] + [0.5])
+        ys[0], ys[1] = 0.0, 1.0
+        region = PositionedRectangle(0.5, 0.3, 0, 0.2)
+        assert contains_any([region], xs, ys) == contains(region, xs, ys)
+        assert hit_lists([region], xs, ys)[-1] == [0]
+
+    def test_no_points(self):
+        """Test empty point buffers"""
+        assert hit_lists(random_regions(3), [], []) == []
+        assert contains_any(random_regions(3), [], []) == bytearray()
+
+    def test_identical_y(self):
+        """Test points that all share one y coordinate"""
+        hits = hit_lists([PositionedRectangle(1, 1, 0, 0)], [0.5, 2], [1, 1])
+        assert hits == [[0], []]
+
+    def test_unpositioned_shape(self):
+        """Test that unplaced shapes raise TypeError"""
+        with pytest.raises(TypeError):
+            hit_lists([Circle(1)], [0], [0])
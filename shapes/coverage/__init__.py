@@ -0,0 +1,19 @@
+"""Coverage module"""
+
+from .coverage import (
+    AreaEstimate,
+    circle_union_area,
+    estimate_circle_union_area,
+    overlap_area,
+    union_area,
+    utilization,
+)
+
+__all__ = [
+    "AreaEstimate",
+    "circle_union_area",
+    "estimate_circle_union_area",
+    "overlap_area",
+    "union_area",
+    "utilization",
+]
@@ -0,0 +1,300 @@
+"""Module to measure the area covered by many positioned shapes"""
+
+import math
+import random
+from collections.abc import Iterable
+from itertools import accumulate
+from statistics import NormalDist
+from typing import NamedTuple, cast
+
+from shapes.circle import PositionedCircle
+from shapes.containment import hit_lists
+from shapes.rectangle import PositionedRectangle
+from shapes.spatial import RTree
+
+Bounds = tuple[float, float, float, float]
+
+
+class AreaEstimate(NamedTuple):
+    """Estimated area and the half-width of its confidence interval"""
+
+    area: float
+    margin: float
+
+
+class _CoverTree:
+    """Segment tree over elementary y intervals tracking the length covered once and twice"""
+
+    def __init__(self, ys: list[float]) -> None:
+        """Initialize the tree over the intervals between consecutive sorted y coordinates"""
+        size = 1
+        while size < len(ys) - 1:
+            size *= 2
+        self.size: int = size
+        self.count: list[int] = [0] * (2 * size)
+        self.once: list[float] = [0.0] * (2 * size)
+        self.twice: list[float] = [0.0] * (2 * size)
+        self.width: list[float] = [0.0] * (2 * size)
+        for leaf in range(len(ys) - 1):
+            self.width[size + leaf] = ys[leaf + 1] - ys[leaf]
+        for node in range(size - 1, 0, -1):
+            self.width[node] = self.width[2 * node] + self.width[2 * node + 1]
+
+    def add(self, low: int, high: int, delta: int) -> None:
+        """Add delta to the cover count of the elementary intervals low to high - 1"""
+        size, count, once, twice, width = self.size, self.count, self.once, self.twice, self.width
+        low += size
+        high += size
+        first, last = low >> 1, (high - 1) >> 1
+        nodes = []
+        while low < high:
+            if low & 1:
+                count[low] += delta
+                nodes.append(low)
+                low += 1
+            if high & 1:
+                high -= 1
+                count[high] += delta
+                nodes.append(high)
+            low >>= 1
+            high >>= 1
+        # Only the ancestors of the two boundary leaves can hold an updated node below them;
+        # they are recomputed bottom-up after the updated nodes themselves
+        while first:
+            nodes.append(first)
+            if last != first:
+                nodes.append(last)
+            first >>= 1
+            last >>= 1
+        for node in nodes:
+            covers = count[node]
+            if covers >= 2:
+                once[node] = twice[node] = width[node]
+            elif node >= size:
+                once[node] = width[node] if covers else 0.0
+                twice[node] = 0.0
+            else:
+                left = node << 1
+                if covers:
+                    once[node] = width[node]
+                    twice[node] = once[left] + once[left + 1]
+                else:
+                    once[node] = once[left] + once[left + 1]
+                    twice[node] = twice[left] + twice[left + 1]
+
+    def covered(self) -> tuple[float, float]:
+        """Get the total length covered at least once and at least twice"""
+        return self.once[1], self.twice[1]
+
+
+def _bounds(rectangles: Iterable[PositionedRectangle]) -> list[Bounds]:
+    """Get the bounds of every rectangle
+    Raises:
+        TypeError: if a shape is not a PositionedRectangle
+    """
+    bounds = []
+    for rectangle in rectangles:
+        if not isinstance(rectangle, PositionedRectangle):
+            raise TypeError("Shapes must be PositionedRectangle")
+        bounds.append(rectangle.bounds())
+    return bounds
+
+
+def _sweep(boxes: list[Bounds]) -> tuple[float, float]:
+    """Sweep a vertical line across boxes, summing the lengths it cuts once and twice
+    Returns:
+        area covered by at least one box and area covered by at least two
+    """
+    boxes = [box for box in boxes if box[0] < box[2] and box[1] < box[3]]
+    if not boxes:
+        return 0.0, 0.0
+    ys = sorted({y for box in boxes for y in (box[1], box[3])})
+    index = {y: position for position, y in enumerate(ys)}
+    events = []
+    for min_x, min_y, max_x, max_y in boxes:
+        low, high = index[min_y], index[max_y]
+        events.append((min_x, 1, low, high))
+        events.append((max_x, -1, low, high))
+    events.sort()
+    tree = _CoverTree(ys)
+    once: list[float] = []
+    twice: list[float] = []
+    previous = events[0][0]
+    for x, delta, low, high in events:
+        if x != previous:
+            covered_once, covered_twice = tree.covered()
+            once.append(covered_once * (x - previous))
+            twice.append(covered_twice * (x - previous))
+            previous = x
+        tree.add(low, high, delta)
+    # Summing the strips with fsum keeps the totals correctly rounded for any n
+    return math.fsum(once), math.fsum(twice)
+
+
+def union_area(rectangles: Iterable[PositionedRectangle]) -> float:
+    """Calculate the area covered by at least one of many positioned rectangles
+    Raises:
+        TypeError: if a shape is not a PositionedRectangle
+    Note:
+        Runs in O(n log n): a vertical line sweeps the rectangle edges in x order while a
+        segment tree over the distinct y coordinates tracks the length the line cuts.
+    """
+    return _sweep(_bounds(rectangles))[0]
+
+
+def overlap_area(rectangles: Iterable[PositionedRectangle]) -> float:
+    """Calculate the area covered by at least two of many positioned rectangles
+    Raises:
+        TypeError: if a shape is not a PositionedRectangle
+    """
+    return _sweep(_bounds(rectangles))[1]
+
+
+def utilization(rectangles: Iterable[PositionedRectangle], sheet: PositionedRectangle) -> float:
+    """Calculate the fraction of a sheet covered by positioned rectangles
+    Args:
+        rectangles: parts placed on the sheet; parts hanging over its edge count only inside it
+        sheet: the stock the parts are cut from
+    Raises:
+        TypeError: if a shape is not a PositionedRectangle
+    """
+    if not isinstance(sheet, PositionedRectangle):
+        raise TypeError("Sheet must be a PositionedRectangle")
+    left, bottom, right, top = sheet.bounds()
+    clipped = [
+        (max(b[0], left), max(b[1], bottom), min(b[2], right), min(b[3], top))
+        for b in _bounds(rectangles)
+    ]
+    return _sweep(clipped)[0] / sheet.area()
+
+
+def _circles(circles: Iterable[PositionedCircle]) -> list[PositionedCircle]:
+    """Check that every shape is a positioned circle
+    Raises:
+        TypeError: if a shape is not a PositionedCircle
+    """
+    circles = list(circles)
+    if not all(isinstance(circle, PositionedCircle) for circle in circles):
+        raise TypeError("Shapes must be PositionedCircle")
+    return circles
+
+
+def _covered_arcs(
+    x: float, y: float, r: float, neighbours: Iterable[tuple[float, float, float]]
+) -> list[tuple[float, float]] | None:
+    """Get the arcs of a circle's boundary lying inside any neighbouring circle
+    Returns:
+        merged angle intervals within [0, 2 pi], or None if the whole circle is covered
+    """
+    intervals = []
+    for nx, ny, nr in neighbours:
+        d = math.hypot(nx - x, ny - y)
+        if d >= r + nr or d + nr <= r:
+            continue
+        if d + r <= nr:
+            return None
+        # The neighbour covers the arc centered on its direction, out to where they cross
+        middle = math.atan2(ny - y, nx - x) % math.tau
+        half = math.acos(max(-1.0, min(1.0, (r * r + d * d - nr * nr) / (2 * r * d))))
+        start, end = middle - half, middle + half
+        if start < 0:
+            intervals += [(start + math.tau, math.tau), (0.0, end)]
+        elif end > math.tau:
+            intervals += [(start, math.tau), (0.0, end - math.tau)]
+        else:
+            intervals.append((start, end))
+    intervals.sort()
+    merged: list[tuple[float, float]] = []
+    for start, end in intervals:
+        if merged and start <= merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def circle_union_area(circles: Iterable[PositionedCircle]) -> float:
+    """Calculate the exact area covered by at least one of many positioned circles
+    Raises:
+        TypeError: if a shape is not a PositionedCircle
+    Note:
+        By Green's theorem the area is half the integral of x dy - y dx around the boundary
+        of the union, which is made of the arcs of each circle not inside any other circle.
+        An RTree limits the circles checked against each one to those its box touches.
+    """
+    circles = _circles(circles)
+    tree = RTree.from_entries((circle.bounds(), index) for index, circle in enumerate(circles))
+    params = [(*circle.center(), circle.radius()) for circle in circles]
+    terms = []
+    for index, (x, y, r) in enumerate(params):
+        others = cast(list[int], tree.window(*circles[index].bounds()))
+        # Of several identical circles only the first contributes its boundary
+        if any(other < index and params[other] == (x, y, r) for other in others):
+            continue
+        neighbours = [params[other] for other in others if params[other] != (x, y, r)]
+        arcs = _covered_arcs(x, y, r, neighbours)
+        if arcs is None:
+            continue
+        if not arcs:
+            terms.append(math.pi * r * r)
+            continue
+        # Walk the free arcs between the covered ones, wrapping around past 2 pi
+        ends = [end for _, end in arcs]
+        starts = [start for start, _ in arcs[1:]] + [arcs[0][0] + math.tau]
+        for start, end in zip(ends, starts):
+            terms.append(
+                0.5
+                * (
+                    r * r * (end - start)
+                    + x * r * (math.sin(end) - math.sin(start))
+                    - y * r * (math.cos(end) - math.cos(start))
+                )
+            )
+    return math.fsum(terms)
+
+
+def estimate_circle_union_area(
+    circles: Iterable[PositionedCircle],
+    samples: int = 100_000,
+    confidence: float = 0.95,
+    seed: int | None = None,
+) -> AreaEstimate:
+    """Estimate the area covered by many positioned circles by Monte Carlo sampling
+    Args:
+        circles: the circles
+        samples: number of random points drawn
+        confidence: probability that the true area lies within the reported margin
+        seed: seed for the random points
+    Returns:
+        the estimated area and the half-width of its confidence interval
+    Raises:
+        TypeError: if a shape is not a PositionedCircle
+        ValueError: if samples is not positive or confidence is not between 0 and 1
+    Note:
+        Each point is drawn uniformly from a circle picked with probability proportional to
+        its area, and weighted by one over the number of circles covering it. The weights lie
+        in (0, 1], so the error bound holds however sparse or dense the circles are.
+    """
+    if samples <= 0:
+        raise ValueError("Samples must be positive")
+    if not 0 < confidence < 1:
+        raise ValueError("Confidence must be between 0 and 1")
+    circles = _circles(circles)
+    if not circles:
+        return AreaEstimate(0.0, 0.0)
+    rng = random.Random(seed)
+    areas = [circle.area() for circle in circles]
+    total = math.fsum(areas)
+    picks = rng.choices(range(len(circles)), cum_weights=list(accumulate(areas)), k=samples)
+    xs, ys = [], []
+    for pick in picks:
+        (cx, cy), r = circles[pick].center(), circles[pick].radius()
+        distance = r * math.sqrt(rng.random())
+        angle = rng.uniform(0, math.tau)
+        xs.append(cx + distance * math.cos(angle))
+        ys.append(cy + distance * math.sin(angle))
+    weights = [1 / max(len(hits), 1) for hits in hit_lists(circles, xs, ys)]
+    mean = math.fsum(weights) / samples
+    variance = math.fsum((w - mean) ** 2 for w in weights) / max(samples - 1, 1)
+    z = NormalDist().inv_cdf(0.5 + confidence / 2)
+    return AreaEstimate(total * mean, z * total * math.sqrt(variance / samples))
@@ -0,0 +1,172 @@
+"""Tests for the Coverage module"""
+
+import math
+import random
+
+import pytest
+
+from shapes.circle import PositionedCircle
+from shapes.coverage import (
+    AreaEstimate,
+    circle_union_area,
+    estimate_circle_union_area,
+    overlap_area,
+    union_area,
+    utilization,
+)
+from shapes.rectangle import PositionedRectangle
+
+
+def cell_counts(rectangles):
+    """Count the rectangles covering every unit cell of integer rectangles"""
+    counts = {}
+    for rectangle in rectangles:
+        min_x, min_y, max_x, max_y = map(int, rectangle.bounds())
+        for x in range(min_x, max_x):
+            for y in range(min_y, max_y):
+                counts[x, y] = counts.get((x, y), 0) + 1
+    return counts
+
+
+class TestRectangleCoverage:
+    """Test union and overlap areas of positioned rectangles"""
+
+    def test_disjoint(self):
+        """Test that disjoint rectangles add up"""
+        rectangles = [PositionedRectangle(2, 3, 0, 0), PositionedRectangle(1, 1, 5, 5)]
+        assert union_area(rectangles) == 7
+        assert overlap_area(rectangles) == 0
+
+    def test_overlapping(self):
+        """Test two rectangles sharing a 1 by 1 corner"""
+        rectangles = [PositionedRectangle(2, 2, 0, 0), PositionedRectangle(2, 2, 1, 1)]
+        assert union_area(rectangles) == 7
+        assert overlap_area(rectangles) == 1
+
+    def test_nested_and_touching(self):
+        """Test nested rectangles and rectangles that only share an edge"""
+        rectangles = [
+            PositionedRectangle(4, 4, 0, 0),
+            PositionedRectangle(1, 1, 1, 1),
+            PositionedRectangle(1, 1, 1, 1),
+            PositionedRectangle(2, 4, 4, 0),
+        ]
+        assert union_area(rectangles) == 24
+        assert overlap_area(rectangles) == 1
+
+    def test_matches_unit_cells(self):
+        """Test random integer rectangles against counting covered unit cells"""
+        rng = random.Random(1)
+        rectangles = [
+            PositionedRectangle(
+                rng.randint(1, 8), rng.randint(1, 8), rng.randint(0, 30), rng.randint(0, 30)
+            )
+            for _ in range(200)
+        ]
+        counts = cell_counts(rectangles)
+        assert union_area(rectangles) == len(counts)
+        assert overlap_area(rectangles) == sum(1 for count in counts.values() if count >= 2)
+
+    def test_exact_sum(self):
+        """Test that many tiny disjoint strips sum without rounding drift"""
+        rectangles = [PositionedRectangle(0.1, 1, 0.1 * index, 0) for index in range(1000)]
+        assert union_area(rectangles) == pytest.approx(100, rel=1e-12)
+
+    def test_empty(self):
+        """Test that no rectangles cover nothing"""
+        assert union_area([]) == 0
+        assert overlap_area([]) == 0
+
+    def test_utilization(self):
+        """Test the covered fraction of a sheet, clipping parts at its edge"""
+        sheet = PositionedRectangle(10, 10, 0, 0)
+        parts = [PositionedRectangle(5, 10, 0, 0), PositionedRectangle(5, 5, 8, 0)]
+        assert utilization(parts, sheet) == pytest.approx(0.6)
+
+    def test_invalid(self):
+        """Test that shapes other than positioned rectangles raise TypeError"""
+        with pytest.raises(TypeError):
+            union_area([PositionedCircle(1)])
+        with pytest.raises(TypeError):
+            utilization([], PositionedCircle(1))
+
+
+def lens(r, d):
+    """Area shared by two circles of radius r whose centers are d apart"""
+    return 2 * r * r * math.acos(d / (2 * r)) - d / 2 * math.sqrt(4 * r * r - d * d)
+
+
+class TestCircleCoverage:
+    """Test exact and estimated union areas of positioned circles"""
+
+    def test_single_and_disjoint(self):
+        """Test that disjoint and tangent circles add up"""
+        circles = [PositionedCircle(1, 0, 0), PositionedCircle(1, 2, 0), PositionedCircle(2, 10, 0)]
+        assert circle_union_area(circles) == pytest.approx(6 * math.pi)
+
+    def test_two_overlapping(self):
+        """Test two overlapping circles against the lens formula"""
+        circles = [PositionedCircle(1, 0, 0), PositionedCircle(1, 1, 0)]
+        assert circle_union_area(circles) == pytest.approx(2 * math.pi - lens(1, 1))
+
+    def test_nested_and_identical(self):
+        """Test that nested and repeated circles count once"""
+        circles = [PositionedCircle(2, 0, 0), PositionedCircle(1, 0.5, 0)] + [
+            PositionedCircle(1, 5, 5)
+        ] * 3
+        assert circle_union_area(circles) == pytest.approx(5 * math.pi)
+
+    def test_covered_by_several(self):
+        """Test a circle covered only by the union of its neighbours"""
+        ring = [PositionedCircle(1, math.cos(t), math.sin(t)) for t in (0, 2.1, 4.2)]
+        inner = PositionedCircle(0.2, 0, 0)
+        assert circle_union_area(ring + [inner]) == pytest.approx(circle_union_area(ring))
+
+    def test_matches_grid(self):
+        """Test random circles against counting covered points on a fine grid"""
+        rng = random.Random(2)
+        circles = [
+            PositionedCircle(rng.uniform(0.5, 2), rng.uniform(0, 8), rng.uniform(0, 8))
+            for _ in range(15)
+        ]
+        step = 0.04
+        covered = sum(
+            any(c.contains_point(x * step, y * step) for c in circles)
+            for x in range(-75, 276)
+            for y in range(-75, 276)
+        )
+        assert circle_union_area(circles) == pytest.approx(covered * step * step, rel=0.02)
+
+    def test_estimate(self):
+        """Test that the estimate lies within a few margins of the exact area"""
+        rng = random.Random(3)
+        circles = [
+            PositionedCircle(rng.uniform(0.5, 2), rng.uniform(0, 20), rng.uniform(0, 20))
+            for _ in range(100)
+        ]
+        exact = circle_union_area(circles)
+        estimate = estimate_circle_union_area(circles, samples=20000, seed=1)
+        assert isinstance(estimate, AreaEstimate)
+        assert abs(estimate.area - exact) < 3 * estimate.margin
+        assert estimate.margin < 0.05 * exact
+
+    def test_estimate_disjoint_is_exact(self):
+        """Test that disjoint circles are estimated without error"""
+        circles = [PositionedCircle(1, 0, 0), PositionedCircle(2, 10, 0)]
+        estimate = estimate_circle_union_area(circles, samples=1000, seed=1)
+        assert estimate.area == pytest.approx(5 * math.pi)
+        assert estimate.margin == pytest.approx(0, abs=1e-9)
+
+    def test_empty(self):
+        """Test that no circles cover nothing"""
+        assert circle_union_area([]) == 0
+        assert estimate_circle_union_area([]) == AreaEstimate(0.0, 0.0)
+
+    def test_invalid(self):
+        """Test invalid shapes and estimator arguments"""
+        with pytest.raises(TypeError):
+            circle_union_area([PositionedRectangle(1, 1)])
+        with pytest.raises(ValueError):
+            estimate_circle_union_area([PositionedCircle(1)], samples=0)
+        with pytest.raises(ValueError):
+            estimate_circle_union_area([PositionedCircle(1)], confidence=1)
@@ -0,0 +1,5 @@
+"""Enclosing module"""
+
+from .enclosing import Pose, bounding_rectangle, enclosing_circle
+
+__all__ = ["Pose", "bounding_rectangle", "enclosing_circle"]
@@ -0,0 +1,282 @@
+"""Module to find the smallest shapes enclosing large point sets"""
+
+import math
+import random
+from array import array
+from collections.abc import Iterable, Sequence
+from typing import NamedTuple
+
+from shapes.circle import PositionedCircle
+from shapes.rectangle import Rectangle
+
+# Relative slack on the squared radius, so points on the circle are not re-fitted forever
+# because of rounding
+_EPSILON = 1e-12
+
+
+class Pose(NamedTuple):
+    """Center of a rectangle and the angle, in radians in [0, pi / 2), of its width side"""
+
+    x: float
+    y: float
+    angle: float
+
+
+def _coordinates(
+    xs: Iterable[float] | Iterable[Sequence[float]], ys: Iterable[float] | None
+) -> tuple[array, array]:
+    """Read a point source into coordinate buffers
+    Raises:
+        ValueError: if the buffers differ in length
+    """
+    if ys is None:
+        x_buffer, y_buffer = array("d"), array("d")
+        for x, y in xs:  # type: ignore[misc]
+            x_buffer.append(x)
+            y_buffer.append(y)
+        return x_buffer, y_buffer
+    x_buffer, y_buffer = array("d", xs), array("d", ys)  # type: ignore[arg-type]
+    if len(x_buffer) != len(y_buffer):
+        raise ValueError("Coordinate buffers must have the same length")
+    return x_buffer, y_buffer
+
+
+def _circumcircle(
+    ax: float, ay: float, bx: float, by: float, cx: float, cy: float
+) -> tuple[float, float, float]:
+    """Get the center and squared radius of the circle through three points"""
+    bx, by, cx, cy = bx - ax, by - ay, cx - ax, cy - ay
+    d = 2 * (bx * cy - by * cx)
+    if d == 0:
+        # Collinear points: the circle on the two farthest apart as diameter
+        pairs = [((0.0, 0.0), (bx, by)), ((0.0, 0.0), (cx, cy)), ((bx, by), (cx, cy))]
+        (px, py), (qx, qy) = max(pairs, key=lambda pair: math.dist(*pair))
+        ux, uy = (px + qx) / 2, (py + qy) / 2
+        return (ax + ux, ay + uy, (px - ux) ** 2 + (py - uy) ** 2)
+    b2, c2 = bx * bx + by * by, cx * cx + cy * cy
+    ux = (cy * b2 - by * c2) / d
+    uy = (bx * c2 - cx * b2) / d
+    return (ax + ux, ay + uy, ux * ux + uy * uy)
+
+
+def _welzl(px: list[float], py: list[float]) -> tuple[float, float, float]:
+    """Welzl's algorithm, iteratively, over points already in random order
+    Returns:
+        center and squared radius of the smallest circle enclosing the points
+    """
+    cx, cy, r2 = px[0], py[0], 0.0
+    for i in range(1, len(px)):
+        x, y = px[i], py[i]
+        if (x - cx) ** 2 + (y - cy) ** 2 <= r2 * (1 + _EPSILON):
+            continue
+        # Point i lies on the circle of the first i + 1 points
+        cx, cy, r2 = x, y, 0.0
+        for j in range(i):
+            xj, yj = px[j], py[j]
+            if (xj - cx) ** 2 + (yj - cy) ** 2 <= r2 * (1 + _EPSILON):
+                continue
+            # Points i and j both lie on the circle of the first j + 1 points and point i
+            cx, cy = (x + xj) / 2, (y + yj) / 2
+            r2 = (x - cx) ** 2 + (y - cy) ** 2
+            for k in range(j):
+                xk, yk = px[k], py[k]
+                if (xk - cx) ** 2 + (yk - cy) ** 2 > r2 * (1 + _EPSILON):
+                    cx, cy, r2 = _circumcircle(x, y, xj, yj, xk, yk)
+    return cx, cy, r2
+
+
+def enclosing_circle(
+    xs: Iterable[float] | Iterable[Sequence[float]],
+    ys: Iterable[float] | None = None,
+    seed: int | None = None,
+) -> PositionedCircle:
+    """Find the smallest circle enclosing a set of points
+    Args:
+        xs: x coordinates, or an iterable of (x, y) points when ys is omitted; generators are
+            read once into coordinate buffers
+        ys: y coordinates
+        seed: seed for the random point order, for reproducible runs
+    Returns:
+        a PositionedCircle whose center() is the center of the enclosing circle
+    Raises:
+        ValueError: if there are fewer than two distinct points or the buffers differ in length
+    Note:
+        Welzl's randomized algorithm runs on a working set that starts with the extreme points.
+        Each pass over the buffers adds the points left outside the current circle, until none
+        are; the result then encloses every point and is the smallest circle for a subset, so
+        it is the smallest circle for all of them. Only the few points near the boundary are
+        ever shuffled and refitted, and each pass is a tight scan of the buffers.
+    """
+    px, py = _coordinates(xs, ys)
+    if not px:
+        raise ValueError("Enclosing circle requires at least two distinct points")
+    rng = random.Random(seed)
+    working = {px.index(min(px)), px.index(max(px)), py.index(min(py)), py.index(max(py))}
+    while True:
+        order = list(working)
+        rng.shuffle(order)
+        cx, cy, r2 = _welzl([px[i] for i in order], [py[i] for i in order])
+        limit = r2 * (1 + _EPSILON)
+        outside = [
+            index
+            for index, (x, y) in enumerate(zip(px, py))
+            if (x - cx) * (x - cx) + (y - cy) * (y - cy) > limit
+        ]
+        if not outside:
+            break
+        working.update(outside)
+    if r2 <= 0:
+        raise ValueError("Enclosing circle requires at least two distinct points")
+    return PositionedCircle(math.sqrt(r2), cx, cy)
+
+
+def _extent(
+    xs: Iterable[float] | Iterable[Sequence[float]], ys: Iterable[float] | None
+) -> tuple[float, float, float, float]:
+    """Get the bounds of a point source in a single pass, without storing the points
+    Raises:
+        ValueError: if the buffers differ in length or there are no points
+    """
+    if ys is not None:
+        px, py = _coordinates(xs, ys)
+        if not px:
+            raise ValueError("Bounding rectangle requires points")
+        return (min(px), min(py), max(px), max(py))
+    min_x = min_y = math.inf
+    max_x = max_y = -math.inf
+    for x, y in xs:  # type: ignore[misc]
+        if x < min_x:
+            min_x = x
+        if x > max_x:
+            max_x = x
+        if y < min_y:
+            min_y = y
+        if y > max_y:
+            max_y = y
+    if min_x > max_x:
+        raise ValueError("Bounding rectangle requires points")
+    return (min_x, min_y, max_x, max_y)
+
+
+def _hull(px: array, py: array) -> list[tuple[float, float]]:
+    """Get the convex hull counterclockwise, without collinear points, by Andrew's monotone chain"""
+    if not px:
+        return []
+    # Akl-Toussaint heuristic: points strictly inside the quadrilateral of the extreme points
+    # cannot be on the hull, and dropping them leaves far fewer points to sort
+    corners = [
+        (px[index], py[index])
+        for index in (px.index(min(px)), py.index(min(py)), px.index(max(px)), py.index(max(py)))
+    ]
+    (x1, y1), (x2, y2), (x3, y3), (x4, y4) = corners
+    points = sorted(
+        set(corners).union(
+            (x, y)
+            for x, y in zip(px, py)
+            if not (
+                (x2 - x1) * (y - y1) > (y2 - y1) * (x - x1)
+                and (x3 - x2) * (y - y2) > (y3 - y2) * (x - x2)
+                and (x4 - x3) * (y - y3) > (y4 - y3) * (x - x3)
+                and (x1 - x4) * (y - y4) > (y1 - y4) * (x - x4)
+            )
+        )
+    )
+    if len(points) < 3:
+        return points
+
+    def chain(ordered: Iterable[tuple[float, float]]) -> list[tuple[float, float]]:
+        stack: list[tuple[float, float]] = []
+        for x, y in ordered:
+            while len(stack) >= 2:
+                (ox, oy), (ax, ay) = stack[-2], stack[-1]
+                if (ax - ox) * (y - oy) - (ay - oy) * (x - ox) > 0:
+                    break
+                stack.pop()
+            stack.append((x, y))
+        return stack
+
+    lower, upper = chain(points), chain(reversed(points))
+    return lower[:-1] + upper[:-1]
+
+
+def _calipers(hull: list[tuple[float, float]]) -> tuple[float, float, Pose]:
+    """Find the minimum-area rectangle with a side on a hull edge by rotating calipers
+    Returns:
+        width along the chosen edge, height across it, and the pose of the rectangle
+    """
+    count = len(hull)
+    best: tuple[float, float, Pose] | None = None
+    right = top = left = 0
+    for i in range(count):
+        x1, y1 = hull[i]
+        x2, y2 = hull[(i + 1) % count]
+        length = math.hypot(x2 - x1, y2 - y1)
+        ux, uy = (x2 - x1) / length, (y2 - y1) / length
+
+        def along(index: int) -> float:
+            return (hull[index % count][0] - x1) * ux + (hull[index % count][1] - y1) * uy
+
+        def across(index: int) -> float:
+            return (hull[index % count][1] - y1) * ux - (hull[index % count][0] - x1) * uy
+
+        # Every caliper only moves forward around the hull as the edge turns, so the whole
+        # rotation visits each vertex a constant number of times
+        if i == 0:
+            right = max(range(count), key=along)
+            top = max(range(count), key=across)
+            left = min(range(count), key=along)
+        steps = 0
+        while along(right + 1) >= along(right) and steps < count:
+            right, steps = (right + 1) % count, steps + 1
+        steps = 0
+        while across(top + 1) >= across(top) and steps < count:
+            top, steps = (top + 1) % count, steps + 1
+        steps = 0
+        while along(left + 1) <= along(left) and steps < count:
+            left, steps = (left + 1) % count, steps + 1
+        low, high, height = along(left), along(right), across(top)
+        width = high - low
+        if best is None or width * height < best[0] * best[1]:
+            middle, half = (low + high) / 2, height / 2
+            center_x = x1 + middle * ux - half * uy
+            center_y = y1 + middle * uy + half * ux
+            best = (width, height, Pose(center_x, center_y, math.atan2(uy, ux)))
+    return best  # type: ignore[return-value]
+
+
+def bounding_rectangle(
+    xs: Iterable[float] | Iterable[Sequence[float]],
+    ys: Iterable[float] | None = None,
+    oriented: bool = True,
+) -> tuple[Rectangle, Pose]:
+    """Find the smallest-area rectangle enclosing a set of points
+    Args:
+        xs: x coordinates, or an iterable of (x, y) points when ys is omitted
+        ys: y coordinates
+        oriented: allow any rotation; otherwise the rectangle is axis-aligned and found in a
+            single pass without storing the points
+    Returns:
+        the Rectangle and its Pose; width lies along the pose angle, height across it
+    Raises:
+        ValueError: if the points do not span an area or the buffers differ in length
+    Note:
+        The oriented rectangle has a side on an edge of the convex hull, found in
+        O(n log n) with Andrew's monotone chain, and the edges are scanned with rotating
+        calipers in time linear in the size of the hull.
+    """
+    if not oriented:
+        min_x, min_y, max_x, max_y = _extent(xs, ys)
+        if min_x == max_x or min_y == max_y:
+            raise ValueError("Points must not be collinear")
+        pose = Pose((min_x + max_x) / 2, (min_y + max_y) / 2, 0.0)
+        return Rectangle(max_x - min_x, max_y - min_y), pose
+    hull = _hull(*_coordinates(xs, ys))
+    if len(hull) < 3:
+        raise ValueError("Points must not be collinear")
+    width, height, pose = _calipers(hull)
+    # Report the angle of whichever side lies in [0, pi / 2)
+    angle = pose.angle % math.pi
+    if angle >= math.pi / 2:
+        angle -= math.pi / 2
+        width, height = height, width
+    return Rectangle(width, height), Pose(pose.x, pose.y, angle)
@@ -0,0 +1 @@
+"""Tests for Enclosing package"""
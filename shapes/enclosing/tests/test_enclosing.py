@@ -0,0 +1,202 @@
+"""Tests for the Enclosing module"""
+
+import math
+import random
+from array import array
+
+import pytest
+
+from shapes.circle import PositionedCircle
+from shapes.enclosing import Pose, bounding_rectangle, enclosing_circle
+from shapes.rectangle import Rectangle
+
+
+def brute_force(points):
+    """Smallest enclosing circle by trying every circle through two or three points"""
+    best = None
+    for i, p in enumerate(points):
+        for j, q in enumerate(points[i + 1 :], i + 1):
+            candidates = [((p[0] + q[0]) / 2, (p[1] + q[1]) / 2)]
+            for r in points[j + 1 :]:
+                d = 2 * (p[0] * (q[1] - r[1]) + q[0] * (r[1] - p[1]) + r[0] * (p[1] - q[1]))
+                if d:
+                    ux = sum(
+                        (a[0] ** 2 + a[1] ** 2) * (b[1] - c[1])
+                        for a, b, c in ((p, q, r), (q, r, p), (r, p, q))
+                    )
+                    uy = sum(
+                        (a[0] ** 2 + a[1] ** 2) * (c[0] - b[0])
+                        for a, b, c in ((p, q, r), (q, r, p), (r, p, q))
+                    )
+                    candidates.append((ux / d, uy / d))
+            for center in candidates:
+                radius = max(math.dist(center, point) for point in points)
+                if best is None or radius < best:
+                    best = radius
+    return best
+
+
+class TestEnclosingCircle:
+    """Test the smallest enclosing circle"""
+
+    def test_two_points(self):
+        """Test that two points span a diameter"""
+        circle = enclosing_circle([(0, 0), (4, 0)])
+        assert isinstance(circle, PositionedCircle)
+        assert circle.radius() == 2
+        assert circle.center() == (2, 0)
+
+    def test_right_triangle(self):
+        """Test that a right triangle's hypotenuse is the diameter"""
+        circle = enclosing_circle([(0, 0), (6, 0), (0, 8), (1, 1)])
+        assert circle.radius() == pytest.approx(5)
+        assert circle.center() == pytest.approx((3, 4))
+
+    def test_equilateral_triangle(self):
+        """Test that an acute triangle gets its circumcircle"""
+        points = [(0, 0), (2, 0), (1, math.sqrt(3))]
+        circle = enclosing_circle(points)
+        assert circle.radius() == pytest.approx(2 / math.sqrt(3))
+
+    def test_matches_brute_force(self):
+        """Test random point sets against the brute force answer"""
+        rng = random.Random(1)
+        for _ in range(20):
+            points = [(rng.uniform(-5, 5), rng.uniform(-5, 5)) for _ in range(12)]
+            circle = enclosing_circle(points, seed=rng.random())
+            assert circle.radius() == pytest.approx(brute_force(points))
+
+    def test_encloses_every_point(self):
+        """Test that a large cloud lies inside the circle"""
+        rng = random.Random(2)
+        xs = array("d", [rng.gauss(0, 1) for _ in range(20000)])
+        ys = array("d", [rng.gauss(0, 3) for _ in range(20000)])
+        circle = enclosing_circle(xs, ys, seed=1)
+        assert max(circle.distance_to(x, y) for x, y in zip(xs, ys)) == 0
+        assert sum(circle.contains_point(x, y) for x, y in zip(xs, ys)) == len(xs)
+
+    def test_points_on_a_circle(self):
+        """Test points lying exactly on a circle"""
+        points = [(math.cos(t / 10), math.sin(t / 10)) for t in range(63)]
+        circle = enclosing_circle(iter(points))
+        assert circle.radius() == pytest.approx(1)
+        assert circle.center() == pytest.approx((0, 0), abs=1e-12)
+
+    def test_collinear_and_duplicate_points(self):
+        """Test collinear and repeated points"""
+        circle = enclosing_circle([(0, 0), (1, 1), (3, 3), (1, 1), (3, 3)])
+        assert circle.radius() == pytest.approx(math.sqrt(18) / 2)
+        assert circle.center() == pytest.approx((1.5, 1.5))
+
+    def test_seed_is_reproducible(self):
+        """Test that the same seed gives the same circle"""
+        rng = random.Random(3)
+        points = [(rng.random(), rng.random()) for _ in range(1000)]
+        assert enclosing_circle(points, seed=7) == enclosing_circle(points, seed=7)
+
+    def test_degenerate(self):
+        """Test that fewer than two distinct points raise ValueError"""
+        with pytest.raises(ValueError):
+            enclosing_circle([])
+        with pytest.raises(ValueError):
+            enclosing_circle([(1, 1), (1, 1)])
+        with pytest.raises(ValueError):
+            enclosing_circle([0, 1], [0])
+
+
+def brute_force_area(points):
+    """Smallest oriented rectangle area by projecting every point on every pair direction"""
+    best = math.inf
+    for p in points:
+        for q in points:
+            if p == q:
+                continue
+            angle = math.atan2(q[1] - p[1], q[0] - p[0])
+            ux, uy = math.cos(angle), math.sin(angle)
+            along = [x * ux + y * uy for x, y in points]
+            across = [y * ux - x * uy for x, y in points]
+            best = min(best, (max(along) - min(along)) * (max(across) - min(across)))
+    return best
+
+
+def inside(rectangle, pose, x, y):
+    """Check that a point lies inside a posed rectangle, allowing for rounding"""
+    ux, uy = math.cos(pose.angle), math.sin(pose.angle)
+    dx, dy = x - pose.x, y - pose.y
+    return (
+        abs(dx * ux + dy * uy) <= rectangle.width() / 2 + 1e-9
+        and abs(dy * ux - dx * uy) <= rectangle.height() / 2 + 1e-9
+    )
+
+
+class TestBoundingRectangle:
+    """Test the smallest bounding rectangle"""
+
+    def test_axis_aligned(self):
+        """Test the axis-aligned box of a few points"""
+        rectangle, pose = bounding_rectangle([(1, 1), (4, 2), (2, 6)], oriented=False)
+        assert isinstance(rectangle, Rectangle)
+        assert (rectangle.width(), rectangle.height()) == (3, 5)
+        assert pose == Pose(2.5, 3.5, 0.0)
+
+    def test_axis_aligned_buffers(self):
+        """Test the axis-aligned box from coordinate buffers"""
+        rectangle, pose = bounding_rectangle([0, 2, 1], [0, 1, 3], oriented=False)
+        assert (rectangle.width(), rectangle.height()) == (2, 3)
+        assert (pose.x, pose.y) == (1, 1.5)
+
+    def test_rotated_rectangle(self):
+        """Test that the corners of a rotated rectangle give back the rectangle"""
+        angle = 0.3
+        cos, sin = math.cos(angle), math.sin(angle)
+        corners = [(x * cos - y * sin + 5, x * sin + y * cos - 2) for x in (0, 4) for y in (0, 1)]
+        rectangle, pose = bounding_rectangle(corners + [(5.5, -1.5)])
+        assert rectangle.area() == pytest.approx(4)
+        assert pose.angle == pytest.approx(angle)
+        assert (rectangle.width(), rectangle.height()) == pytest.approx((4, 1))
+
+    def test_angle_range(self):
+        """Test that the angle is normalized to [0, pi / 2) by swapping the sides"""
+        angle = 2.0
+        cos, sin = math.cos(angle), math.sin(angle)
+        corners = [(x * cos - y * sin, x * sin + y * cos) for x in (0, 4) for y in (0, 1)]
+        rectangle, pose = bounding_rectangle(corners)
+        assert pose.angle == pytest.approx(angle - math.pi / 2)
+        assert (rectangle.width(), rectangle.height()) == pytest.approx((1, 4))
+
+    def test_matches_brute_force(self):
+        """Test random point sets against the brute force area and containment"""
+        rng = random.Random(4)
+        for _ in range(10):
+            points = [(rng.uniform(-5, 5), rng.uniform(-2, 2)) for _ in range(15)]
+            rectangle, pose = bounding_rectangle(points)
+            assert rectangle.area() == pytest.approx(brute_force_area(points))
+            assert all(inside(rectangle, pose, x, y) for x, y in points)
+            aligned, _ = bounding_rectangle(points, oriented=False)
+            assert rectangle.area() <= aligned.area() + 1e-9
+
+    def test_large_cloud(self):
+        """Test that every point of a large cloud lies inside the rectangle"""
+        rng = random.Random(5)
+        xs = [rng.gauss(0, 1) for _ in range(20000)]
+        ys = [0.5 * x + rng.gauss(0, 0.2) for x in xs]
+        rectangle, pose = bounding_rectangle(xs, ys)
+        assert all(inside(rectangle, pose, x, y) for x, y in zip(xs, ys))
+        assert pose.angle == pytest.approx(math.atan(0.5), abs=0.1)
+
+    def test_streaming(self):
+        """Test that generators are accepted for both modes"""
+        points = [(0, 0), (3, 0), (3, 2), (0, 2)]
+        assert bounding_rectangle(iter(points))[0].area() == pytest.approx(6)
+        assert bounding_rectangle(iter(points), oriented=False)[0].area() == 6
+
+    def test_degenerate(self):
+        """Test that points spanning no area raise ValueError"""
+        with pytest.raises(ValueError):
+            bounding_rectangle([(0, 0), (1, 1), (2, 2)])
+        with pytest.raises(ValueError):
+            bounding_rectangle([(0, 0), (0, 1)], oriented=False)
+        with pytest.raises(ValueError):
+            bounding_rectangle([], oriented=False)
+        with pytest.raises(ValueError):
+            bounding_rectangle([])
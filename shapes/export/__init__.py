@@ -0,0 +1,5 @@
+"""Export module"""
+
+from .export import MetricWriter, read_binary
+
+__all__ = ["MetricWriter", "read_binary"]
@@ -0,0 +1,216 @@
+"""Module to stream shape metrics to CSV, JSON Lines or a packed binary format"""
+
+import math
+import struct
+import sys
+from array import array
+from collections.abc import Iterable, Iterator, Sequence
+from typing import BinaryIO
+
+from shapes.frame import ShapeFrame
+
+# Output formats understood by MetricWriter
+_FORMATS: tuple[str, ...] = ("csv", "jsonl", "binary")
+
+# First bytes of a binary metric file, including the format version
+_MAGIC = b"SHPM\x01"
+
+# Little-endian row count that starts each chunk of a binary metric file
+_CHUNK = struct.Struct("<Q")
+
+# Little-endian length of a metric name in the header of a binary metric file
+_NAME = struct.Struct("<H")
+
+# Size in bytes of one metric value
+_ITEM_SIZE = array("d").itemsize
+
+
+def _frames(source: object, chunk_size: int) -> Iterator[ShapeFrame]:
+    """Split a shape, a ShapeFrame, or an iterable of both into frames to evaluate"""
+    if isinstance(source, ShapeFrame):
+        yield source
+        return
+    if not isinstance(source, Iterable):
+        source = (source,)
+    pending = ShapeFrame()
+    for item in source:
+        if isinstance(item, ShapeFrame):
+            if pending:
+                yield pending
+                pending = ShapeFrame()
+            yield item
+            continue
+        pending.append(item)
+        if len(pending) >= chunk_size:
+            yield pending
+            pending = ShapeFrame()
+    if pending:
+        yield pending
+
+
+def _read_exact(file: BinaryIO, size: int) -> bytes:
+    """Read exactly size bytes from a binary metric file
+    Raises:
+        ValueError: if the file ends first
+    """
+    data = file.read(size)
+    if len(data) != size:
+        raise ValueError("Binary metric file is truncated")
+    return data
+
+
+def _json_number(value: float) -> str:
+    """Format a double the way the json module does, including non-finite values"""
+    if math.isnan(value):
+        return "NaN"
+    if math.isinf(value):
+        return "Infinity" if value > 0 else "-Infinity"
+    return float.__repr__(value)
+
+
+def _little_endian(values: array) -> bytes:
+    """Get the bytes of an array of doubles in little-endian order"""
+    if sys.byteorder == "little":
+        return values.tobytes()
+    swapped = array("d", values)
+    swapped.byteswap()
+    return swapped.tobytes()
+
+
+class MetricWriter:
+    """Writer that streams metric columns of shapes to a binary file in buffered chunks"""
+
+    def __init__(
+        self,
+        file: BinaryIO,
+        metrics: Sequence[str],
+        format: str = "csv",
+        chunk_size: int = 65536,
+    ) -> None:
+        """Initialize the MetricWriter and write the header
+        Args:
+            file: file opened in binary mode; CSV and JSON Lines are written as ASCII
+            metrics: names of no-argument shape methods, one output column each
+            format: "csv", "jsonl" or "binary"
+            chunk_size: number of rows formatted and written per call to file.write
+        Raises:
+            ValueError: if the format is unknown, chunk_size is not positive, or the metrics
+                are empty, repeated or not ASCII method names
+        Note:
+            The binary format is the magic bytes b"SHPM\\x01", the number of metrics and each
+            UTF-8 name, each prefixed with a little-endian uint16, then chunks of a uint64 row
+            count followed by that many little-endian doubles for each metric in turn.
+        """
+        if format not in _FORMATS:
+            raise ValueError(f"Unknown format '{format}'; formats are {_FORMATS}")
+        if chunk_size <= 0:
+            raise ValueError("Chunk size must be positive")
+        metrics = tuple(metrics)
+        if not metrics:
+            raise ValueError("At least one metric is required")
+        if len(set(metrics)) != len(metrics):
+            raise ValueError("Metrics must not repeat")
+        if not all(metric.isascii() and metric.isidentifier() for metric in metrics):
+            raise ValueError("Metrics must be ASCII method names")
+        self._file: BinaryIO = file
+        self._metrics: tuple[str, ...] = metrics
+        self._format: str = format
+        self._chunk_size: int = chunk_size
+        self._rows: int = 0
+        if format == "csv":
+            file.write((",".join(metrics) + "\n").encode("ascii"))
+        elif format == "jsonl":
+            # One template per row; the values are the only parts formatted per row
+            template = ", ".join(f'"{metric}": %s' for metric in metrics)
+            self._template: str = "{" + template + "}\n"
+        else:
+            header = bytearray(_MAGIC)
+            header += _NAME.pack(len(metrics))
+            for metric in metrics:
+                name = metric.encode("utf-8")
+                header += _NAME.pack(len(name)) + name
+            file.write(header)
+
+    def metrics(self) -> tuple[str, ...]:
+        """Get the names of the metrics written for every row"""
+        return self._metrics
+
+    def rows(self) -> int:
+        """Get the number of rows written so far"""
+        return self._rows
+
+    def write(self, source: object) -> int:
+        """Evaluate the metrics for shapes and write one row per shape
+        Args:
+            source: a shape, a ShapeFrame, or an iterable of shapes and ShapeFrames
+        Returns:
+            number of rows written by this call
+        Raises:
+            ValueError: if a metric is undefined for a shape type in the source
+            TypeError: if the source holds unsupported objects
+        Note:
+            Loose shapes are gathered into frames of chunk_size rows, and every metric is
+            evaluated per column with the frame's group kernels before any output is written.
+        """
+        written = 0
+        for frame in _frames(source, self._chunk_size):
+            columns = [frame.metric(metric) for metric in self._metrics]
+            for start in range(0, len(frame), self._chunk_size):
+                chunk = [column[start : start + self._chunk_size] for column in columns]
+                self._file.write(self._encode(chunk))
+                written += len(chunk[0])
+        self._rows += written
+        return written
+
+    def _encode(self, chunk: list[array]) -> bytes:
+        """Format one chunk of metric columns in the output format"""
+        if self._format == "binary":
+            return _CHUNK.pack(len(chunk[0])) + b"".join(map(_little_endian, chunk))
+        if self._format == "csv":
+            texts = [map(float.__repr__, column) for column in chunk]
+            return ("\n".join(map(",".join, zip(*texts))) + "\n").encode("ascii")
+        # A non-finite sum flags the rare columns that need the json module's NaN and Infinity
+        texts = [
+            map(float.__repr__ if math.isfinite(sum(column)) else _json_number, column)
+            for column in chunk
+        ]
+        return "".join(map(self._template.__mod__, zip(*texts))).encode("ascii")
+
+    def flush(self) -> None:
+        """Flush the underlying file"""
+        self._file.flush()
+
+    def __str__(self) -> str:
+        """String representation of the MetricWriter"""
+        return f"MetricWriter(format={self._format}, metrics={list(self._metrics)})"
+
+    def __repr__(self) -> str:
+        """String representation of the MetricWriter"""
+        return f"format={self._format}, metrics={list(self._metrics)}"
+
+
+def read_binary(file: BinaryIO) -> Iterator[dict[str, array]]:
+    """Read a binary metric file written by MetricWriter one chunk at a time
+    Args:
+        file: file opened in binary mode, positioned at the start of the header
+    Returns:
+        iterator of mappings of metric name to an array of doubles, one per written chunk
+    Raises:
+        ValueError: if the file is not a binary metric file or is truncated
+    """
+    if file.read(len(_MAGIC)) != _MAGIC:
+        raise ValueError("Not a binary metric file")
+    (count,) = _NAME.unpack(_read_exact(file, _NAME.size))
+    metrics = []
+    for _ in range(count):
+        (length,) = _NAME.unpack(_read_exact(file, _NAME.size))
+        metrics.append(_read_exact(file, length).decode("utf-8"))
+    while prefix := file.read(_CHUNK.size):
+        (rows,) = _CHUNK.unpack(prefix + _read_exact(file, _CHUNK.size - len(prefix)))
+        chunk = {}
+        for metric in metrics:
+            values = array("d", _read_exact(file, rows * _ITEM_SIZE))
+            if sys.byteorder != "little":
+                values.byteswap()
+            chunk[metric] = values
+        yield chunk
@@ -0,0 +1 @@
+"""Tests for Export package"""
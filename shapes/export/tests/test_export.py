@@ -0,0 +1,119 @@
+"""Test cases for the MetricWriter class and read_binary"""
+
+import csv
+import io
+import json
+import math
+
+import pytest
+
+from shapes import Circle, Rectangle, RightTriangle, ShapeFrame, Square
+from shapes.export import MetricWriter, read_binary
+
+SHAPES = [Rectangle(1, 1), Rectangle(2, 3), Square(2), RightTriangle(3, 4)]
+METRICS = ["area", "perimeter", "circumradius"]
+
+
+def expected_rows() -> list[tuple[float, ...]]:
+    """Metric values computed one shape at a time"""
+    return [tuple(getattr(shape, metric)() for metric in METRICS) for shape in SHAPES]
+
+
+class TestMetricWriter:
+    """Test streaming metrics in each output format"""
+
+    def test_csv(self):
+        """Test that CSV output has a header and round-trips every value"""
+        output = io.BytesIO()
+        writer = MetricWriter(output, METRICS, "csv")
+        assert writer.write(SHAPES) == 4
+        reader = csv.reader(io.StringIO(output.getvalue().decode("ascii")))
+        assert next(reader) == METRICS
+        assert [tuple(map(float, row)) for row in reader] == expected_rows()
+
+    def test_jsonl(self):
+        """Test that each JSON line holds one row keyed by metric"""
+        output = io.BytesIO()
+        MetricWriter(output, METRICS, "jsonl").write(SHAPES)
+        lines = output.getvalue().decode("ascii").splitlines()
+        rows = [json.loads(line) for line in lines]
+        assert [tuple(row[metric] for metric in METRICS) for row in rows] == expected_rows()
+
+    def test_jsonl_non_finite_values(self):
+        """Test that NaN and infinities are spelled as the json module expects"""
+        output = io.BytesIO()
+        MetricWriter(output, ["area"], "jsonl").write([Rectangle(1e200, 1e200), Square(1)])
+        text = output.getvalue().decode("ascii")
+        assert text == '{"area": Infinity}\n{"area": 1.0}\n'
+        assert json.loads(text.splitlines()[0]) == {"area": math.inf}
+
+    def test_binary_roundtrip(self):
+        """Test reading back binary output chunk by chunk"""
+        output = io.BytesIO()
+        MetricWriter(output, METRICS, "binary", chunk_size=3).write(SHAPES)
+        output.seek(0)
+        chunks = list(read_binary(output))
+        assert [len(chunk["area"]) for chunk in chunks] == [3, 1]
+        rows = [row for chunk in chunks for row in zip(*(chunk[m] for m in METRICS))]
+        assert rows == expected_rows()
+
+    def test_frames_and_shapes_match(self):
+        """Test that frames, loose shapes and mixtures of both write the same rows"""
+        outputs = []
+        for source in (SHAPES, ShapeFrame(SHAPES), [ShapeFrame(SHAPES[:2]), *SHAPES[2:]]):
+            output = io.BytesIO()
+            MetricWriter(output, METRICS, "csv", chunk_size=2).write(source)
+            outputs.append(output.getvalue())
+        assert outputs[0] == outputs[1] == outputs[2]
+
+    def test_rows_accumulate(self):
+        """Test counting rows across several writes"""
+        writer = MetricWriter(io.BytesIO(), ["area"])
+        writer.write(Circle(1))
+        writer.write([Circle(2), Circle(3)])
+        assert writer.rows() == 3
+        assert writer.metrics() == ("area",)
+
+    def test_undefined_metric(self):
+        """Test that a metric a shape type lacks raises ValueError"""
+        with pytest.raises(ValueError):
+            MetricWriter(io.BytesIO(), ["circumradius"]).write([Circle(1)])
+
+    @pytest.mark.parametrize(
+        "metrics, options",
+        [([], {}), (["area", "area"], {}), (["a,b"], {}), (["área"], {"format": "jsonl"})]
+        + [(["area"], {"format": "xml"}), (["area"], {"chunk_size": 0})],
+    )
+    def test_invalid_arguments(self, metrics, options):
+        """Test that invalid metrics, formats and chunk sizes raise ValueError"""
+        with pytest.raises(ValueError):
+            MetricWriter(io.BytesIO(), metrics, **options)
+
+    def test_str(self):
+        """Test the str and repr of a MetricWriter"""
+        writer = MetricWriter(io.BytesIO(), ["area"], "binary")
+        assert str(writer) == "MetricWriter(format=binary, metrics=['area'])"
+        assert repr(writer) == "format=binary, metrics=['area']"
+
+
+class TestReadBinary:
+    """Test reading binary metric files"""
+
+    def test_not_a_metric_file(self):
+        """Test that other data raises ValueError"""
+        with pytest.raises(ValueError):
+            list(read_binary(io.BytesIO(b"area,perimeter\n")))
+
+    def test_truncated(self):
+        """Test that a file cut inside a chunk raises ValueError"""
+        output = io.BytesIO()
+        MetricWriter(output, ["area"], "binary").write(SHAPES)
+        with pytest.raises(ValueError):
+            list(read_binary(io.BytesIO(output.getvalue()[:-4])))
+
+    def test_empty(self):
+        """Test that a header without chunks yields nothing"""
+        output = io.BytesIO()
+        MetricWriter(output, ["area"], "binary")
+        output.seek(0)
+        assert not list(read_binary(output))
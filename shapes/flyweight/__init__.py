@@ -0,0 +1,5 @@
+"""Flyweight module"""
+
+from .flyweight import FrozenCircle, FrozenRectangle, FrozenSquare, PoolInfo, ShapePool
+
+__all__ = ["FrozenCircle", "FrozenRectangle", "FrozenSquare", "PoolInfo", "ShapePool"]
@@ -0,0 +1,227 @@
+"""Module to share immutable instances of repeated circle and rectangle sizes"""
+
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from functools import wraps
+from typing import TYPE_CHECKING, NamedTuple, TypeVar
+
+from shapes.circle import Circle, PositionedCircle
+from shapes.rectangle import PositionedRectangle, Rectangle, Square
+
+if TYPE_CHECKING:
+    from typing_extensions import Self
+else:
+    try:
+        from typing import Self
+    except ImportError:
+        from typing_extensions import Self
+
+T = TypeVar("T")
+
+
+def _memoized(method: Callable[[T], float]) -> Callable[[T], float]:
+    """Cache the result of a no-argument metric on the instance after the first call"""
+    name = method.__name__
+
+    @wraps(method)
+    def cached(self: T) -> float:
+        metrics = self.__dict__.setdefault("_metrics", {})
+        if name not in metrics:
+            metrics[name] = method(self)
+        return metrics[name]  # type: ignore[no-any-return]
+
+    return cached
+
+
+class _Frozen:
+    """Mixin that rejects attribute changes once a shape is constructed"""
+
+    def _freeze(self) -> None:
+        """Mark the construction of the shape as finished"""
+        self.__dict__["_frozen"] = True
+
+    def __setattr__(self, name: str, value: object) -> None:
+        """Set an attribute while the shape is being constructed
+        Raises:
+            AttributeError: once the shape is frozen
+        """
+        if "_frozen" in self.__dict__:
+            raise AttributeError(f"{type(self).__name__} is immutable")
+        super().__setattr__(name, value)
+
+    def __delattr__(self, name: str) -> None:
+        """Reject deleting attributes
+        Raises:
+            AttributeError: always
+        """
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __imul__(self, scale: int | float) -> Self:
+        """Decline in-place scaling, so *= rebinds the name to a new, mutable shape"""
+        return NotImplemented
+
+    def __itruediv__(self, scale: int | float) -> Self:
+        """Decline in-place scaling, so /= rebinds the name to a new, mutable shape"""
+        return NotImplemented
+
+
+class FrozenCircle(_Frozen, Circle):
+    """Immutable Circle whose metrics are computed once and cached"""
+
+    def __init__(self, radius: int | float) -> None:
+        """Initialize the FrozenCircle with a radius
+        Raises:
+            ValueError: if radius is not positive
+        """
+        super().__init__(radius)
+        self._freeze()
+
+    diameter = _memoized(Circle.diameter)
+    circumference = _memoized(Circle.circumference)
+    area = _memoized(Circle.area)
+
+
+class FrozenRectangle(_Frozen, Rectangle):
+    """Immutable Rectangle whose metrics are computed once and cached"""
+
+    def __init__(self, width: int | float, height: int | float) -> None:
+        """Initialize the FrozenRectangle with width and height
+        Raises:
+            ValueError: if width or height is not positive
+        """
+        super().__init__(width, height)
+        self._freeze()
+
+    area = _memoized(Rectangle.area)
+    perimeter = _memoized(Rectangle.perimeter)
+    diagonal = _memoized(Rectangle.diagonal)
+    aspect_ratio = _memoized(Rectangle.aspect_ratio)
+    circumradius = _memoized(Rectangle.circumradius)
+    inradius = _memoized(Rectangle.inradius)
+
+
+class FrozenSquare(_Frozen, Square):
+    """Immutable Square whose metrics are computed once and cached"""
+
+    def __init__(self, side: int | float) -> None:
+        """Initialize the FrozenSquare with a side length
+        Raises:
+            ValueError: if side is not positive
+        """
+        super().__init__(side)
+        self._freeze()
+
+    area = _memoized(Square.area)
+    perimeter = _memoized(Square.perimeter)
+    diagonal = _memoized(Square.diagonal)
+    circumradius = _memoized(Square.circumradius)
+    inradius = _memoized(Square.inradius)
+
+
+class PoolInfo(NamedTuple):
+    """Hit and miss counts of a ShapePool with its current and maximum size"""
+
+    hits: int
+    misses: int
+    size: int
+    max_size: int
+
+
+class ShapePool:
+    """Interning factory that hands out one shared immutable shape per distinct size"""
+
+    def __init__(self, max_size: int = 4096) -> None:
+        """Initialize the ShapePool
+        Args:
+            max_size: number of distinct sizes kept; the least recently used is evicted first
+        Raises:
+            ValueError: if max_size is less than 1
+        """
+        if max_size < 1:
+            raise ValueError("Max size must be at least 1")
+        self._max_size: int = max_size
+        self._shapes: OrderedDict[Hashable, Circle | Rectangle] = OrderedDict()
+        self._hits: int = 0
+        self._misses: int = 0
+        self._lock: threading.Lock = threading.Lock()
+
+    def _get(self, key: tuple[object, ...], build: Callable[[], T]) -> T:
+        """Get the pooled shape for a key, building and caching it on a miss"""
+        with self._lock:
+            shape = self._shapes.get(key)
+            if shape is not None:
+                self._hits += 1
+                self._shapes.move_to_end(key)
+                return shape  # type: ignore[return-value]
+            self._misses += 1
+        new = build()
+        with self._lock:
+            shape = self._shapes.setdefault(key, new)  # type: ignore[arg-type]
+            self._shapes.move_to_end(key)
+            if len(self._shapes) > self._max_size:
+                self._shapes.popitem(last=False)
+        return shape  # type: ignore[return-value]
+
+    def circle(self, radius: int | float) -> FrozenCircle:
+        """Get the shared circle with a radius
+        Raises:
+            ValueError: if radius is not positive
+        """
+        return self._get((FrozenCircle, float(radius)), lambda: FrozenCircle(radius))
+
+    def rectangle(self, width: int | float, height: int | float) -> FrozenRectangle:
+        """Get the shared rectangle with a width and height
+        Raises:
+            ValueError: if width or height is not positive
+        """
+        key = (FrozenRectangle, float(width), float(height))
+        return self._get(key, lambda: FrozenRectangle(width, height))
+
+    def square(self, side: int | float) -> FrozenSquare:
+        """Get the shared square with a side length
+        Raises:
+            ValueError: if side is not positive
+        """
+        return self._get((FrozenSquare, float(side)), lambda: FrozenSquare(side))
+
+    def intern(self, shape: Circle | Rectangle) -> Circle | Rectangle:
+        """Get the shared immutable equivalent of a circle, rectangle or square
+        Raises:
+            TypeError: if the shape is positioned or not a circle or rectangle
+        Note:
+            Sizes are matched exactly, not with the tolerance used by ==.
+        """
+        if isinstance(shape, (PositionedCircle, PositionedRectangle)):
+            raise TypeError("Positioned shapes cannot be interned")
+        if isinstance(shape, Circle):
+            return self.circle(shape.radius())
+        if isinstance(shape, Square):
+            return self.square(shape.side())
+        if isinstance(shape, Rectangle):
+            return self.rectangle(shape.width(), shape.height())
+        raise TypeError("Can only intern Circle, Rectangle and Square")
+
+    def info(self) -> PoolInfo:
+        """Get the hit and miss counts and the size of the pool"""
+        with self._lock:
+            return PoolInfo(self._hits, self._misses, len(self._shapes), self._max_size)
+
+    def clear(self) -> None:
+        """Drop every pooled shape and reset the counts"""
+        with self._lock:
+            self._shapes.clear()
+            self._hits = 0
+            self._misses = 0
+
+    def __len__(self) -> int:
+        """Number of distinct sizes in the pool"""
+        return len(self._shapes)
+
+    def __str__(self) -> str:
+        """String representation of the ShapePool"""
+        return f"ShapePool(size={len(self._shapes)}, max_size={self._max_size})"
+
+    def __repr__(self) -> str:
+        """String representation of the ShapePool"""
+        return f"size={len(self._shapes)}, max_size={self._max_size}"
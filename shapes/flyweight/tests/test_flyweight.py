@@ -0,0 +1,131 @@
+"""Test cases for the ShapePool class and the frozen shapes"""
+
+import pickle
+
+import pytest
+
+from shapes import Circle, PositionedCircle, Rectangle, ShapeFrame, Square
+from shapes.flyweight import FrozenCircle, FrozenRectangle, FrozenSquare, PoolInfo, ShapePool
+
+
+class TestShapePool:
+    """Test interning shapes in a pool"""
+
+    def test_equal_sizes_share_an_instance(self):
+        """Test that equal dimensions return the same object"""
+        pool = ShapePool()
+        assert pool.circle(2) is pool.circle(2.0)
+        assert pool.rectangle(1, 2) is pool.rectangle(1, 2)
+        assert pool.rectangle(1, 2) is not pool.rectangle(2, 1)
+        assert pool.square(3) is pool.square(3)
+
+    def test_info_counts_hits_and_misses(self):
+        """Test the hit and miss statistics"""
+        pool = ShapePool(max_size=10)
+        for radius in (1, 2, 1, 1, 3):
+            pool.circle(radius)
+        assert pool.info() == PoolInfo(hits=2, misses=3, size=3, max_size=10)
+
+    def test_least_recently_used_is_evicted(self):
+        """Test that the pool drops the size used longest ago"""
+        pool = ShapePool(max_size=2)
+        first = pool.circle(1)
+        pool.circle(2)
+        pool.circle(1)
+        pool.circle(3)
+        assert len(pool) == 2
+        assert pool.circle(1) is first
+        assert pool.info().misses == 3
+        pool.circle(2)
+        assert pool.info().misses == 4
+
+    def test_intern(self):
+        """Test interning existing mutable shapes"""
+        pool = ShapePool()
+        assert pool.intern(Circle(1)) is pool.circle(1)
+        assert pool.intern(Square(2)) is pool.square(2)
+        assert pool.intern(Rectangle(2, 2)) is pool.rectangle(2, 2)
+        assert isinstance(pool.intern(Square(2)), FrozenSquare)
+
+    def test_intern_rejects_positioned_shapes(self):
+        """Test that positioned shapes raise TypeError"""
+        with pytest.raises(TypeError):
+            ShapePool().intern(PositionedCircle(1, 2, 3))
+        with pytest.raises(TypeError):
+            ShapePool().intern("circle")
+
+    def test_invalid_dimensions_are_not_cached(self):
+        """Test that invalid sizes raise ValueError and leave the pool empty"""
+        pool = ShapePool()
+        with pytest.raises(ValueError):
+            pool.circle(-1)
+        assert len(pool) == 0
+
+    def test_clear(self):
+        """Test dropping every pooled shape"""
+        pool = ShapePool()
+        pool.circle(1)
+        pool.clear()
+        assert pool.info() == PoolInfo(hits=0, misses=0, size=0, max_size=4096)
+
+    def test_invalid_max_size(self):
+        """Test that a max size below 1 raises ValueError"""
+        with pytest.raises(ValueError):
+            ShapePool(max_size=0)
+
+    def test_str(self):
+        """Test the str and repr of a ShapePool"""
+        pool = ShapePool(max_size=8)
+        pool.square(1)
+        assert str(pool) == "ShapePool(size=1, max_size=8)"
+        assert repr(pool) == "size=1, max_size=8"
+
+
+class TestFrozenShapes:
+    """Test the immutable shapes handed out by the pool"""
+
+    def test_attributes_cannot_change(self):
+        """Test that setting or deleting attributes raises AttributeError"""
+        circle = FrozenCircle(1)
+        with pytest.raises(AttributeError):
+            circle._radius = 2.0
+        with pytest.raises(AttributeError):
+            del circle._radius
+        assert circle.radius() == 1.0
+
+    def test_in_place_scaling_rebinds(self):
+        """Test that *= and /= produce new mutable shapes and leave the pooled one alone"""
+        pool = ShapePool()
+        shared = pool.rectangle(2, 8)
+        scaled = shared
+        scaled *= 4
+        assert type(scaled) is Rectangle
+        assert scaled == Rectangle(4, 16)
+        halved = pool.square(4)
+        halved /= 4
+        assert type(halved) is Square
+        assert pool.rectangle(2, 8) == Rectangle(2, 8)
+        assert pool.square(4).side() == 4.0
+
+    def test_metrics_are_cached(self):
+        """Test that metrics match the mutable classes and are computed once"""
+        square = FrozenSquare(3)
+        assert square.area() == Square(3).area()
+        assert square.diagonal() == Square(3).diagonal()
+        assert square.__dict__["_metrics"] == {"area": 9.0, "diagonal": Square(3).diagonal()}
+        rectangle = FrozenRectangle(2, 4)
+        assert rectangle.aspect_ratio() == 0.5
+        assert FrozenCircle(2).circumference() == Circle(2).circumference()
+
+    def test_pickle_roundtrip(self):
+        """Test that frozen shapes pickle as their sizes and stay frozen"""
+        copy = pickle.loads(pickle.dumps(FrozenRectangle(2, 3)))
+        assert type(copy) is FrozenRectangle
+        with pytest.raises(AttributeError):
+            copy._width = 1.0
+
+    def test_frame_accepts_frozen_shapes(self):
+        """Test storing pooled shapes in a ShapeFrame"""
+        pool = ShapePool()
+        frame = ShapeFrame([pool.circle(1), pool.square(2), pool.rectangle(1, 3)])
+        assert list(frame.metric("area")) == [Circle(1).area(), 4.0, 3.0]
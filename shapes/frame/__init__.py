@@ -0,0 +1,5 @@
+"""Frame module"""
+
+from .frame import ShapeFrame, ShapeType, metric_chunks
+
+__all__ = ["ShapeFrame", "ShapeType", "metric_chunks"]
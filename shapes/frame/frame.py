@@ -0,0 +1,452 @@
+"""Module to store mixed shapes in a columnar, type-tagged table"""
+
+import math
+from array import array
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from enum import IntEnum
+
+from shapes.backend import get_backend
+from shapes.circle import Circle
+from shapes.rectangle import Rectangle, Square
+from shapes.triangle import AcuteTriangle, ObtuseTriangle, RightTriangle
+
+
+class ShapeType(IntEnum):
+    """Type code stored in the type column of a ShapeFrame"""
+
+    CIRCLE = 0
+    RECTANGLE = 1
+    SQUARE = 2
+    RIGHT_TRIANGLE = 3
+    ACUTE_TRIANGLE = 4
+    OBTUSE_TRIANGLE = 5
+
+
+# Names of the dimension columns held for each shape type
+_LAYOUT: dict[ShapeType, tuple[str, ...]] = {
+    ShapeType.CIRCLE: ("radius",),
+    ShapeType.RECTANGLE: ("width", "height"),
+    ShapeType.SQUARE: ("side",),
+    ShapeType.RIGHT_TRIANGLE: ("a", "b", "c"),
+    ShapeType.ACUTE_TRIANGLE: ("a", "b", "c"),
+    ShapeType.OBTUSE_TRIANGLE: ("a", "b", "c"),
+}
+
+_CLASSES: dict[ShapeType, type] = {
+    ShapeType.CIRCLE: Circle,
+    ShapeType.RECTANGLE: Rectangle,
+    ShapeType.SQUARE: Square,
+    ShapeType.RIGHT_TRIANGLE: RightTriangle,
+    ShapeType.ACUTE_TRIANGLE: AcuteTriangle,
+    ShapeType.OBTUSE_TRIANGLE: ObtuseTriangle,
+}
+
+# Most specific classes first so that a Square is not tagged as a Rectangle
+_LOOKUP_ORDER: tuple[ShapeType, ...] = (
+    ShapeType.CIRCLE,
+    ShapeType.SQUARE,
+    ShapeType.RECTANGLE,
+    ShapeType.RIGHT_TRIANGLE,
+    ShapeType.ACUTE_TRIANGLE,
+    ShapeType.OBTUSE_TRIANGLE,
+)
+
+Kernel = Callable[..., Iterable[float]]
+
+
+def _heron(a: Sequence[float], b: Sequence[float], c: Sequence[float]) -> array:
+    """Heron's formula over side columns, on the current backend"""
+    return get_backend().heron(a, b, c)
+
+
+def _opposite_angle(x: Sequence[float], y: Sequence[float], z: Sequence[float]) -> array:
+    """Law of cosines for the angle opposite side z, on the current backend"""
+    return get_backend().opposite_angle(x, y, z)
+
+
+def _triangle_perimeter(a: Sequence[float], b: Sequence[float], c: Sequence[float]) -> list[float]:
+    """Perimeter over side columns"""
+    return [x + y + z for x, y, z in zip(a, b, c)]
+
+
+def _triangle_inradius(a: Sequence[float], b: Sequence[float], c: Sequence[float]) -> list[float]:
+    """Inradius over side columns"""
+    return [area / (0.5 * (x + y + z)) for area, x, y, z in zip(_heron(a, b, c), a, b, c)]
+
+
+def _circumradius(a: Sequence[float], b: Sequence[float], c: Sequence[float]) -> list[float]:
+    """Circumradius over side columns"""
+    return [x * y * z / (4 * area) for area, x, y, z in zip(_heron(a, b, c), a, b, c)]
+
+
+# Per-group metric kernels; a metric missing here falls back to the scalar method
+_KERNELS: dict[str, dict[ShapeType, Kernel]] = {
+    "area": {
+        ShapeType.CIRCLE: lambda r: [math.pi * x**2 for x in r],
+        ShapeType.RECTANGLE: lambda w, h: [x * y for x, y in zip(w, h)],
+        ShapeType.SQUARE: lambda s: [x * x for x in s],
+        ShapeType.RIGHT_TRIANGLE: lambda a, b, c: [0.5 * x * y for x, y in zip(a, b)],
+        ShapeType.ACUTE_TRIANGLE: _heron,
+        ShapeType.OBTUSE_TRIANGLE: _heron,
+    },
+    "perimeter": {
+        ShapeType.RECTANGLE: lambda w, h: [2 * (x + y) for x, y in zip(w, h)],
+        ShapeType.SQUARE: lambda s: [4 * x for x in s],
+        ShapeType.RIGHT_TRIANGLE: _triangle_perimeter,
+        ShapeType.ACUTE_TRIANGLE: _triangle_perimeter,
+        ShapeType.OBTUSE_TRIANGLE: _triangle_perimeter,
+    },
+    "circumference": {
+        ShapeType.CIRCLE: lambda r: [2 * math.pi * x for x in r],
+    },
+    "diameter": {
+        ShapeType.CIRCLE: lambda r: [2 * x for x in r],
+    },
+    "diagonal": {
+        ShapeType.RECTANGLE: lambda w, h: [math.sqrt(x**2 + y**2) for x, y in zip(w, h)],
+        ShapeType.SQUARE: lambda s: [x * math.sqrt(2) for x in s],
+    },
+    "aspect_ratio": {
+        ShapeType.RECTANGLE: lambda w, h: [x / y for x, y in zip(w, h)],
+        ShapeType.SQUARE: lambda s: [1.0 for _ in s],
+    },
+    "circumradius": {
+        ShapeType.RECTANGLE: lambda w, h: [math.sqrt(x**2 + y**2) / 2 for x, y in zip(w, h)],
+        ShapeType.SQUARE: lambda s: [x * math.sqrt(2) / 2 for x in s],
+        ShapeType.RIGHT_TRIANGLE: lambda a, b, c: [z / 2 for z in c],
+        ShapeType.ACUTE_TRIANGLE: _circumradius,
+        ShapeType.OBTUSE_TRIANGLE: _circumradius,
+    },
+    "inradius": {
+        ShapeType.RECTANGLE: lambda w, h: [min(x, y) / 2 for x, y in zip(w, h)],
+        ShapeType.SQUARE: lambda s: [x / 2 for x in s],
+        ShapeType.RIGHT_TRIANGLE: _triangle_inradius,
+        ShapeType.ACUTE_TRIANGLE: _triangle_inradius,
+        ShapeType.OBTUSE_TRIANGLE: _triangle_inradius,
+    },
+    "angle_a": {
+        ShapeType.RIGHT_TRIANGLE: lambda a, b, c: [math.atan(x / y) for x, y in zip(a, b)],
+        ShapeType.ACUTE_TRIANGLE: lambda a, b, c: _opposite_angle(b, c, a),
+        ShapeType.OBTUSE_TRIANGLE: lambda a, b, c: _opposite_angle(b, c, a),
+    },
+    "angle_b": {
+        ShapeType.RIGHT_TRIANGLE: lambda a, b, c: [math.atan(y / x) for x, y in zip(a, b)],
+        ShapeType.ACUTE_TRIANGLE: lambda a, b, c: _opposite_angle(a, c, b),
+        ShapeType.OBTUSE_TRIANGLE: lambda a, b, c: _opposite_angle(a, c, b),
+    },
+    "angle_c": {
+        ShapeType.RIGHT_TRIANGLE: lambda a, b, c: [math.pi / 2 for _ in c],
+        ShapeType.ACUTE_TRIANGLE: _opposite_angle,
+        ShapeType.OBTUSE_TRIANGLE: _opposite_angle,
+    },
+}
+
+
+def shape_type(shape: object) -> ShapeType:
+    """Get the type code of a shape
+    Args:
+        shape: a Circle, Rectangle, Square or one of the Triangle subclasses
+    Raises:
+        TypeError: if the shape is not one of the supported classes
+    """
+    for code in _LOOKUP_ORDER:
+        if isinstance(shape, _CLASSES[code]):
+            return code
+    raise TypeError(f"Unsupported shape type: {type(shape).__name__}")
+
+
+def dimensions(shape: object) -> tuple[float, ...]:
+    """Get the dimension values stored in a ShapeFrame for a shape"""
+    code = shape_type(shape)
+    if code is ShapeType.CIRCLE:
+        return (shape.radius(),)  # type: ignore[attr-defined]
+    if code is ShapeType.SQUARE:
+        return (shape.side(),)  # type: ignore[attr-defined]
+    if code is ShapeType.RECTANGLE:
+        return (shape.width(), shape.height())  # type: ignore[attr-defined]
+    return (shape.a, shape.b, shape.c)  # type: ignore[attr-defined]
+
+
+def build_shape(code: ShapeType, dims: Sequence[float]) -> object:
+    """Construct a shape object from its type code and dimension values"""
+    if code is ShapeType.RIGHT_TRIANGLE:
+        return RightTriangle(dims[0], dims[1])
+    return _CLASSES[code](*dims)
+
+
+def compute_group(code: ShapeType, metric: str, columns: Sequence[Sequence[float]]) -> array:
+    """Evaluate a metric over the dimension columns of one shape type
+    Args:
+        code: shape type the columns belong to
+        metric: name of a no-argument shape method, e.g. "area"
+        columns: dimension columns in the layout order of the shape type
+    Returns:
+        array of doubles with one value per row
+    Raises:
+        ValueError: if the metric is not defined for the shape type
+    """
+    kernel = _KERNELS.get(metric, {}).get(code)
+    if kernel is not None:
+        return array("d", kernel(*columns))
+    cls = _CLASSES[code]
+    method = getattr(cls, metric, None) if not metric.startswith("_") else None
+    if not callable(method):
+        raise ValueError(f"Metric '{metric}' is not defined for {cls.__name__}")
+    return array("d", (method(build_shape(code, dims)) for dims in zip(*columns)))
+
+
+class ShapeFrame:
+    """Columnar table of mixed shapes with a type-code column and per-type dimension columns"""
+
+    def __init__(self, shapes: Iterable[object] = ()) -> None:
+        """Initialize the ShapeFrame with an optional iterable of shapes
+        Args:
+            shapes: shapes to append to the frame
+        Raises:
+            TypeError: if a shape is not one of the supported classes
+        """
+        self._codes: array = array("B")
+        self._slots: array = array("q")
+        self._rows: dict[ShapeType, array] = {code: array("q") for code in ShapeType}
+        self._columns: dict[ShapeType, tuple[array, ...]] = {
+            code: tuple(array("d") for _ in names) for code, names in _LAYOUT.items()
+        }
+        self.extend(shapes)
+
+    @staticmethod
+    def layout(code: ShapeType) -> tuple[str, ...]:
+        """Get the dimension column names for a shape type"""
+        return _LAYOUT[code]
+
+    def append(self, shape: object) -> None:
+        """Append a single shape to the frame
+        Raises:
+            TypeError: if the shape is not one of the supported classes
+            BufferError: if a held view stops a column from growing; the frame is left unchanged
+        """
+        code = shape_type(shape)
+        rows = self._rows[code]
+        targets = (self._codes, self._slots, rows, *self._columns[code])
+        values = (code, len(rows), len(self._codes), *dimensions(shape))
+        grown = 0
+        try:
+            for target, value in zip(targets, values):
+                target.append(value)
+                grown += 1
+        except BufferError:
+            for target in targets[:grown]:
+                target.pop()
+            raise
+
+    def extend(self, shapes: Iterable[object]) -> None:
+        """Append shapes to the frame"""
+        for shape in shapes:
+            self.append(shape)
+
+    def extend_columns(self, code: ShapeType, *columns: Iterable[float]) -> None:
+        """Append rows of a single shape type directly from dimension columns
+        Args:
+            code: shape type of the new rows
+            columns: one column per dimension in the layout order of the shape type
+        Raises:
+            ValueError: if the number or lengths of the columns do not match the layout
+        Note:
+            Values are trusted to describe valid shapes; no geometric validation is done.
+        """
+        code = ShapeType(code)
+        if len(columns) != len(_LAYOUT[code]):
+            raise ValueError(f"{code.name} requires columns {_LAYOUT[code]}")
+        values = [array("d", column) for column in columns]
+        count = len(values[0])
+        if any(len(column) != count for column in values):
+            raise ValueError("Columns must all have the same length")
+        self._add_rows(code, values)
+
+    def _add_rows(self, code: ShapeType, values: Sequence[Sequence[float]]) -> None:
+        """Append rows of a shape type at the end of the frame from their dimension columns
+        Raises:
+            BufferError: if a held view stops a column from growing; the frame is left unchanged
+        """
+        count = len(values[0])
+        rows = self._rows[code]
+        start = len(self._codes)
+        targets = (self._codes, self._slots, rows, *self._columns[code])
+        new = (
+            [code] * count,
+            range(len(rows), len(rows) + count),
+            range(start, start + count),
+            *values,
+        )
+        grown: list[array] = []
+        try:
+            for target, items in zip(targets, new):
+                target.extend(items)
+                grown.append(target)
+        except BufferError:
+            for target, items in zip(grown, new):
+                del target[len(target) - len(items) :]
+            raise
+
+    def __len__(self) -> int:
+        """Number of shapes in the frame"""
+        return len(self._codes)
+
+    def __getitem__(self, index: int) -> object:
+        """Materialize the shape stored at a row"""
+        code = ShapeType(self._codes[index])
+        slot = self._slots[index]
+        return build_shape(code, [column[slot] for column in self._columns[code]])
+
+    def __iter__(self) -> Iterator[object]:
+        """Iterate over the shapes in row order"""
+        for index in range(len(self)):
+            yield self[index]
+
+    def type_at(self, index: int) -> ShapeType:
+        """Get the type code of a row"""
+        return ShapeType(self._codes[index])
+
+    def counts(self) -> dict[ShapeType, int]:
+        """Get the number of rows of each shape type present in the frame"""
+        return {code: len(rows) for code, rows in self._rows.items() if rows}
+
+    def codes(self) -> array:
+        """Get a copy of the type-code column, one unsigned byte per row"""
+        return array("B", self._codes)
+
+    def columns(self, code: ShapeType) -> tuple[array, ...]:
+        """Get copies of the dimension columns of one shape type, in the group's row order"""
+        return tuple(array("d", column) for column in self._columns[ShapeType(code)])
+
+    def code_view(self) -> memoryview:
+        """Get a zero-copy, read-only view of the type-code column, one unsigned byte per row
+        Note:
+            The frame cannot grow while a view is held; release it before appending rows.
+        """
+        return memoryview(self._codes).toreadonly()
+
+    def column(self, code: ShapeType, name: str) -> memoryview:
+        """Get a zero-copy, read-only view of one dimension column of a shape type
+        Args:
+            code: shape type the column belongs to
+            name: column name from layout(code), e.g. "radius"
+        Returns:
+            view of doubles in the group's row order, usable by anything that accepts a buffer
+        Raises:
+            ValueError: if the shape type has no column of that name
+        Note:
+            The frame cannot grow while a view is held; release it before appending rows.
+        """
+        code = ShapeType(code)
+        if name not in _LAYOUT[code]:
+            raise ValueError(f"{code.name} has no column '{name}'; columns are {_LAYOUT[code]}")
+        return memoryview(self._columns[code][_LAYOUT[code].index(name)]).toreadonly()
+
+    def group_metric(self, metric: str) -> dict[ShapeType, array]:
+        """Evaluate a metric once per shape type group
+        Args:
+            metric: name of a no-argument shape method, e.g. "area"
+        Returns:
+            mapping of shape type to metric values in the group's row order
+        Raises:
+            ValueError: if the metric is not defined for a type present in the frame
+        """
+        return {
+            code: compute_group(code, metric, self._columns[code])
+            for code, rows in self._rows.items()
+            if rows
+        }
+
+    def metric(self, metric: str) -> array:
+        """Evaluate a metric for every row
+        Args:
+            metric: name of a no-argument shape method, e.g. "area"
+        Returns:
+            array of doubles in row order
+        Raises:
+            ValueError: if the metric is not defined for a type present in the frame
+        """
+        groups = self.group_metric(metric)
+        if len(groups) == 1:
+            return next(iter(groups.values()))
+        result = array("d", bytes(8 * len(self)))
+        for code, values in groups.items():
+            for row, value in zip(self._rows[code], values):
+                result[row] = value
+        return result
+
+    def argsort(self, metric: str = "area", reverse: bool = False) -> list[int]:
+        """Get the row indices ordered by a metric, across shape types
+        Args:
+            metric: name of the metric to order by
+            reverse: order from largest to smallest
+        """
+        values = self.metric(metric)
+        return sorted(range(len(values)), key=values.__getitem__, reverse=reverse)
+
+    def take(self, indices: Iterable[int]) -> "ShapeFrame":
+        """Create a new frame holding the given rows in the given order"""
+        indices = list(indices)
+        new = ShapeFrame()
+        new._codes = array("B", [self._codes[index] for index in indices])
+        new._slots = array("q", bytes(8 * len(indices)))
+        # Gather one type group at a time so each column is copied with a single pass
+        for code in map(ShapeType, sorted(set(new._codes))):
+            rows = array("q", [row for row, value in enumerate(new._codes) if value == code])
+            slots = [self._slots[indices[row]] for row in rows]
+            for target, source in zip(new._columns[code], self._columns[code]):
+                target.extend([source[slot] for slot in slots])
+            for slot, row in enumerate(rows):
+                new._slots[row] = slot
+            new._rows[code] = rows
+        return new
+
+    def sort_by(self, metric: str = "area", reverse: bool = False) -> "ShapeFrame":
+        """Create a new frame with the rows ordered by a metric, across shape types
+        Args:
+            metric: name of the metric to order by
+            reverse: order from largest to smallest
+        """
+        return self.take(self.argsort(metric, reverse))
+
+    def __str__(self) -> str:
+        """String representation of the ShapeFrame"""
+        counts = ", ".join(f"{code.name}={count}" for code, count in self.counts().items())
+        return f"ShapeFrame({counts})"
+
+    def __repr__(self) -> str:
+        """String representation of the ShapeFrame"""
+        return f"rows={len(self)}"
+
+
+def metric_chunks(source: object, metric: str, chunk_size: int = 65536) -> Iterator[array]:
+    """Stream the values of a metric as arrays of doubles
+    Args:
+        source: a shape, a ShapeFrame, or an iterable of shapes and ShapeFrames
+        metric: name of a no-argument shape method, e.g. "area"
+        chunk_size: number of loose shapes gathered into each group-dispatched chunk
+    Raises:
+        ValueError: if chunk_size is not positive or the metric is undefined for a shape
+        TypeError: if the source holds unsupported objects
+    """
+    if chunk_size <= 0:
+        raise ValueError("Chunk size must be positive")
+    if isinstance(source, ShapeFrame):
+        yield source.metric(metric)
+        return
+    if not isinstance(source, Iterable):
+        source = (source,)
+    pending = ShapeFrame()
+    for item in source:
+        if isinstance(item, ShapeFrame):
+            if pending:
+                yield pending.metric(metric)
+                pending = ShapeFrame()
+            yield item.metric(metric)
+            continue
+        pending.append(item)
+        if len(pending) >= chunk_size:
+            yield pending.metric(metric)
+            pending = ShapeFrame()
+    if pending:
+        yield pending.metric(metric)
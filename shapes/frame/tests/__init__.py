@@ -0,0 +1 @@
+"""Tests for Frame package"""
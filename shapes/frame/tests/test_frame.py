@@ -0,0 +1,240 @@
+"""Test cases for the ShapeFrame class"""
+
+import math
+import struct
+from array import array
+
+import pytest
+
+from shapes import (
+    AcuteTriangle,
+    Circle,
+    ObtuseTriangle,
+    Rectangle,
+    RightTriangle,
+    ShapeFrame,
+    ShapeType,
+    Square,
+)
+
+
+def mixed_shapes():
+    """Create one shape of every supported type"""
+    return [
+        Circle(2),
+        Rectangle(3, 4),
+        Square(5),
+        RightTriangle(3, 4),
+        AcuteTriangle(5, 6, 7),
+        ObtuseTriangle(3, 4, 6),
+    ]
+
+
+class TestShapeFrameBasics:
+    """Test construction and row access"""
+
+    def test_empty(self):
+        """Test an empty frame"""
+        frame = ShapeFrame()
+        assert len(frame) == 0
+        assert frame.counts() == {}
+        assert len(frame.metric("area")) == 0
+
+    def test_type_codes(self):
+        """Test that each shape is tagged with its own type"""
+        frame = ShapeFrame(mixed_shapes())
+        assert [frame.type_at(i) for i in range(len(frame))] == list(ShapeType)
+
+    def test_square_is_not_tagged_as_rectangle(self):
+        """Test that squares get their own type code"""
+        frame = ShapeFrame([Square(2), Rectangle(2, 2)])
+        assert frame.type_at(0) is ShapeType.SQUARE
+        assert frame.type_at(1) is ShapeType.RECTANGLE
+
+    def test_round_trip(self):
+        """Test that rows materialize back into equal shapes"""
+        shapes = mixed_shapes()
+        frame = ShapeFrame(shapes)
+        for original, restored in zip(shapes, frame):
+            assert type(original) is type(restored)
+            assert original == restored
+
+    def test_getitem_negative_index(self):
+        """Test that negative indices address rows from the end"""
+        frame = ShapeFrame(mixed_shapes())
+        assert frame[-1] == ObtuseTriangle(3, 4, 6)
+
+    def test_unsupported_type(self):
+        """Test that unsupported objects raise TypeError"""
+        with pytest.raises(TypeError):
+            ShapeFrame([object()])
+
+    def test_counts(self):
+        """Test per-type row counts"""
+        frame = ShapeFrame([Circle(1), Circle(2), Square(3)])
+        assert frame.counts() == {ShapeType.CIRCLE: 2, ShapeType.SQUARE: 1}
+
+    def test_layout(self):
+        """Test the dimension column names of a type"""
+        assert ShapeFrame.layout(ShapeType.RECTANGLE) == ("width", "height")
+
+
+class TestShapeFrameColumns:
+    """Test appending rows from columns"""
+
+    def test_extend_columns(self):
+        """Test appending a block of rows of one type"""
+        frame = ShapeFrame([Circle(1)])
+        frame.extend_columns(ShapeType.RECTANGLE, [1, 2], [3, 4])
+        assert len(frame) == 3
+        assert frame[2] == Rectangle(2, 4)
+
+    def test_extend_columns_wrong_count(self):
+        """Test that a column count mismatch raises ValueError"""
+        with pytest.raises(ValueError):
+            ShapeFrame().extend_columns(ShapeType.RECTANGLE, [1, 2])
+
+    def test_extend_columns_wrong_length(self):
+        """Test that columns of different lengths raise ValueError"""
+        with pytest.raises(ValueError):
+            ShapeFrame().extend_columns(ShapeType.RECTANGLE, [1, 2], [3])
+
+    def test_codes_and_columns(self):
+        """Test reading the type codes and one type's dimension columns"""
+        frame = ShapeFrame([Rectangle(1, 2), Circle(3), Rectangle(4, 5)])
+        assert list(frame.codes()) == [ShapeType.RECTANGLE, ShapeType.CIRCLE, ShapeType.RECTANGLE]
+        widths, heights = frame.columns(ShapeType.RECTANGLE)
+        assert list(widths) == [1.0, 4.0]
+        assert list(heights) == [2.0, 5.0]
+
+    def test_column_view(self):
+        """Test reading a dimension column zero-copy through the buffer protocol"""
+        frame = ShapeFrame([Rectangle(1, 2), Circle(3), Rectangle(4, 5)])
+        with frame.column(ShapeType.RECTANGLE, "height") as heights:
+            assert heights.format == "d"
+            assert heights.readonly
+            assert struct.unpack("2d", heights) == (2.0, 5.0)
+            assert array("d", heights.tobytes()) == array("d", [2.0, 5.0])
+        with frame.code_view() as codes:
+            assert bytes(codes) == bytes([ShapeType.RECTANGLE, ShapeType.CIRCLE, 1])
+
+    def test_column_view_unknown_name(self):
+        """Test that a name outside the layout raises ValueError"""
+        with pytest.raises(ValueError):
+            ShapeFrame().column(ShapeType.CIRCLE, "width")
+
+    def test_column_view_blocks_growth(self):
+        """Test that a held view keeps the frame from resizing its columns"""
+        frame = ShapeFrame([Circle(1)])
+        view = frame.column(ShapeType.CIRCLE, "radius")
+        with pytest.raises(BufferError):
+            frame.append(Circle(2))
+        view.release()
+        frame.append(Circle(2))
+        assert len(frame) == 2
+
+    def test_code_view_leaves_frame_unchanged(self):
+        """Test that an append blocked by a held view does not leave a partial row"""
+        frame = ShapeFrame([Circle(1)])
+        with frame.code_view():
+            with pytest.raises(BufferError):
+                frame.append(Circle(2))
+        assert len(frame) == 1
+        assert frame.columns(ShapeType.CIRCLE) == (array("d", [1.0]),)
+        frame.append(Circle(2))
+        assert frame[1] == Circle(2)
+
+    def test_columns_are_copies(self):
+        """Test that changing a returned column leaves the frame untouched"""
+        frame = ShapeFrame([Circle(1)])
+        (radii,) = frame.columns(ShapeType.CIRCLE)
+        radii[0] = 9.0
+        assert frame[0] == Circle(1)
+
+
+class TestShapeFrameMetrics:
+    """Test metrics evaluated per type group"""
+
+    @pytest.mark.parametrize("metric", ["area", "perimeter", "circumradius", "inradius"])
+    def test_metrics_match_methods(self, metric):
+        """Test that kernels agree with the scalar methods"""
+        shapes = [s for s in mixed_shapes() if not isinstance(s, Circle)]
+        values = ShapeFrame(shapes).metric(metric)
+        for shape, value in zip(shapes, values):
+            assert math.isclose(value, getattr(shape, metric)())
+
+    @pytest.mark.parametrize("metric", ["angle_a", "angle_b", "angle_c"])
+    def test_angles_match_methods(self, metric):
+        """Test that angle kernels agree with the scalar methods"""
+        shapes = [RightTriangle(3, 4), AcuteTriangle(5, 6, 7), ObtuseTriangle(3, 4, 6)]
+        values = ShapeFrame(shapes).metric(metric)
+        for shape, value in zip(shapes, values):
+            assert math.isclose(value, getattr(shape, metric)())
+
+    def test_area_all_types(self):
+        """Test area across every type"""
+        shapes = mixed_shapes()
+        values = ShapeFrame(shapes).metric("area")
+        assert [round(v, 9) for v in values] == [round(s.area(), 9) for s in shapes]
+
+    def test_fallback_to_scalar_method(self):
+        """Test metrics without a kernel are evaluated with the shape methods"""
+        frame = ShapeFrame([RightTriangle(3, 4), RightTriangle(6, 8)])
+        assert list(frame.metric("altitude")) == [2.4, 4.8]
+
+    def test_undefined_metric(self):
+        """Test that a metric missing for a present type raises ValueError"""
+        frame = ShapeFrame([Circle(1), Square(1)])
+        with pytest.raises(ValueError):
+            frame.metric("perimeter")
+
+    def test_private_metric_rejected(self):
+        """Test that private attributes cannot be used as metrics"""
+        with pytest.raises(ValueError):
+            ShapeFrame([Circle(1)]).metric("__init__")
+
+    def test_group_metric(self):
+        """Test that group results are keyed by type"""
+        frame = ShapeFrame([Circle(1), Square(2), Circle(3)])
+        groups = frame.group_metric("area")
+        assert list(groups[ShapeType.SQUARE]) == [4.0]
+        assert len(groups[ShapeType.CIRCLE]) == 2
+
+
+class TestShapeFrameOrdering:
+    """Test ordering across shape types"""
+
+    def test_sort_by_area(self):
+        """Test mixed shapes can be ordered by area"""
+        frame = ShapeFrame([Square(10), Circle(1), RightTriangle(3, 4), Rectangle(2, 5)])
+        ordered = frame.sort_by("area")
+        areas = list(ordered.metric("area"))
+        assert areas == sorted(areas)
+        assert isinstance(ordered[0], Circle)
+        assert isinstance(ordered[-1], Square)
+
+    def test_argsort_reverse(self):
+        """Test descending order"""
+        frame = ShapeFrame([Circle(1), Square(10), Rectangle(2, 5)])
+        assert frame.argsort("area", reverse=True) == [1, 2, 0]
+
+    def test_take(self):
+        """Test selecting rows into a new frame"""
+        frame = ShapeFrame(mixed_shapes())
+        subset = frame.take([4, 0])
+        assert len(subset) == 2
+        assert subset[0] == AcuteTriangle(5, 6, 7)
+        assert subset[1] == Circle(2)
+
+
+class TestShapeFrameStringRepresentation:
+    """Test string representations"""
+
+    def test_str(self):
+        """Test str of a frame"""
+        frame = ShapeFrame([Circle(1), Circle(2), Square(1)])
+        assert str(frame) == "ShapeFrame(CIRCLE=2, SQUARE=1)"
+
+    def test_repr(self):
+        """Test repr of a frame"""
+        assert repr(ShapeFrame([Circle(1)])) == "rows=1"
@@ -0,0 +1,5 @@
+"""Generate module"""
+
+from .generate import ShapeGenerator
+
+__all__ = ["ShapeGenerator"]
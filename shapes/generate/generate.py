@@ -0,0 +1,153 @@
+"""Module to generate valid random shapes for tests and benchmarks"""
+
+import math
+import random
+from array import array
+from collections import Counter
+from collections.abc import Iterator, Mapping
+
+from shapes.frame import ShapeFrame, ShapeType
+from shapes.frame.frame import build_shape
+
+# Smallest angle, in radians, of a generated triangle; keeps every generated triangle
+# clear of the degenerate and right-angle boundaries checked by the constructors
+_MIN_ANGLE = 0.01
+
+
+class ShapeGenerator:
+    """Seedable generator of valid random shapes, as columns or as objects"""
+
+    def __init__(
+        self,
+        seed: int | str | None = None,
+        stream: int = 0,
+        low: int | float = 1.0,
+        high: int | float = 10.0,
+        log_uniform: bool = False,
+        weights: Mapping[ShapeType, float] | None = None,
+    ) -> None:
+        """Initialize the ShapeGenerator
+        Args:
+            seed: seed shared by every worker of a job; None seeds from the system
+            stream: index of this worker's independent stream of shapes
+            low: smallest size; a radius, a side, or the longest side of a triangle
+            high: largest size
+            log_uniform: draw sizes uniformly in log space instead of linearly
+            weights: relative frequency of each shape type in mixed output
+        Raises:
+            ValueError: if the size range or the weights are invalid
+        """
+        if not 0 < low <= high:
+            raise ValueError("Sizes must satisfy 0 < low <= high")
+        if weights is None:
+            weights = dict.fromkeys(ShapeType, 1.0)
+        if not weights or any(weight < 0 for weight in weights.values()):
+            raise ValueError("Weights must be non-negative")
+        if sum(weights.values()) <= 0:
+            raise ValueError("At least one weight must be positive")
+        self._seed: int | str | None = seed
+        self._stream: int = stream
+        self._low: float = float(low)
+        self._high: float = float(high)
+        self._log_uniform: bool = log_uniform
+        self._weights: dict[ShapeType, float] = {
+            ShapeType(code): float(weight) for code, weight in weights.items()
+        }
+        # String seeds are hashed with SHA-512, so streams agree across processes
+        self._random: random.Random = random.Random(
+            None if seed is None else f"{seed}/{stream}"
+        )
+
+    def spawn(self, stream: int) -> "ShapeGenerator":
+        """Create a generator with the same settings on another independent stream"""
+        return ShapeGenerator(
+            self._seed, stream, self._low, self._high, self._log_uniform, self._weights
+        )
+
+    def _size(self) -> float:
+        """Draw a size from the configured distribution"""
+        if self._log_uniform:
+            return math.exp(self._random.uniform(math.log(self._low), math.log(self._high)))
+        return self._random.uniform(self._low, self._high)
+
+    def _sides(self, angles: list[float]) -> tuple[float, float, float]:
+        """Turn angles into sides in a random order, scaling the longest side to a drawn size"""
+        self._random.shuffle(angles)
+        sines = [math.sin(angle) for angle in angles]
+        scale = self._size() / max(sines)
+        return (sines[0] * scale, sines[1] * scale, sines[2] * scale)
+
+    def _acute_angles(self) -> list[float]:
+        """Draw three angles, each between _MIN_ANGLE and a right angle less _MIN_ANGLE"""
+        upper = math.pi / 2 - _MIN_ANGLE
+        a = self._random.uniform(2 * _MIN_ANGLE, upper)
+        b = self._random.uniform(max(_MIN_ANGLE, math.pi / 2 + _MIN_ANGLE - a), upper)
+        return [a, b, math.pi - a - b]
+
+    def _obtuse_angles(self) -> list[float]:
+        """Draw one obtuse angle and two angles of at least _MIN_ANGLE"""
+        c = self._random.uniform(math.pi / 2 + _MIN_ANGLE, math.pi - 2 * _MIN_ANGLE)
+        a = self._random.uniform(_MIN_ANGLE, math.pi - c - _MIN_ANGLE)
+        return [a, math.pi - c - a, c]
+
+    def dimensions(self, code: ShapeType) -> tuple[float, ...]:
+        """Draw the dimension values of one valid shape of a type, in ShapeFrame layout order"""
+        if code is ShapeType.CIRCLE or code is ShapeType.SQUARE:
+            return (self._size(),)
+        if code is ShapeType.RECTANGLE:
+            return (self._size(), self._size())
+        if code is ShapeType.RIGHT_TRIANGLE:
+            a, b = self._size(), self._size()
+            return (a, b, math.sqrt(a**2 + b**2))
+        if code is ShapeType.ACUTE_TRIANGLE:
+            return self._sides(self._acute_angles())
+        return self._sides(self._obtuse_angles())
+
+    def columns(self, code: ShapeType, count: int) -> tuple[array, ...]:
+        """Draw the dimension columns of count shapes of one type
+        Args:
+            code: shape type to generate
+            count: number of rows
+        Returns:
+            one array of doubles per dimension, in ShapeFrame layout order
+        """
+        code = ShapeType(code)
+        if code in (ShapeType.CIRCLE, ShapeType.SQUARE, ShapeType.RECTANGLE):
+            size = self._size
+            return tuple(
+                array("d", [size() for _ in range(count)]) for _ in ShapeFrame.layout(code)
+            )
+        columns = tuple(array("d") for _ in ShapeFrame.layout(code))
+        for _ in range(count):
+            for column, value in zip(columns, self.dimensions(code)):
+                column.append(value)
+        return columns
+
+    def frame(self, count: int) -> ShapeFrame:
+        """Generate a ShapeFrame of count shapes mixed according to the weights
+        Note:
+            Rows are written one type group at a time, without building shape objects.
+        """
+        codes = list(self._weights)
+        drawn = Counter(self._random.choices(codes, list(self._weights.values()), k=count))
+        frame = ShapeFrame()
+        for code in codes:
+            if drawn[code]:
+                frame.extend_columns(code, *self.columns(code, drawn[code]))
+        return frame
+
+    def shapes(self, count: int) -> Iterator[object]:
+        """Lazily generate count shape objects mixed according to the weights"""
+        codes = list(self._weights)
+        weights = list(self._weights.values())
+        for _ in range(count):
+            code = self._random.choices(codes, weights)[0]
+            yield build_shape(code, self.dimensions(code))
+
+    def __str__(self) -> str:
+        """String representation of the ShapeGenerator"""
+        return f"ShapeGenerator(seed={self._seed}, stream={self._stream})"
+
+    def __repr__(self) -> str:
+        """String representation of the ShapeGenerator"""
+        return f"seed={self._seed}, stream={self._stream}"
@@ -0,0 +1 @@
+"""Tests for Generate package"""
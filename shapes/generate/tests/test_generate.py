@@ -0,0 +1,126 @@
+"""Test cases for the ShapeGenerator class"""
+
+import math
+
+import pytest
+
+from shapes import (
+    AcuteTriangle,
+    Circle,
+    ObtuseTriangle,
+    Rectangle,
+    RightTriangle,
+    ShapeFrame,
+    ShapeType,
+    Square,
+)
+from shapes.generate import ShapeGenerator
+
+
+class TestShapeGeneratorValidity:
+    """Test that generated shapes pass the constructors"""
+
+    @pytest.mark.parametrize(
+        "code, cls",
+        [
+            (ShapeType.ACUTE_TRIANGLE, AcuteTriangle),
+            (ShapeType.OBTUSE_TRIANGLE, ObtuseTriangle),
+        ],
+    )
+    def test_triangles_are_valid(self, code, cls):
+        """Test that generated triangle sides satisfy the constructor checks"""
+        generator = ShapeGenerator(seed=1, low=0.001, high=1000, log_uniform=True)
+        a, b, c = generator.columns(code, 5000)
+        for sides in zip(a, b, c):
+            cls(*sides)
+
+    def test_right_triangles(self):
+        """Test that right triangle hypotenuses match the constructor"""
+        a, b, c = ShapeGenerator(seed=1).columns(ShapeType.RIGHT_TRIANGLE, 100)
+        for x, y, z in zip(a, b, c):
+            assert RightTriangle(x, y).c == z
+
+    def test_sizes_within_range(self):
+        """Test that sizes respect the configured range"""
+        (radii,) = ShapeGenerator(seed=1, low=2, high=3).columns(ShapeType.CIRCLE, 1000)
+        assert all(2 <= radius <= 3 for radius in radii)
+
+    def test_triangle_longest_side_within_range(self):
+        """Test that triangle sizes refer to the longest side"""
+        a, b, c = ShapeGenerator(seed=1, low=2, high=3).columns(ShapeType.OBTUSE_TRIANGLE, 1000)
+        assert all(2 <= max(sides) <= 3 + 1e-9 for sides in zip(a, b, c))
+
+    def test_shapes_lazily(self):
+        """Test that objects are generated lazily and all are valid"""
+        shapes = ShapeGenerator(seed=3).shapes(600)
+        assert not isinstance(shapes, list)
+        kinds = {type(shape) for shape in shapes}
+        assert kinds == {Circle, Rectangle, Square, RightTriangle, AcuteTriangle, ObtuseTriangle}
+
+
+class TestShapeGeneratorDistribution:
+    """Test the mix of generated types"""
+
+    def test_frame_counts(self):
+        """Test that a frame holds the requested number of rows"""
+        frame = ShapeGenerator(seed=1).frame(6000)
+        assert isinstance(frame, ShapeFrame)
+        assert len(frame) == 6000
+        assert all(800 < count < 1200 for count in frame.counts().values())
+
+    def test_weights(self):
+        """Test that weights select the generated types"""
+        generator = ShapeGenerator(seed=1, weights={ShapeType.CIRCLE: 1, ShapeType.SQUARE: 0})
+        assert generator.frame(100).counts() == {ShapeType.CIRCLE: 100}
+
+    def test_log_uniform(self):
+        """Test that log-uniform sizes spread across magnitudes"""
+        generator = ShapeGenerator(seed=1, low=1, high=1e6, log_uniform=True)
+        (sides,) = generator.columns(ShapeType.SQUARE, 3000)
+        below = sum(1 for side in sides if side < 1e3)
+        assert 1200 < below < 1800
+
+    def test_invalid_range(self):
+        """Test that an invalid size range raises ValueError"""
+        with pytest.raises(ValueError):
+            ShapeGenerator(low=0)
+        with pytest.raises(ValueError):
+            ShapeGenerator(low=5, high=1)
+
+    def test_invalid_weights(self):
+        """Test that invalid weights raise ValueError"""
+        with pytest.raises(ValueError):
+            ShapeGenerator(weights={ShapeType.CIRCLE: -1})
+        with pytest.raises(ValueError):
+            ShapeGenerator(weights={ShapeType.CIRCLE: 0})
+
+
+class TestShapeGeneratorReproducibility:
+    """Test seeding and worker streams"""
+
+    def test_same_seed_same_shapes(self):
+        """Test that equal seeds give equal output"""
+        first = ShapeGenerator(seed=42).frame(500)
+        second = ShapeGenerator(seed=42).frame(500)
+        assert list(first.metric("area")) == list(second.metric("area"))
+
+    def test_streams_differ(self):
+        """Test that worker streams are independent"""
+        first = ShapeGenerator(seed=42, stream=0).columns(ShapeType.CIRCLE, 10)
+        second = ShapeGenerator(seed=42, stream=1).columns(ShapeType.CIRCLE, 10)
+        assert first != second
+
+    def test_spawn(self):
+        """Test that spawned generators match explicitly created ones"""
+        spawned = ShapeGenerator(seed=7, low=2, high=4).spawn(3)
+        explicit = ShapeGenerator(seed=7, stream=3, low=2, high=4)
+        assert spawned.columns(ShapeType.SQUARE, 5) == explicit.columns(ShapeType.SQUARE, 5)
+
+    def test_known_value(self):
+        """Test that output does not depend on the process hash seed"""
+        (radii,) = ShapeGenerator(seed=1, low=1, high=2).columns(ShapeType.CIRCLE, 1)
+        assert math.isclose(radii[0], 1.9064717269000477)
+
+    def test_str(self):
+        """Test str of a generator"""
+        assert str(ShapeGenerator(seed=1, stream=2)) == "ShapeGenerator(seed=1, stream=2)"
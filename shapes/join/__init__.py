@@ -0,0 +1,5 @@
+"""Join module"""
+
+from .join import join, join_key, merge_join
+
+__all__ = ["join", "join_key", "merge_join"]
@@ -0,0 +1,212 @@
+"""Module to join two collections of shapes on the approximate equality used by __eq__"""
+
+import math
+from collections import deque
+from collections.abc import Iterable, Iterator
+from itertools import product
+
+from shapes.circle import Circle
+from shapes.rectangle import Rectangle
+from shapes.triangle import Triangle
+
+# Relative tolerance of the math.isclose calls in every shape's __eq__
+_REL_TOL = 1e-9
+
+# Largest difference in the logarithm of a dimension between matches, with a margin for rounding
+_LOG_TOL = 2 * _REL_TOL
+
+# Width of the logarithmic grid cells that bucket shapes by their compared dimensions
+_CELL = 2 * _LOG_TOL
+
+# Join kinds understood by join and merge_join
+_HOW: tuple[str, ...] = ("inner", "left", "anti")
+
+# Families that can be compared with ==, keyed by the base class
+_FAMILIES: tuple[tuple[type, str], ...] = (
+    (Circle, "circle"),
+    (Rectangle, "rectangle"),
+    (Triangle, "triangle"),
+)
+
+JoinKey = tuple[str, float]
+
+Cell = tuple
+
+
+def _dimensions(shape: object) -> tuple[str, tuple[float, ...]]:
+    """Get the family of a shape and the dimensions its __eq__ compares
+    Raises:
+        TypeError: if the shape is not a Circle, Rectangle or Triangle
+    """
+    for cls, family in _FAMILIES:
+        if isinstance(shape, cls):
+            break
+    else:
+        raise TypeError(f"Cannot join shapes of type {type(shape).__name__}")
+    if family == "circle":
+        return family, (shape.radius(),)  # type: ignore[attr-defined]
+    if family == "rectangle":
+        return family, (shape.width(), shape.height())  # type: ignore[attr-defined]
+    return family, (shape.a, shape.b, shape.c)  # type: ignore[attr-defined]
+
+
+def join_key(shape: object) -> JoinKey:
+    """Get the family of a shape and the first dimension its __eq__ compares
+    Returns:
+        ("circle", radius), ("rectangle", width) or ("triangle", a); sort both inputs of
+        merge_join by this key
+    Raises:
+        TypeError: if the shape is not a Circle, Rectangle or Triangle
+    """
+    family, dimensions = _dimensions(shape)
+    return (family, dimensions[0])
+
+
+def _bounds(key: JoinKey) -> tuple[JoinKey, JoinKey]:
+    """Get keys that bracket every key math.isclose could match, with a margin for rounding"""
+    family, value = key
+    spread = 2 * _REL_TOL * abs(value)
+    return (family, value - spread), (family, value + spread)
+
+
+def _position(value: float, offset: float = 0.0) -> float:
+    """Get the grid position of a dimension shifted by an offset in log space
+    Note:
+        Infinite and NaN dimensions have no logarithm and are bucketed by their value; == then
+        decides as usual.
+    """
+    if 0 < value < math.inf:
+        return math.floor((math.log(value) + offset) / _CELL)
+    return value
+
+
+def _cell(family: str, dimensions: tuple[float, ...]) -> Cell:
+    """Get the grid cell a shape is looked up in"""
+    return (family, *map(_position, dimensions))
+
+
+def _cells(family: str, dimensions: tuple[float, ...]) -> Iterator[Cell]:
+    """Get every grid cell the tolerance box of a shape overlaps, at most two per dimension"""
+    reach = [{_position(value, -_LOG_TOL), _position(value, _LOG_TOL)} for value in dimensions]
+    for cell in product(*reach):
+        yield (family, *cell)
+
+
+def _check_how(how: str) -> None:
+    """Check the kind of join
+    Raises:
+        ValueError: if the kind is not inner, left or anti
+    """
+    if how not in _HOW:
+        raise ValueError(f"Unknown join '{how}'; joins are {_HOW}")
+
+
+def _emit(shape: object, matches: list[object], how: str) -> Iterator[object]:
+    """Yield the output of one left shape for a kind of join"""
+    if how == "anti":
+        if not matches:
+            yield shape
+    elif matches:
+        for match in matches:
+            yield (shape, match)
+    elif how == "left":
+        yield (shape, None)
+
+
+def join(left: Iterable[object], right: Iterable[object], how: str = "inner") -> Iterator[object]:
+    """Match shapes from left with equal shapes from right
+    Args:
+        left: shapes streamed one at a time, in any order and of any size
+        right: shapes held in memory, in any order
+        how: "inner" yields every (left, right) pair that compares equal; "left" also yields
+            (left, None) for unmatched left shapes; "anti" yields only the unmatched left shapes
+    Raises:
+        ValueError: if how is not inner, left or anti
+        TypeError: if a shape is not a Circle, Rectangle or Triangle
+    Note:
+        Right shapes are bucketed in a grid over the logarithms of their compared dimensions,
+        so each left shape reads one bucket. Candidates are then confirmed with ==, so matches
+        follow __eq__ exactly, including its math.isclose tolerance and the positions of
+        positioned shapes. Shapes only match within a family; a Square matches an equal
+        Rectangle as it does with ==. Matches of a left shape come in right input order.
+    """
+    _check_how(how)
+    buckets: dict[Cell, list[object]] = {}
+    for shape in right:
+        for cell in _cells(*_dimensions(shape)):
+            buckets.setdefault(cell, []).append(shape)
+    return _probe(left, buckets, how)
+
+
+def _probe(
+    left: Iterable[object], buckets: dict[Cell, list[object]], how: str
+) -> Iterator[object]:
+    """Look up every left shape in the bucketed right shapes"""
+    for shape in left:
+        candidates = buckets.get(_cell(*_dimensions(shape)), ())
+        yield from _emit(shape, [other for other in candidates if shape == other], how)
+
+
+def merge_join(
+    left: Iterable[object], right: Iterable[object], how: str = "inner"
+) -> Iterator[object]:
+    """Match shapes from two inputs already sorted by join_key, streaming both
+    Args:
+        left: shapes in ascending join_key order
+        right: shapes in ascending join_key order
+        how: "inner", "left" or "anti", as for join
+    Raises:
+        ValueError: if how is unknown or an input is not sorted by join_key
+        TypeError: if a shape is not a Circle, Rectangle or Triangle
+    Note:
+        Only the right shapes within the tolerance of the current left shape's join_key are
+        held, bucketed as in join, so both inputs can be larger than memory, e.g. generators
+        reading sorted files. Matches of a left shape come in right input order.
+    """
+    _check_how(how)
+    return _merge(left, right, how)
+
+
+def _merge(left: Iterable[object], right: Iterable[object], how: str) -> Iterator[object]:
+    """Walk both sorted inputs, holding the right shapes in the tolerance window of the left"""
+    # Held right shapes in input order, with the cells each one was added to
+    window: deque[tuple[JoinKey, list[Cell]]] = deque()
+    buckets: dict[Cell, deque[object]] = {}
+    others = iter(right)
+    pending: tuple[JoinKey, tuple[str, tuple[float, ...]], object] | None = None
+    last_left: JoinKey | None = None
+    last_right: JoinKey | None = None
+    for shape in left:
+        family, dimensions = _dimensions(shape)
+        key = (family, dimensions[0])
+        if last_left is not None and key < last_left:
+            raise ValueError("Left input is not sorted by join_key")
+        last_left = key
+        low, high = _bounds(key)
+        # Shapes leave in the order they were added, so each is first in all of its buckets
+        while window and window[0][0] < low:
+            for cell in window.popleft()[1]:
+                bucket = buckets[cell]
+                bucket.popleft()
+                if not bucket:
+                    del buckets[cell]
+        while True:
+            if pending is None:
+                other = next(others, None)
+                if other is None:
+                    break
+                described = _dimensions(other)
+                pending = ((described[0], described[1][0]), described, other)
+                if last_right is not None and pending[0] < last_right:
+                    raise ValueError("Right input is not sorted by join_key")
+                last_right = pending[0]
+            if pending[0] > high:
+                break
+            if pending[0] >= low:
+                cells = list(_cells(*pending[1]))
+                for cell in cells:
+                    buckets.setdefault(cell, deque()).append(pending[2])
+                window.append((pending[0], cells))
+            pending = None
+        candidates = buckets.get(_cell(family, dimensions), ())
+        yield from _emit(shape, [other for other in candidates if shape == other], how)
@@ -0,0 +1,165 @@
+"""Test cases for the approximate-equality joins of shape collections"""
+
+import random
+
+import pytest
+
+from shapes import (
+    AcuteTriangle,
+    Circle,
+    PositionedCircle,
+    Rectangle,
+    RightTriangle,
+    Square,
+)
+from shapes.join import join, join_key, merge_join
+
+
+def _catalogue():
+    """Get the supplier and inventory shapes used by the join tests"""
+    supplier = [
+        Circle(2),
+        Rectangle(3, 4),
+        Circle(1 + 1e-12),
+        RightTriangle(3, 4),
+        Circle(5),
+        Square(2),
+    ]
+    inventory = [
+        Rectangle(2, 2),
+        Circle(1),
+        RightTriangle(3, 4),
+        Circle(2 * (1 + 1e-12)),
+        Rectangle(4, 3),
+        Circle(2),
+    ]
+    return supplier, inventory
+
+
+def _same(a, b):
+    """Compare two shapes with == when they are of the same family"""
+    return join_key(a)[0] == join_key(b)[0] and a == b
+
+
+class TestJoinKey:
+    """Test the sort key of the joins"""
+
+    def test_keys(self):
+        """Test the family and first compared dimension of each shape"""
+        assert join_key(Circle(2)) == ("circle", 2)
+        assert join_key(Square(3)) == ("rectangle", 3)
+        assert join_key(Rectangle(3, 4)) == ("rectangle", 3)
+        assert join_key(AcuteTriangle(4, 5, 6)) == ("triangle", 4)
+
+    def test_unsupported_shape(self):
+        """Test that objects that are not shapes raise TypeError"""
+        with pytest.raises(TypeError):
+            join_key("circle")
+
+
+class TestJoin:
+    """Test the join of a streamed input against an indexed one"""
+
+    def test_inner(self):
+        """Test that every equal pair is found, in the order of the left input"""
+        supplier, inventory = _catalogue()
+        pairs = list(join(supplier, inventory))
+        assert [(str(a), str(b)) for a, b in pairs] == [
+            (str(supplier[0]), str(inventory[3])),
+            (str(supplier[0]), str(inventory[5])),
+            (str(supplier[2]), str(inventory[1])),
+            (str(supplier[3]), str(inventory[2])),
+            (str(supplier[5]), str(inventory[0])),
+        ]
+        assert all(a == b for a, b in pairs)
+
+    def test_left(self):
+        """Test that unmatched left shapes are paired with None"""
+        supplier, inventory = _catalogue()
+        unmatched = [a for a, b in join(supplier, inventory, how="left") if b is None]
+        assert unmatched == [supplier[1], supplier[4]]
+
+    def test_anti(self):
+        """Test that only unmatched left shapes are returned"""
+        supplier, inventory = _catalogue()
+        assert list(join(supplier, inventory, how="anti")) == [supplier[1], supplier[4]]
+        assert list(join(inventory, supplier, how="anti")) == [inventory[4]]
+
+    def test_matches_equality(self):
+        """Test that the join agrees with a nested loop over =="""
+        left = [Circle(1 + i * 5e-10) for i in range(10)]
+        right = [Circle(1 + i * 7e-10) for i in range(10)]
+        expected = [(a, b) for a in left for b in right if a == b]
+        assert list(join(left, right)) == expected
+
+    def test_random_catalogues(self):
+        """Test that both joins agree with a nested loop near the edge of the tolerance"""
+        rng = random.Random(7)
+
+        def jittered(size):
+            """Move a size by about one tolerance either way"""
+            return size * (1 + rng.choice((-1.5, -0.9, 0, 0.9, 1.5)) * 1e-9)
+
+        def shape():
+            """Build a rectangle or an acute triangle with jittered sides"""
+            if rng.random() < 0.5:
+                return Rectangle(jittered(rng.choice((2, 3))), jittered(rng.choice((2, 3))))
+            return AcuteTriangle(*(jittered(side) for side in rng.choice(((4, 5, 6), (5, 4, 6)))))
+
+        left = [shape() for _ in range(80)]
+        right = [shape() for _ in range(80)]
+        expected = [(a, b) for a in left for b in right if _same(a, b)]
+        assert expected
+        assert list(join(left, right)) == expected
+        left, right = sorted(left, key=join_key), sorted(right, key=join_key)
+        expected = [(a, b) for a in left for b in right if _same(a, b)]
+        assert list(merge_join(left, right)) == expected
+
+    def test_positioned_shapes(self):
+        """Test that positioned shapes only match at the same position"""
+        left = [PositionedCircle(1, 0, 0), PositionedCircle(1, 5, 5)]
+        right = [PositionedCircle(1, 5, 5), Circle(1)]
+        pairs = list(join(left, right))
+        expected = [(0, right[1]), (5, right[0]), (5, right[1])]
+        assert [(a.center()[0], b) for a, b in pairs] == expected
+
+    def test_streams_left(self):
+        """Test that the left input is consumed lazily"""
+        joined = join((Circle(i) for i in range(1, 10**9)), [Circle(3)])
+        assert next(joined) == (Circle(3), Circle(3))
+
+    def test_unknown_join(self):
+        """Test that an unknown join raises ValueError before any input is read"""
+        with pytest.raises(ValueError):
+            join([Circle(1)], [Circle(1)], how="outer")
+
+
+class TestMergeJoin:
+    """Test the streaming join of sorted inputs"""
+
+    @pytest.mark.parametrize("how", ["inner", "left", "anti"])
+    def test_same_as_join(self, how):
+        """Test that merge_join matches join on sorted inputs"""
+        supplier, inventory = (sorted(shapes, key=join_key) for shapes in _catalogue())
+        assert list(merge_join(supplier, inventory, how)) == list(join(supplier, inventory, how))
+
+    def test_window(self):
+        """Test that nearly equal shapes on both sides of the left key are matched"""
+        left = [Circle(1 + i * 4e-10) for i in range(20)]
+        right = [Circle(1 + i * 3e-10) for i in range(30)]
+        expected = [(a, b) for a in left for b in right if a == b]
+        assert list(merge_join(left, right)) == expected
+
+    def test_streams_both(self):
+        """Test that both inputs are consumed lazily"""
+        left = (Circle(i) for i in range(1, 10**9))
+        right = (Circle(2 * i) for i in range(1, 10**9))
+        joined = merge_join(left, right)
+        assert [a.radius() for a, _ in (next(joined), next(joined))] == [2, 4]
+
+    def test_unsorted_input(self):
+        """Test that inputs out of join_key order raise ValueError"""
+        with pytest.raises(ValueError):
+            list(merge_join([Circle(2), Circle(1)], [Circle(1)]))
+        with pytest.raises(ValueError):
+            list(merge_join([Circle(1), Circle(3)], [Circle(2), Circle(1), Circle(3)]))
@@ -0,0 +1,5 @@
+"""Mesh module"""
+
+from .mesh import TriangleMesh
+
+__all__ = ["TriangleMesh"]
@@ -0,0 +1,218 @@
+"""Module to evaluate triangle meshes given as shared vertex and index buffers"""
+
+import math
+from array import array
+from collections.abc import Sequence
+
+from shapes.frame import ShapeFrame, ShapeType
+from shapes.triangle import (
+    AcuteTriangle,
+    ObtuseTriangle,
+    PositionedTriangle,
+    RightTriangle,
+    classify_triangle,
+)
+
+_CODES: dict[type, ShapeType] = {
+    RightTriangle: ShapeType.RIGHT_TRIANGLE,
+    AcuteTriangle: ShapeType.ACUTE_TRIANGLE,
+    ObtuseTriangle: ShapeType.OBTUSE_TRIANGLE,
+}
+
+
+def _opposite(x2: Sequence[float], y2: Sequence[float], z2: Sequence[float]) -> array:
+    """Law of cosines over squared side columns for the angle opposite side z"""
+    sqrt = math.sqrt
+    cosines = [
+        (p + q - r) / (2 * sqrt(p * q)) if p and q else 1.0 for p, q, r in zip(x2, y2, z2)
+    ]
+    # Clamp cosines that rounding pushed just outside [-1, 1]
+    return array("d", map(math.acos, [min(max(cos, -1.0), 1.0) for cos in cosines]))
+
+
+class TriangleMesh:
+    """Triangles sharing a vertex buffer, evaluated in bulk without a shape object per triangle"""
+
+    def __init__(self, vertices: Sequence[float], indices: Sequence[int]) -> None:
+        """Initialize the TriangleMesh
+        Args:
+            vertices: flat vertex coordinates x0, y0, x1, y1, ...
+            indices: flat vertex indices, three per triangle; the vertices of a triangle are
+                opposite its sides a, b and c, in that order
+        Raises:
+            ValueError: if the buffers have the wrong length or an index is out of range
+        """
+        if len(vertices) % 2:
+            raise ValueError("Vertex buffer must hold an x and a y for every vertex")
+        if len(indices) % 3:
+            raise ValueError("Index buffer must hold three indices for every triangle")
+        self._vertices: array = array("d", vertices)
+        self._indices: array = array("q", indices)
+        count = len(self._vertices) // 2
+        if self._indices and (min(self._indices) < 0 or max(self._indices) >= count):
+            raise ValueError(f"Vertex indices must be between 0 and {count - 1}")
+        self._geometry: tuple[tuple[array, array, array], array] | None = None
+
+    def vertex_count(self) -> int:
+        """Get the number of vertices"""
+        return len(self._vertices) // 2
+
+    def __len__(self) -> int:
+        """Number of triangles in the mesh"""
+        return len(self._indices) // 3
+
+    def vertices(self) -> memoryview:
+        """Get a zero-copy, read-only view of the flat vertex coordinates as doubles"""
+        return memoryview(self._vertices).toreadonly()
+
+    def indices(self) -> memoryview:
+        """Get a zero-copy, read-only view of the flat vertex indices as signed 64-bit integers"""
+        return memoryview(self._indices).toreadonly()
+
+    def _corners(self) -> tuple[list[float], ...]:
+        """Gather the x and y coordinates of the three vertices of every triangle"""
+        xs, ys = self._vertices[0::2], self._vertices[1::2]
+        corners = []
+        for vertex in range(3):
+            column = self._indices[vertex::3]
+            corners.append([xs[index] for index in column])
+            corners.append([ys[index] for index in column])
+        return tuple(corners)
+
+    def _squares_and_crosses(self) -> tuple[tuple[array, array, array], array]:
+        """Compute, once, the squared side lengths and the doubled signed area of every triangle"""
+        if self._geometry is None:
+            x1, y1, x2, y2, x3, y3 = self._corners()
+            # Squared lengths come straight from the coordinates, so integer meshes classify
+            # exactly instead of through rounded square roots
+            squares = (
+                array("d", [(p - q) ** 2 + (r - s) ** 2 for p, q, r, s in zip(x2, x3, y2, y3)]),
+                array("d", [(p - q) ** 2 + (r - s) ** 2 for p, q, r, s in zip(x1, x3, y1, y3)]),
+                array("d", [(p - q) ** 2 + (r - s) ** 2 for p, q, r, s in zip(x1, x2, y1, y2)]),
+            )
+            crosses = array(
+                "d",
+                [
+                    (bx - ax) * (cy - ay) - (by - ay) * (cx - ax)
+                    for ax, ay, bx, by, cx, cy in zip(x1, y1, x2, y2, x3, y3)
+                ],
+            )
+            self._geometry = (squares, crosses)
+        return self._geometry
+
+    def sides(self) -> tuple[array, array, array]:
+        """Get the side lengths a, b and c of every triangle"""
+        a2, b2, c2 = self._squares_and_crosses()[0]
+        return (
+            array("d", map(math.sqrt, a2)),
+            array("d", map(math.sqrt, b2)),
+            array("d", map(math.sqrt, c2)),
+        )
+
+    def areas(self) -> array:
+        """Calculate the area of every triangle with the shoelace formula"""
+        return array("d", [abs(cross) / 2 for cross in self._squares_and_crosses()[1]])
+
+    def orientations(self) -> array:
+        """Get 1 for counterclockwise, -1 for clockwise and 0 for degenerate triangles"""
+        crosses = self._squares_and_crosses()[1]
+        return array("b", [(cross > 0) - (cross < 0) for cross in crosses])
+
+    def degenerate(self) -> list[int]:
+        """Get the indices of the triangles whose vertices are collinear"""
+        crosses = self._squares_and_crosses()[1]
+        return [number for number, cross in enumerate(crosses) if cross == 0]
+
+    def perimeters(self) -> array:
+        """Calculate the perimeter of every triangle"""
+        a, b, c = self.sides()
+        return array("d", [x + y + z for x, y, z in zip(a, b, c)])
+
+    def angles(self) -> tuple[array, array, array]:
+        """Calculate the angles at the three vertices of every triangle, in radians
+        Returns:
+            angles A, B and C, opposite sides a, b and c
+        """
+        a2, b2, c2 = self._squares_and_crosses()[0]
+        return (_opposite(b2, c2, a2), _opposite(a2, c2, b2), _opposite(a2, b2, c2))
+
+    def circumradii(self) -> array:
+        """Calculate the circumradius of every triangle, infinite for degenerate triangles"""
+        a, b, c = self.sides()
+        crosses = self._squares_and_crosses()[1]
+        return array(
+            "d",
+            [
+                x * y * z / (2 * abs(cross)) if cross else math.inf
+                for x, y, z, cross in zip(a, b, c, crosses)
+            ],
+        )
+
+    def inradii(self) -> array:
+        """Calculate the inradius of every triangle, 0 for degenerate triangles"""
+        a, b, c = self.sides()
+        crosses = self._squares_and_crosses()[1]
+        return array(
+            "d",
+            [abs(cross) / (x + y + z) if cross else 0.0 for x, y, z, cross in zip(a, b, c, crosses)],
+        )
+
+    def classify(self) -> array:
+        """Classify every triangle with the rules of the Triangle subclass constructors
+        Returns:
+            ShapeType code of every triangle: RIGHT_TRIANGLE, ACUTE_TRIANGLE or OBTUSE_TRIANGLE
+        Raises:
+            ValueError: if a triangle is degenerate
+        """
+        degenerate = self.degenerate()
+        if degenerate:
+            raise ValueError(f"Triangle {degenerate[0]} has collinear vertices")
+        a2, b2, c2 = self._squares_and_crosses()[0]
+        return array("B", [_CODES[classify_triangle(*sq)] for sq in zip(a2, b2, c2)])
+
+    def triangle(self, index: int) -> PositionedTriangle:
+        """Create the PositionedTriangle for one triangle of the mesh
+        Raises:
+            IndexError: if index is out of range
+            ValueError: if the triangle is degenerate
+        """
+        corners = self._indices[3 * index : 3 * index + 3]
+        if len(corners) != 3:
+            raise IndexError("Triangle index out of range")
+        vertices = self._vertices
+        return PositionedTriangle(*((vertices[2 * i], vertices[2 * i + 1]) for i in corners))
+
+    def to_frame(self) -> ShapeFrame:
+        """Create a ShapeFrame with one row per triangle, in mesh order
+        Note:
+            Right triangles have their sides reordered so that c is the hypotenuse, as the
+            ShapeFrame layout requires; other triangles keep the side order of the mesh.
+        Raises:
+            ValueError: if a triangle is degenerate
+        """
+        codes = self.classify()
+        a, b, c = self.sides()
+        frame = ShapeFrame()
+        order: list[int] = []
+        for code in map(ShapeType, sorted(set(codes))):
+            numbers = [number for number, value in enumerate(codes) if value == code]
+            if code is ShapeType.RIGHT_TRIANGLE:
+                triples = [sorted((a[n], b[n], c[n])) for n in numbers]
+                frame.extend_columns(code, *([triple[i] for triple in triples] for i in range(3)))
+            else:
+                frame.extend_columns(code, *([column[n] for n in numbers] for column in (a, b, c)))
+            order.extend(numbers)
+        if len(order) == len(frame) and all(number == row for row, number in enumerate(order)):
+            return frame
+        rows = [0] * len(order)
+        for row, number in enumerate(order):
+            rows[number] = row
+        return frame.take(rows)
+
+    def __str__(self) -> str:
+        """String representation of the TriangleMesh"""
+        return f"TriangleMesh(vertices={self.vertex_count()}, triangles={len(self)})"
+
+    def __repr__(self) -> str:
+        """String representation of the TriangleMesh"""
+        return f"vertices={self.vertex_count()}, triangles={len(self)}"
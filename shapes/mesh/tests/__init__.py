@@ -0,0 +1 @@
+"""Tests for Mesh package"""
@@ -0,0 +1,123 @@
+"""Tests for the Mesh module"""
+
+import math
+import random
+
+import pytest
+
+from shapes.frame import ShapeType
+from shapes.frame.frame import shape_type
+from shapes.mesh import TriangleMesh
+from shapes.triangle import PositionedTriangle
+
+# A right, an acute and an obtuse triangle sharing vertices
+VERTICES = [0, 0, 4, 0, 0, 3, 2, 5, 9, 1]
+INDICES = [0, 1, 2, 1, 3, 2, 0, 4, 1]
+
+
+def random_mesh(count, seed=1):
+    """Build a mesh of random triangles over a shared set of random vertices"""
+    rng = random.Random(seed)
+    vertices = [rng.uniform(-10, 10) for _ in range(200)]
+    indices = []
+    while len(indices) < 3 * count:
+        corners = rng.sample(range(100), 3)
+        indices.extend(corners)
+    return TriangleMesh(vertices, indices)
+
+
+class TestTriangleMesh:
+    """Test bulk evaluation of triangle meshes"""
+
+    def test_counts(self):
+        """Test the vertex and triangle counts"""
+        mesh = TriangleMesh(VERTICES, INDICES)
+        assert mesh.vertex_count() == 5
+        assert len(mesh) == 3
+        assert str(mesh) == "TriangleMesh(vertices=5, triangles=3)"
+
+    def test_buffer_views(self):
+        """Test reading the vertex and index buffers without copying them"""
+        mesh = TriangleMesh(VERTICES, INDICES)
+        assert mesh.vertices().format == "d"
+        assert mesh.vertices().tolist() == [float(value) for value in VERTICES]
+        assert mesh.indices().tolist() == INDICES
+        assert mesh.indices().readonly
+
+    def test_sides_and_area(self):
+        """Test sides and shoelace area of a 3-4-5 triangle"""
+        mesh = TriangleMesh(VERTICES, INDICES)
+        a, b, c = mesh.sides()
+        assert (a[0], b[0], c[0]) == (5, 3, 4)
+        assert mesh.areas()[0] == 6
+        assert mesh.perimeters()[0] == 12
+        assert mesh.circumradii()[0] == pytest.approx(2.5)
+        assert mesh.inradii()[0] == pytest.approx(1)
+
+    def test_angles(self):
+        """Test that the angles of every triangle sum to pi"""
+        mesh = TriangleMesh(VERTICES, INDICES)
+        first, second, third = mesh.angles()
+        assert first[0] == pytest.approx(math.pi / 2)
+        for angles in zip(first, second, third):
+            assert sum(angles) == pytest.approx(math.pi)
+
+    def test_classify(self):
+        """Test classification into right, acute and obtuse triangles"""
+        mesh = TriangleMesh(VERTICES, INDICES)
+        assert list(mesh.classify()) == [
+            ShapeType.RIGHT_TRIANGLE,
+            ShapeType.ACUTE_TRIANGLE,
+            ShapeType.OBTUSE_TRIANGLE,
+        ]
+
+    def test_matches_positioned_triangles(self):
+        """Test bulk metrics against PositionedTriangle objects"""
+        mesh = random_mesh(300)
+        areas = mesh.areas()
+        circumradii = mesh.circumradii()
+        inradii = mesh.inradii()
+        angles = mesh.angles()
+        codes = mesh.classify()
+        for index in range(len(mesh)):
+            triangle = mesh.triangle(index)
+            assert isinstance(triangle, PositionedTriangle)
+            assert areas[index] == pytest.approx(triangle.area())
+            assert circumradii[index] == pytest.approx(triangle.circumradius())
+            assert inradii[index] == pytest.approx(triangle.inradius())
+            assert angles[0][index] == pytest.approx(triangle.angle_a())
+            assert angles[2][index] == pytest.approx(triangle.angle_c())
+            assert codes[index] == shape_type(triangle.triangle())
+
+    def test_to_frame(self):
+        """Test that the frame keeps mesh order and puts right triangle hypotenuses in c"""
+        mesh = TriangleMesh(VERTICES, INDICES)
+        frame = mesh.to_frame()
+        assert [frame.type_at(index) for index in range(3)] == list(mesh.classify())
+        assert frame[0].c == 5
+        assert list(frame.metric("area")) == pytest.approx(list(mesh.areas()))
+
+    def test_orientation_and_degenerate(self):
+        """Test orientation signs and detection of collinear triangles"""
+        mesh = TriangleMesh([0, 0, 1, 0, 0, 1, 2, 0], [0, 1, 2, 0, 2, 1, 0, 1, 3])
+        assert list(mesh.orientations()) == [1, -1, 0]
+        assert mesh.degenerate() == [2]
+        assert mesh.circumradii()[2] == math.inf
+        assert mesh.inradii()[2] == 0
+        with pytest.raises(ValueError):
+            mesh.classify()
+
+    def test_invalid_buffers(self):
+        """Test that malformed buffers raise ValueError"""
+        with pytest.raises(ValueError):
+            TriangleMesh([0, 0, 1], [0, 1, 2])
+        with pytest.raises(ValueError):
+            TriangleMesh([0, 0, 1, 0, 0, 1], [0, 1])
+        with pytest.raises(ValueError):
+            TriangleMesh([0, 0, 1, 0, 0, 1], [0, 1, 3])
+
+    def test_triangle_index(self):
+        """Test that an out of range triangle raises IndexError"""
+        mesh = TriangleMesh(VERTICES, INDICES)
+        with pytest.raises(IndexError):
+            mesh.triangle(3)
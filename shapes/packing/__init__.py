@@ -0,0 +1,5 @@
+"""Packing module"""
+
+from .packing import PackingResult, Placement, pack_circles
+
+__all__ = ["PackingResult", "Placement", "pack_circles"]
@@ -0,0 +1,383 @@
+"""Module to pack many circles into a rectangular or circular container"""
+
+import heapq
+import math
+import random
+import time
+from collections.abc import Iterable
+from typing import NamedTuple
+
+from shapes.circle import Circle, PositionedCircle
+from shapes.rectangle import PositionedRectangle, Rectangle
+from shapes.spatial import SpatialHash
+
+# Number of spatial hash columns, lowest front first, tried when placing one circle
+_CANDIDATE_COLUMNS = 6
+
+# Number of evenly spaced x positions tried within each candidate column
+_COLUMN_SAMPLES = 3
+
+# Number of neighbouring pairs tried when refining the position of one unplaced circle
+_FILL_ATTEMPTS = 100
+
+# Relative slack allowed between touching circles, to absorb rounding in touching positions
+_TOLERANCE = 1e-9
+
+
+def _intersect(
+    x1: float, y1: float, d1: float, x2: float, y2: float, d2: float
+) -> list[tuple[float, float]]:
+    """Get the points at distance d1 from (x1, y1) and d2 from (x2, y2)"""
+    dx, dy = x2 - x1, y2 - y1
+    distance = math.hypot(dx, dy)
+    if distance == 0 or distance > d1 + d2 or distance < abs(d1 - d2):
+        return []
+    along = (d1 * d1 - d2 * d2 + distance * distance) / (2 * distance)
+    across = math.sqrt(max(d1 * d1 - along * along, 0.0)) / distance
+    mx, my = x1 + dx * along / distance, y1 + dy * along / distance
+    return [(mx - dy * across, my + dx * across), (mx + dy * across, my - dx * across)]
+
+
+class Placement(NamedTuple):
+    """Position of one packed circle"""
+
+    index: int
+    x: float
+    y: float
+    radius: float
+
+
+class _Container:
+    """Region available to circle centers of a given radius inside a container"""
+
+    def __init__(self, container: Rectangle | Circle) -> None:
+        """Initialize the container region
+        Raises:
+            TypeError: if the container is not a Rectangle or a Circle
+        """
+        if isinstance(container, Rectangle):
+            self.circular: bool = False
+            self.width: float = float(container.width())
+            self.height: float = float(container.height())
+            x, y = container.origin() if isinstance(container, PositionedRectangle) else (0, 0)
+        elif isinstance(container, Circle):
+            self.circular = True
+            self.radius: float = float(container.radius())
+            self.width = self.height = 2 * self.radius
+            cx, cy = container.center() if isinstance(container, PositionedCircle) else (0, 0)
+            x, y = cx - self.radius, cy - self.radius
+        else:
+            raise TypeError("Container must be a Rectangle or a Circle")
+        self.x: float = float(x)
+        self.y: float = float(y)
+        self.area: float = container.area()
+
+    def x_range(self, r: float) -> tuple[float, float] | None:
+        """Get the range of center x positions for a radius, or None if the circle cannot fit"""
+        if self.circular:
+            reach = self.radius - r
+            center = self.x + self.radius
+            return None if reach < 0 else (center - reach, center + reach)
+        if 2 * r > self.width or 2 * r > self.height:
+            return None
+        return (self.x + r, self.x + self.width - r)
+
+    def y_range(self, x: float, r: float) -> tuple[float, float]:
+        """Get the range of center y positions for a radius at a center x position"""
+        if self.circular:
+            dx = x - self.x - self.radius
+            half = math.sqrt(max((self.radius - r) ** 2 - dx * dx, 0.0))
+            center = self.y + self.radius
+            return (center - half, center + half)
+        return (self.y + r, self.y + self.height - r)
+
+    def touching(self, x: float, y: float, distance: float, r: float) -> list[tuple[float, float]]:
+        """Get the centers of circles of a radius touching the wall at a distance from a point"""
+        if self.circular:
+            center = self.radius
+            return _intersect(self.x + center, self.y + center, self.radius - r, x, y, distance)
+        points = []
+        for wall in (self.x + r, self.x + self.width - r):
+            if abs(wall - x) <= distance:
+                offset = math.sqrt(distance * distance - (wall - x) ** 2)
+                points.extend([(wall, y + offset), (wall, y - offset)])
+        for wall in (self.y + r, self.y + self.height - r):
+            if abs(wall - y) <= distance:
+                offset = math.sqrt(distance * distance - (wall - y) ** 2)
+                points.extend([(x + offset, wall), (x - offset, wall)])
+        return points
+
+
+class PackingResult:
+    """Circles placed in a container by pack_circles"""
+
+    def __init__(
+        self, placements: list[Placement], unplaced: list[int], container_area: float
+    ) -> None:
+        """Initialize the PackingResult
+        Args:
+            placements: placed circles in input order
+            unplaced: indices of the circles that did not fit
+            container_area: area of the container
+        """
+        self._placements: list[Placement] = placements
+        self._unplaced: list[int] = unplaced
+        self._container_area: float = container_area
+
+    def placements(self) -> list[Placement]:
+        """Get the placed circles in input order"""
+        return list(self._placements)
+
+    def unplaced(self) -> list[int]:
+        """Get the indices of the circles that did not fit, in input order"""
+        return list(self._unplaced)
+
+    def circles(self) -> list[PositionedCircle]:
+        """Get the placed circles as PositionedCircles, in input order"""
+        return [PositionedCircle(p.radius, p.x, p.y) for p in self._placements]
+
+    def density(self) -> float:
+        """Get the fraction of the container area covered by the placed circles"""
+        covered = math.fsum(math.pi * p.radius**2 for p in self._placements)
+        return covered / self._container_area
+
+    def __len__(self) -> int:
+        """Number of placed circles"""
+        return len(self._placements)
+
+    def __str__(self) -> str:
+        """String representation of the PackingResult"""
+        return (
+            f"PackingResult(placed={len(self._placements)}, unplaced={len(self._unplaced)}, "
+            f"density={self.density():.4f})"
+        )
+
+    def __repr__(self) -> str:
+        """String representation of the PackingResult"""
+        return f"placed={len(self._placements)}, unplaced={len(self._unplaced)}"
+
+
+class _Packer:
+    """Greedy bottom-left packer that drops circles onto the front of those already placed"""
+
+    def __init__(self, container: _Container, max_radius: float) -> None:
+        """Initialize the packer with an empty spatial hash of cells twice the largest radius"""
+        self.container: _Container = container
+        self.max_radius: float = max_radius
+        self.grid: SpatialHash = SpatialHash(2 * max_radius)
+        self.xs: list[float] = []
+        self.ys: list[float] = []
+        self.rs: list[float] = []
+        # Highest occupied row of the hash in each column, so drops start at the front
+        self.column_tops: dict[int, int] = {}
+        # Highest circle top over each column, used to pick where to drop the next circle
+        self.fronts: dict[int, float] = {}
+
+    def place(self, x: float, y: float, r: float) -> None:
+        """Record a placed circle"""
+        key = len(self.xs)
+        self.xs.append(x)
+        self.ys.append(y)
+        self.rs.append(r)
+        self.grid.insert(x, y, key)
+        column, row = self.grid.cell_of(x, y)
+        if row > self.column_tops.get(column, row - 1):
+            self.column_tops[column] = row
+        fronts = self.fronts
+        top = y + r
+        for column in range(self.grid.cell_of(x - r, 0)[0], self.grid.cell_of(x + r, 0)[0] + 1):
+            if top > fronts.get(column, -math.inf):
+                fronts[column] = top
+
+    def drop(self, x: float, r: float, floor: float) -> float:
+        """Find the lowest center y at which a circle dropped at x clears every placed circle"""
+        grid = self.grid
+        size = grid.cell_size()
+        reach = r + self.max_radius
+        first, _ = grid.cell_of(x - reach, 0)
+        last, _ = grid.cell_of(x + reach, 0)
+        columns = range(first, last + 1)
+        tops = [self.column_tops[c] for c in columns if c in self.column_tops]
+        if not tops:
+            return floor
+        xs, ys, rs = self.xs, self.ys, self.rs
+        best = floor
+        # Scan rows from the top of the front down; a row whose centers all lie below
+        # best - reach cannot hold a circle that would lift this one any higher
+        for row in range(max(tops), math.floor(floor / size) - 2, -1):
+            if (row + 1) * size + reach <= best:
+                break
+            for column in columns:
+                for key in grid.cell_items(column, row):
+                    dx = x - xs[key]
+                    contact = r + rs[key]
+                    if -contact < dx < contact:
+                        y = ys[key] + math.sqrt(contact * contact - dx * dx)
+                        if y > best:
+                            best = y
+        return best
+
+    def fits(self, x: float, y: float, r: float) -> bool:
+        """Check that a circle overlaps none of the placed circles"""
+        xs, ys, rs = self.xs, self.ys, self.rs
+        for key in self.grid.near(x, y, r + self.max_radius):
+            contact = (r + rs[key]) * (1 - _TOLERANCE)
+            if (x - xs[key]) ** 2 + (y - ys[key]) ** 2 < contact * contact:
+                return False
+        return True
+
+    def greedy(self, r: float) -> tuple[float, float] | None:
+        """Find the lowest, then leftmost, position on the front for a circle"""
+        container = self.container
+        span = container.x_range(r)
+        if span is None:
+            return None
+        low, high = span
+        size = self.grid.cell_size()
+        first = math.floor(low / size)
+        last = math.floor(high / size)
+        fronts = self.fronts
+
+        def height(column: int) -> float:
+            x = min(max((column + 0.5) * size, low), high)
+            return max(fronts.get(column, -math.inf), container.y_range(x, r)[0])
+
+        # Only the hash columns where the front is lowest are tried
+        columns = heapq.nsmallest(_CANDIDATE_COLUMNS, range(first, last + 1), key=height)
+        best: tuple[float, float] | None = None
+        for column in sorted(columns):
+            left = max(column * size, low)
+            right = min((column + 1) * size, high)
+            lowest = math.inf
+            for step in range(_COLUMN_SAMPLES):
+                x = left + (right - left) * step / (_COLUMN_SAMPLES - 1)
+                floor, ceiling = container.y_range(x, r)
+                y = self.drop(x, r, floor)
+                if y <= ceiling + _TOLERANCE * size:
+                    lowest = min(lowest, y)
+                    if best is None or y < best[1]:
+                        best = (x, y)
+            # The drops show how high the surface under this column really is, including
+            # circles overhanging from its neighbours; a column with no room left for this
+            # circle is closed to the smaller ones after it, which the refinement may still use
+            if lowest - r > fronts.get(column, -math.inf):
+                fronts[column] = lowest - r
+        return None if best is None else self.settle(best[0], best[1], r)
+
+    def settle(self, x: float, y: float, r: float) -> tuple[float, float]:
+        """Move a resting circle to the lowest nearby spot touching two circles or one and a wall"""
+        xs, ys, rs = self.xs, self.ys, self.rs
+        nearby = list(self.grid.near(x, y, r + self.max_radius))
+        candidates = []
+        for number, first in enumerate(nearby):
+            x1, y1, d1 = xs[first], ys[first], rs[first] + r
+            candidates.extend(self.container.touching(x1, y1, d1, r))
+            for second in nearby[number + 1 :]:
+                candidates.extend(_intersect(x1, y1, d1, xs[second], ys[second], rs[second] + r))
+        candidates.sort(key=lambda point: (point[1], point[0]))
+        circles = [(xs[key], ys[key], (rs[key] + r) * (1 - _TOLERANCE)) for key in nearby]
+        for cx, cy in candidates:
+            if (cy, cx) >= (y, x):
+                break
+            # Most candidates lie inside another nearby circle, so those are rejected
+            # before the full check against the spatial hash
+            for ox, oy, contact in circles:
+                if (cx - ox) ** 2 + (cy - oy) ** 2 < contact * contact:
+                    break
+            else:
+                if self.inside(cx, cy, r) and self.fits(cx, cy, r):
+                    return (cx, cy)
+        return (x, y)
+
+    def inside(self, x: float, y: float, r: float) -> bool:
+        """Check that a circle lies inside the container"""
+        span = self.container.x_range(r)
+        slack = _TOLERANCE * self.grid.cell_size()
+        if span is None or not span[0] - slack <= x <= span[1] + slack:
+            return False
+        floor, ceiling = self.container.y_range(min(max(x, span[0]), span[1]), r)
+        return floor - slack <= y <= ceiling + slack
+
+    def fill(self, r: float, rng: random.Random, attempts: int) -> tuple[float, float] | None:
+        """Try positions touching a placed circle and a neighbour or the wall, where holes are"""
+        xs, ys, rs = self.xs, self.ys, self.rs
+        if not xs:
+            return None
+        for _ in range(attempts):
+            first = rng.randrange(len(xs))
+            x1, y1, d1 = xs[first], ys[first], rs[first] + r
+            neighbours = list(self.grid.near(x1, y1, d1 + r + self.max_radius))
+            choice = rng.randrange(len(neighbours) + 1)
+            if choice == len(neighbours):
+                candidates = self.container.touching(x1, y1, d1, r)
+            elif neighbours[choice] == first:
+                continue
+            else:
+                second = neighbours[choice]
+                candidates = _intersect(x1, y1, d1, xs[second], ys[second], rs[second] + r)
+            for x, y in candidates:
+                if self.inside(x, y, r) and self.fits(x, y, r):
+                    return (x, y)
+        return None
+
+
+def pack_circles(
+    circles: Iterable[Circle],
+    container: Rectangle | Circle,
+    time_budget: float | None = None,
+    seed: int | None = None,
+) -> PackingResult:
+    """Pack circles into a container without overlaps
+    Args:
+        circles: circles to place
+        container: a Rectangle, or a Circle; positioned containers place circles in their frame,
+            others have their lower-left corner, or their center for a Circle, at the origin
+        time_budget: seconds to spend after the greedy pass fitting the circles that did not
+            fit into holes between placed ones; None skips the refinement
+        seed: seed for the refinement's random choice of holes
+    Returns:
+        a PackingResult with the placements, the unplaced circles and the density
+    Raises:
+        TypeError: if the container is not a Rectangle or a Circle
+        ValueError: if the time budget is negative
+    Note:
+        Circles are placed largest first. Each one is dropped at a few x positions in the
+        spatial hash columns where the front of placed circles is lowest, and kept where it
+        comes to rest lowest, so a placement only inspects the cells under it.
+    """
+    if time_budget is not None and time_budget < 0:
+        raise ValueError("Time budget must not be negative")
+    region = _Container(container)
+    radii = [float(circle.radius()) for circle in circles]
+    if not radii:
+        return PackingResult([], [], region.area)
+    order = sorted(range(len(radii)), key=lambda index: -radii[index])
+    packer = _Packer(region, radii[order[0]])
+    positions: dict[int, tuple[float, float]] = {}
+    unplaced = []
+    for index in order:
+        position = packer.greedy(radii[index])
+        if position is None:
+            unplaced.append(index)
+        else:
+            positions[index] = position
+            packer.place(position[0], position[1], radii[index])
+    if time_budget and unplaced:
+        rng = random.Random(seed)
+        deadline = time.perf_counter() + time_budget
+        remaining = []
+        for number, index in enumerate(unplaced):
+            if time.perf_counter() >= deadline:
+                remaining.extend(unplaced[number:])
+                break
+            position = packer.fill(radii[index], rng, _FILL_ATTEMPTS)
+            if position is None:
+                remaining.append(index)
+            else:
+                positions[index] = position
+                packer.place(position[0], position[1], radii[index])
+        unplaced = remaining
+    placements = [
+        Placement(index, x, y, radii[index]) for index, (x, y) in sorted(positions.items())
+    ]
+    return PackingResult(placements, sorted(unplaced), region.area)
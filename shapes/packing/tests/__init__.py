@@ -0,0 +1 @@
+"""Tests for Packing package"""
@@ -0,0 +1,126 @@
+"""Tests for the Packing module"""
+
+import math
+import random
+
+import pytest
+
+from shapes.circle import Circle, PositionedCircle
+from shapes.packing import PackingResult, Placement, pack_circles
+from shapes.rectangle import PositionedRectangle, Rectangle, Square
+
+
+def assert_valid(result, inside):
+    """Check that no two placements overlap and every placement is inside the container"""
+    placements = result.placements()
+    for number, first in enumerate(placements):
+        assert inside(first)
+        for second in placements[number + 1 :]:
+            distance = math.hypot(first.x - second.x, first.y - second.y)
+            assert distance >= (first.radius + second.radius) * (1 - 1e-9)
+
+
+def in_rectangle(width, height, x=0.0, y=0.0):
+    """Build a check for placements inside a rectangle"""
+    return lambda p: (
+        x + p.radius - 1e-9 <= p.x <= x + width - p.radius + 1e-9
+        and y + p.radius - 1e-9 <= p.y <= y + height - p.radius + 1e-9
+    )
+
+
+def in_circle(radius, x=0.0, y=0.0):
+    """Build a check for placements inside a circle"""
+    return lambda p: math.hypot(p.x - x, p.y - y) + p.radius <= radius + 1e-9
+
+
+class TestPackCircles:
+    """Test the greedy circle packer"""
+
+    def test_equal_circles_in_rectangle(self):
+        """Test that equal circles settle into rows touching the walls"""
+        result = pack_circles([Circle(1)] * 3, Rectangle(6, 2))
+        assert [(p.x, p.y) for p in result.placements()] == [(1, 1), (3, 1), (5, 1)]
+        assert result.density() == pytest.approx(math.pi / 4)
+
+    def test_hexagonal_packing(self):
+        """Test that seven equal circles fill a circle three times their radius"""
+        result = pack_circles([Circle(1)] * 7, Circle(3))
+        assert result.unplaced() == []
+        assert result.density() == pytest.approx(7 / 9)
+        assert_valid(result, in_circle(3))
+
+    def test_unplaced(self):
+        """Test that circles that cannot fit are reported by index"""
+        result = pack_circles([Circle(1), Circle(5), Circle(1), Circle(1)], Rectangle(4, 2))
+        assert result.unplaced() == [1, 3]
+        assert [p.index for p in result.placements()] == [0, 2]
+        assert_valid(result, in_rectangle(4, 2))
+
+    def test_random_circles_in_rectangle(self):
+        """Test many random circles in a rectangle"""
+        rng = random.Random(1)
+        circles = [Circle(rng.uniform(0.5, 2)) for _ in range(400)]
+        result = pack_circles(circles, Rectangle(60, 40))
+        assert len(result) + len(result.unplaced()) == 400
+        assert result.density() > 0.6
+        assert_valid(result, in_rectangle(60, 40))
+
+    def test_random_circles_in_circle(self):
+        """Test many random circles in a circular container"""
+        rng = random.Random(2)
+        circles = [Circle(rng.uniform(0.5, 2)) for _ in range(400)]
+        result = pack_circles(circles, Circle(25))
+        assert result.density() > 0.6
+        assert_valid(result, in_circle(25))
+
+    def test_positioned_containers(self):
+        """Test that positioned containers place circles in their own frame"""
+        circles = [Circle(1)] * 6
+        result = pack_circles(circles, PositionedRectangle(6, 4, 10, -5))
+        assert len(result) >= 5
+        assert_valid(result, in_rectangle(6, 4, 10, -5))
+        result = pack_circles(circles, PositionedCircle(4, 3, 3))
+        assert_valid(result, in_circle(4, 3, 3))
+
+    def test_square_container(self):
+        """Test that a Square is accepted as a rectangular container"""
+        result = pack_circles([Circle(1)] * 9, Square(6))
+        assert len(result) >= 6
+        assert_valid(result, in_rectangle(6, 6))
+
+    def test_refinement_fills_holes(self):
+        """Test that the time budget places small circles the greedy pass left out"""
+        rng = random.Random(3)
+        circles = [Circle(rng.uniform(1, 2)) for _ in range(150)] + [Circle(0.2)] * 200
+        greedy = pack_circles(circles, Rectangle(30, 30))
+        refined = pack_circles(circles, Rectangle(30, 30), time_budget=0.5, seed=1)
+        assert len(refined) >= len(greedy)
+        assert refined.density() >= greedy.density()
+        assert_valid(refined, in_rectangle(30, 30))
+
+    def test_circles(self):
+        """Test that placements convert to PositionedCircles"""
+        result = pack_circles([Circle(1), Circle(2)], Rectangle(10, 10))
+        circles = result.circles()
+        assert [c.radius() for c in circles] == [1, 2]
+        assert circles[1].center() == (result.placements()[1].x, result.placements()[1].y)
+
+    def test_empty(self):
+        """Test that an empty list packs nothing"""
+        result = pack_circles([], Rectangle(1, 1))
+        assert isinstance(result, PackingResult)
+        assert len(result) == 0
+        assert result.density() == 0
+
+    def test_invalid(self):
+        """Test invalid containers and time budgets"""
+        with pytest.raises(TypeError):
+            pack_circles([Circle(1)], "box")
+        with pytest.raises(ValueError):
+            pack_circles([Circle(1)], Rectangle(1, 1), time_budget=-1)
+
+    def test_str(self):
+        """Test str of a placement and a result"""
+        result = pack_circles([Circle(1)], Rectangle(2, 2))
+        assert result.placements() == [Placement(0, 1.0, 1.0, 1.0)]
+        assert str(result) == "PackingResult(placed=1, unplaced=0, density=0.7854)"
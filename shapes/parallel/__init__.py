@@ -0,0 +1,5 @@
+"""Parallel module"""
+
+from .parallel import ParallelEvaluator, gil_enabled, snapshot
+
+__all__ = ["ParallelEvaluator", "gil_enabled", "snapshot"]
@@ -0,0 +1,164 @@
+"""Module to evaluate metrics over snapshots of shapes with a pool of threads"""
+
+import os
+import sys
+from array import array
+from collections.abc import Iterable
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from types import TracebackType
+from typing import TYPE_CHECKING
+
+from shapes.frame import ShapeFrame, ShapeType
+from shapes.frame.frame import compute_group
+
+if TYPE_CHECKING:
+    from typing_extensions import Self
+else:
+    try:
+        from typing import Self
+    except ImportError:
+        from typing_extensions import Self
+
+
+def gil_enabled() -> bool:
+    """Check if the global interpreter lock is active, as on every build before Python 3.13"""
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+    return True if is_gil_enabled is None else bool(is_gil_enabled())
+
+
+def snapshot(source: ShapeFrame | Iterable[object]) -> ShapeFrame:
+    """Copy the dimensions of shapes into a ShapeFrame that later mutations do not affect
+    Args:
+        source: a ShapeFrame, which is copied, or an iterable of shapes
+    Note:
+        Each shape is read once. A shape mutated by another thread while it is being read, e.g.
+        in the middle of a Rectangle's *=, can be captured half-updated; writers must hold a
+        lock shared with the code taking the snapshot.
+    """
+    if isinstance(source, ShapeFrame):
+        return source.take(range(len(source)))
+    return ShapeFrame(source)
+
+
+class ParallelEvaluator:
+    """Thread-pool evaluator of shape metrics that reads frames through immutable views"""
+
+    def __init__(self, workers: int | None = None, chunk_size: int = 16384) -> None:
+        """Initialize the ParallelEvaluator
+        Args:
+            workers: number of threads; by default one per CPU on free-threaded builds and a
+                single inline worker when the GIL is enabled, where threads cannot run
+                Python code in parallel
+            chunk_size: number of rows of one shape type evaluated per task
+        Raises:
+            ValueError: if workers or chunk_size is less than 1
+        """
+        if workers is None:
+            workers = 1 if gil_enabled() else os.cpu_count() or 1
+        if workers < 1:
+            raise ValueError("Workers must be at least 1")
+        if chunk_size < 1:
+            raise ValueError("Chunk size must be at least 1")
+        self._workers: int = workers
+        self._chunk_size: int = chunk_size
+        self._executor: ThreadPoolExecutor | None = (
+            ThreadPoolExecutor(workers, thread_name_prefix="shapes") if workers > 1 else None
+        )
+
+    def workers(self) -> int:
+        """Get the number of threads evaluating metrics"""
+        return self._workers
+
+    def _submit(self, code: ShapeType, metric: str, chunk: list[memoryview]) -> Future[array]:
+        """Evaluate one chunk of a group on the pool, or inline without one"""
+        if self._executor is not None:
+            return self._executor.submit(compute_group, code, metric, chunk)
+        future: Future[array] = Future()
+        future.set_result(compute_group(code, metric, chunk))
+        return future
+
+    def group_metric(
+        self, source: ShapeFrame | Iterable[object], metric: str
+    ) -> dict[ShapeType, array]:
+        """Evaluate a metric once per shape type group, splitting groups into chunks across threads
+        Args:
+            source: a ShapeFrame, read in place, or an iterable of shapes, snapshotted first
+            metric: name of a no-argument shape method, e.g. "area"
+        Returns:
+            mapping of shape type to metric values in the group's row order
+        Raises:
+            ValueError: if the metric is not defined for a type present in the frame
+        Note:
+            A frame is read through read-only views, so appending to it from another thread
+            while the evaluation runs raises BufferError instead of changing the result.
+        """
+        frame = source if isinstance(source, ShapeFrame) else snapshot(source)
+        size = self._chunk_size
+        views: list[memoryview] = []
+        tasks: dict[ShapeType, list[Future[array]]] = {}
+        try:
+            for code, count in frame.counts().items():
+                columns = [frame.column(code, name) for name in ShapeFrame.layout(code)]
+                views.extend(columns)
+                tasks[code] = []
+                for start in range(0, count, size):
+                    chunk = [column[start : start + size] for column in columns]
+                    views.extend(chunk)
+                    tasks[code].append(self._submit(code, metric, chunk))
+            groups = {}
+            for code, parts in tasks.items():
+                values = array("d")
+                for part in parts:
+                    values.extend(part.result())
+                groups[code] = values
+            return groups
+        finally:
+            # Let every task finish before releasing the views so the frame can grow again,
+            # even when one of them failed
+            wait([part for parts in tasks.values() for part in parts])
+            for view in views:
+                view.release()
+
+    def metric(self, source: ShapeFrame | Iterable[object], metric: str) -> array:
+        """Evaluate a metric for every row, splitting the work across threads
+        Args:
+            source: a ShapeFrame, read in place, or an iterable of shapes, snapshotted first
+            metric: name of a no-argument shape method, e.g. "area"
+        Returns:
+            array of doubles in row order
+        Raises:
+            ValueError: if the metric is not defined for a type present in the frame
+        """
+        frame = source if isinstance(source, ShapeFrame) else snapshot(source)
+        groups = self.group_metric(frame, metric)
+        if len(groups) == 1:
+            return next(iter(groups.values()))
+        values = {code: iter(group) for code, group in groups.items()}
+        with frame.code_view() as codes:
+            return array("d", [next(values[code]) for code in map(ShapeType, codes)])
+
+    def close(self) -> None:
+        """Stop the worker threads once their tasks finish"""
+        if self._executor is not None:
+            self._executor.shutdown()
+
+    def __enter__(self) -> Self:
+        """Use the ParallelEvaluator as a context manager that stops its threads on exit"""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Stop the worker threads"""
+        self.close()
+
+    def __str__(self) -> str:
+        """String representation of the ParallelEvaluator"""
+        return f"ParallelEvaluator(workers={self._workers}, chunk_size={self._chunk_size})"
+
+    def __repr__(self) -> str:
+        """String representation of the ParallelEvaluator"""
+        return f"workers={self._workers}, chunk_size={self._chunk_size}"
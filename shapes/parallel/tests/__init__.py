@@ -0,0 +1 @@
+"""Tests for Parallel package"""
@@ -0,0 +1,85 @@
+"""Test cases for the ParallelEvaluator class"""
+
+import os
+
+import pytest
+
+from shapes import Circle, Rectangle, RightTriangle, ShapeFrame, ShapeType, Square
+from shapes.generate import ShapeGenerator
+from shapes.parallel import ParallelEvaluator, gil_enabled, snapshot
+
+
+class TestSnapshot:
+    """Test taking immutable snapshots of shapes"""
+
+    def test_snapshot_ignores_later_mutation(self):
+        """Test that scaling a shape after the snapshot leaves the snapshot unchanged"""
+        rectangle = Rectangle(2, 3)
+        frame = snapshot([rectangle, Circle(1)])
+        rectangle *= 4
+        assert frame[0] == Rectangle(2, 3)
+
+    def test_snapshot_copies_frames(self):
+        """Test that a snapshot of a frame does not share its columns"""
+        frame = ShapeFrame([Square(2)])
+        copy = snapshot(frame)
+        frame.append(Square(3))
+        assert len(copy) == 1
+        assert copy[0] == Square(2)
+
+
+class TestParallelEvaluator:
+    """Test evaluating metrics across threads"""
+
+    @pytest.mark.parametrize("workers", [1, 2, 4])
+    def test_metric_matches_frame(self, workers):
+        """Test that chunked results come back in row order"""
+        frame = ShapeGenerator(seed=5).frame(2000)
+        with ParallelEvaluator(workers, chunk_size=97) as evaluator:
+            assert list(evaluator.metric(frame, "area")) == list(frame.metric("area"))
+
+    def test_group_metric_matches_frame(self):
+        """Test that group results match ShapeFrame.group_metric"""
+        frame = ShapeFrame([Circle(1), Circle(2), Circle(3), RightTriangle(3, 4)])
+        with ParallelEvaluator(2, chunk_size=2) as evaluator:
+            assert evaluator.group_metric(frame, "area") == frame.group_metric("area")
+
+    def test_shapes_are_snapshotted(self):
+        """Test evaluating an iterable of shapes"""
+        shapes = [Circle(1), Rectangle(2, 3)]
+        with ParallelEvaluator(2) as evaluator:
+            assert list(evaluator.metric(shapes, "area")) == [shape.area() for shape in shapes]
+
+    def test_empty_source(self):
+        """Test that no shapes give no values"""
+        with ParallelEvaluator(2) as evaluator:
+            assert len(evaluator.metric([], "area")) == 0
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_unknown_metric(self, workers):
+        """Test that an undefined metric raises ValueError and leaves the frame growable"""
+        frame = ShapeFrame([Circle(1), Square(2)])
+        with ParallelEvaluator(workers) as evaluator:
+            with pytest.raises(ValueError):
+                evaluator.metric(frame, "volume")
+        frame.append(Circle(3))
+        assert frame.counts()[ShapeType.CIRCLE] == 2
+
+    def test_default_workers(self):
+        """Test that GIL builds evaluate inline while free-threaded builds use threads"""
+        expected = 1 if gil_enabled() else os.cpu_count() or 1
+        with ParallelEvaluator() as evaluator:
+            assert evaluator.workers() == expected
+
+    def test_invalid_arguments(self):
+        """Test that workers or chunk_size below 1 raise ValueError"""
+        with pytest.raises(ValueError):
+            ParallelEvaluator(0)
+        with pytest.raises(ValueError):
+            ParallelEvaluator(2, chunk_size=0)
+
+    def test_str(self):
+        """Test the str and repr of a ParallelEvaluator"""
+        with ParallelEvaluator(3, chunk_size=10) as evaluator:
+            assert str(evaluator) == "ParallelEvaluator(workers=3, chunk_size=10)"
+            assert repr(evaluator) == "workers=3, chunk_size=10"
@@ -0,0 +1,5 @@
+"""Query module"""
+
+from .query import Condition, Metric, Query
+
+__all__ = ["Condition", "Metric", "Query"]
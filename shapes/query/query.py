@@ -0,0 +1,374 @@
+"""Module to filter, sort and project shape collections with lazily evaluated queries"""
+
+import heapq
+import math
+import operator
+from array import array
+from collections.abc import Callable, Iterable, Iterator, Mapping
+
+from shapes.frame import ShapeFrame, ShapeType
+from shapes.frame.frame import compute_group, shape_type
+
+Predicate = Callable[[object], bool]
+
+# Metric values indexable by row: a dict for shape lists, a full-length array for frames
+Column = Mapping[int, float] | array
+
+# Comparison functions and their symbols, keyed by the name of the operator method
+_OPERATORS: dict[str, tuple[Callable[[float, float], bool], str]] = {
+    "lt": (operator.lt, "<"),
+    "le": (operator.le, "<="),
+    "gt": (operator.gt, ">"),
+    "ge": (operator.ge, ">="),
+    "eq": (operator.eq, "=="),
+    "ne": (operator.ne, "!="),
+}
+
+
+class Condition:
+    """Boolean expression over shape metrics, built by comparing Metric objects"""
+
+    def __init__(self, kind: str, *parts: object) -> None:
+        """Initialize the Condition
+        Args:
+            kind: "compare", "and", "or" or "not"
+            parts: (metric, operator, value) for a comparison, otherwise the sub-conditions
+        """
+        self._kind: str = kind
+        self._parts: tuple[object, ...] = parts
+
+    def select(
+        self, rows: list[int], column: Callable[[str, list[int]], Column]
+    ) -> list[int]:
+        """Evaluate the condition one metric column at a time
+        Args:
+            rows: candidate row indices, in order
+            column: function returning a metric column indexable by every candidate row
+        Returns:
+            the candidate rows for which the condition holds, in order
+        Note:
+            Each part of an "and" only reads the rows that passed the parts before it, and each
+            part of an "or" only the rows not yet accepted, so metrics are computed lazily.
+        """
+        if self._kind == "compare":
+            name, op, limit = self._parts
+            values = column(name, rows)  # type: ignore[arg-type]
+            compare = _OPERATORS[op][0]  # type: ignore[index]
+            return [row for row in rows if compare(values[row], limit)]
+        parts: tuple[Condition, ...] = self._parts  # type: ignore[assignment]
+        if self._kind == "and":
+            for part in parts:
+                rows = part.select(rows, column)
+            return rows
+        if self._kind == "or":
+            kept: set[int] = set()
+            remaining = rows
+            for part in parts:
+                kept.update(part.select(remaining, column))
+                remaining = [row for row in remaining if row not in kept]
+            return [row for row in rows if row in kept]
+        excluded = set(parts[0].select(rows, column))
+        return [row for row in rows if row not in excluded]
+
+    def __and__(self, other: "Condition") -> "Condition":
+        """Combine two conditions that must both hold"""
+        return Condition("and", self, other)
+
+    def __or__(self, other: "Condition") -> "Condition":
+        """Combine two conditions of which at least one must hold"""
+        return Condition("or", self, other)
+
+    def __invert__(self) -> "Condition":
+        """Negate the condition"""
+        return Condition("not", self)
+
+    def __str__(self) -> str:
+        """String representation of the Condition"""
+        if self._kind == "compare":
+            name, op, limit = self._parts
+            return f"{name} {_OPERATORS[op][1]} {limit}"  # type: ignore[index]
+        if self._kind == "not":
+            return f"~({self._parts[0]})"
+        joiner = " & " if self._kind == "and" else " | "
+        return "(" + joiner.join(str(part) for part in self._parts) + ")"
+
+    def __repr__(self) -> str:
+        """String representation of the Condition"""
+        return str(self)
+
+
+class Metric:
+    """Reference to a shape metric by name, compared with numbers to build a Condition"""
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __init__(self, name: str) -> None:
+        """Initialize the Metric
+        Args:
+            name: name of a no-argument shape method, e.g. "area"
+        """
+        self._name: str = name
+
+    def name(self) -> str:
+        """Get the name of the metric"""
+        return self._name
+
+    def __lt__(self, value: float) -> Condition:  # type: ignore[override]
+        """Condition that the metric is less than a value"""
+        return Condition("compare", self._name, "lt", value)
+
+    def __le__(self, value: float) -> Condition:  # type: ignore[override]
+        """Condition that the metric is at most a value"""
+        return Condition("compare", self._name, "le", value)
+
+    def __gt__(self, value: float) -> Condition:  # type: ignore[override]
+        """Condition that the metric is greater than a value"""
+        return Condition("compare", self._name, "gt", value)
+
+    def __ge__(self, value: float) -> Condition:  # type: ignore[override]
+        """Condition that the metric is at least a value"""
+        return Condition("compare", self._name, "ge", value)
+
+    def __eq__(self, value: object) -> Condition:  # type: ignore[override]
+        """Condition that the metric equals a value"""
+        return Condition("compare", self._name, "eq", value)
+
+    def __ne__(self, value: object) -> Condition:  # type: ignore[override]
+        """Condition that the metric differs from a value"""
+        return Condition("compare", self._name, "ne", value)
+
+    def __str__(self) -> str:
+        """String representation of the Metric"""
+        return f"Metric(name={self._name})"
+
+    def __repr__(self) -> str:
+        """String representation of the Metric"""
+        return f"name={self._name}"
+
+
+class _ShapeRows:
+    """Row access over a list of shape objects with each metric computed at most once per row"""
+
+    def __init__(self, shapes: Iterable[object]) -> None:
+        """Initialize the rows from shapes"""
+        self._shapes: list[object] = list(shapes)
+        self._cache: dict[str, dict[int, float]] = {}
+
+    def __len__(self) -> int:
+        """Number of rows"""
+        return len(self._shapes)
+
+    def shape(self, row: int) -> object:
+        """Get the shape of a row"""
+        return self._shapes[row]
+
+    def code(self, row: int) -> ShapeType:
+        """Get the type code of a row"""
+        return shape_type(self._shapes[row])
+
+    def column(self, name: str, rows: list[int]) -> dict[int, float]:
+        """Get the values of a metric, computing them for the rows that do not have one yet
+        Raises:
+            ValueError: if the metric is not defined for one of the shapes
+        """
+        cache = self._cache.setdefault(name, {})
+        shapes = self._shapes
+        for row in rows:
+            if row not in cache:
+                method = getattr(shapes[row], name, None) if not name.startswith("_") else None
+                if not callable(method):
+                    shape = type(shapes[row]).__name__
+                    raise ValueError(f"Metric '{name}' is not defined for {shape}")
+                cache[row] = method()
+        return cache
+
+
+class _FrameRows:
+    """Row access over a ShapeFrame that computes each metric once per type group it needs"""
+
+    def __init__(self, frame: ShapeFrame) -> None:
+        """Initialize the rows from a frame"""
+        self._frame: ShapeFrame = frame
+        self._codes: array = frame.codes()
+        self._groups: dict[int, list[int]] = {code: [] for code in frame.counts()}
+        for row, code in enumerate(self._codes):
+            self._groups[code].append(row)
+        self._cache: dict[str, tuple[array, set[int]]] = {}
+
+    def __len__(self) -> int:
+        """Number of rows"""
+        return len(self._codes)
+
+    def shape(self, row: int) -> object:
+        """Get the shape of a row"""
+        return self._frame[row]
+
+    def code(self, row: int) -> ShapeType:
+        """Get the type code of a row"""
+        return ShapeType(self._codes[row])
+
+    def column(self, name: str, rows: list[int]) -> array:
+        """Get the values of a metric in row order, computing them for the type groups of rows
+        Raises:
+            ValueError: if the metric is not defined for the type of one of the rows
+        Note:
+            Rows of groups no query step has needed yet hold NaN.
+        """
+        if name not in self._cache:
+            self._cache[name] = (array("d", [math.nan]) * len(self._codes), set())
+        values, computed = self._cache[name]
+        missing = self._groups.keys() - computed
+        if missing and len(rows) < len(self._codes):
+            codes = self._codes
+            missing &= {codes[row] for row in rows}
+        for code in map(ShapeType, missing):
+            columns = [self._frame.column(code, column) for column in ShapeFrame.layout(code)]
+            try:
+                group = compute_group(code, name, columns)
+            finally:
+                for view in columns:
+                    view.release()
+            for row, value in zip(self._groups[code], group):
+                values[row] = value
+            computed.add(code)
+        return values
+
+
+class Query:
+    """Lazily evaluated query over shapes or a ShapeFrame; each step returns a new Query"""
+
+    def __init__(self, source: ShapeFrame | Iterable[object]) -> None:
+        """Initialize the Query
+        Args:
+            source: a ShapeFrame, whose type groups are evaluated column-wise, or shapes
+        Note:
+            Nothing is evaluated until the query is iterated or collected. A one-shot source
+            such as a generator is read into a list here, so the query and the queries built
+            from it can be evaluated more than once.
+        """
+        if not isinstance(source, ShapeFrame) and iter(source) is source:
+            source = list(source)
+        self._source: ShapeFrame | Iterable[object] = source
+        self._steps: tuple[tuple[str, object], ...] = ()
+        self._projection: tuple[str, ...] = ()
+
+    def _with(self, step: tuple[str, object] | None, projection: tuple[str, ...] = ()) -> "Query":
+        """Create a copy of the query with one more step or a new projection"""
+        query = Query(self._source)
+        query._steps = self._steps + ((step,) if step is not None else ())
+        query._projection = projection or self._projection
+        return query
+
+    def filter(self, condition: Condition | Predicate) -> "Query":
+        """Keep the rows matching a condition on metrics or a predicate on the shape
+        Args:
+            condition: e.g. Metric("area") > 10, or a function taking a shape and returning a bool
+        """
+        return self._with(("filter", condition))
+
+    def of_type(self, *codes: ShapeType) -> "Query":
+        """Keep the rows of the given shape types"""
+        return self._with(("type", frozenset(ShapeType(code) for code in codes)))
+
+    def sort_by(self, metric: str = "area", reverse: bool = False) -> "Query":
+        """Order the rows by a metric, keeping ties in their current order"""
+        return self._with(("sort", (metric, reverse)))
+
+    def limit(self, count: int) -> "Query":
+        """Keep at most the first count rows
+        Raises:
+            ValueError: if count is negative
+        """
+        if count < 0:
+            raise ValueError("Limit must not be negative")
+        return self._with(("limit", count))
+
+    def map(self, *metrics: str) -> "Query":
+        """Produce metric values instead of shapes
+        Args:
+            metrics: one metric name for plain values, or several for a tuple per row
+        Raises:
+            ValueError: if no metric is given
+        """
+        if not metrics:
+            raise ValueError("Map requires at least one metric")
+        return self._with(None, metrics)
+
+    def _filter(
+        self, rows_source: _ShapeRows | _FrameRows, rows: list[int], condition: object
+    ) -> list[int]:
+        """Keep the rows passing a filter step"""
+        if not isinstance(condition, Condition):
+            test: Predicate = condition  # type: ignore[assignment]
+            return [row for row in rows if test(rows_source.shape(row))]
+        # On a frame each comparison reads a metric column computed per type group
+        return condition.select(rows, rows_source.column)
+
+    def _run(self) -> tuple[_ShapeRows | _FrameRows, list[int]]:
+        """Execute the steps and get the row source with the surviving row indices in order"""
+        source = self._source
+        rows_source = _FrameRows(source) if isinstance(source, ShapeFrame) else _ShapeRows(source)
+        rows = list(range(len(rows_source)))
+        steps = self._steps
+        for position, (kind, argument) in enumerate(steps):
+            if kind == "filter":
+                rows = self._filter(rows_source, rows, argument)
+            elif kind == "type":
+                codes: frozenset[ShapeType] = argument  # type: ignore[assignment]
+                rows = [row for row in rows if rows_source.code(row) in codes]
+            elif kind == "sort":
+                name, reverse = argument  # type: ignore[misc]
+                key = rows_source.column(name, rows).__getitem__
+                following = steps[position + 1] if position + 1 < len(steps) else None
+                if following is not None and following[0] == "limit":
+                    # A sort followed by a limit only needs the top rows, not a full sort
+                    count: int = following[1]  # type: ignore[assignment]
+                    top = heapq.nlargest if reverse else heapq.nsmallest
+                    rows = top(count, rows, key=key)
+                else:
+                    rows = sorted(rows, key=key, reverse=reverse)
+            else:
+                rows = rows[: argument]  # type: ignore[misc]
+        return rows_source, rows
+
+    def _output(self, rows_source: _ShapeRows | _FrameRows, rows: list[int]) -> list[object]:
+        """Turn row indices into shapes or projected metric values"""
+        if not self._projection:
+            return [rows_source.shape(row) for row in rows]
+        columns = [rows_source.column(name, rows) for name in self._projection]
+        if len(columns) == 1:
+            return [columns[0][row] for row in rows]
+        return [tuple(column[row] for column in columns) for row in rows]
+
+    def collect(self) -> list[object]:
+        """Evaluate the query
+        Returns:
+            shapes, or metric values when the query was mapped
+        Raises:
+            ValueError: if a metric is not defined for a row that needs it
+        """
+        return self._output(*self._run())
+
+    def __iter__(self) -> Iterator[object]:
+        """Evaluate the query and iterate over its results"""
+        return iter(self.collect())
+
+    def count(self) -> int:
+        """Evaluate the query and get the number of matching rows, without building results"""
+        return len(self._run()[1])
+
+    def group_by_type(self) -> dict[ShapeType, list[object]]:
+        """Evaluate the query and group its results by shape type, keeping their order"""
+        rows_source, rows = self._run()
+        groups: dict[ShapeType, list[int]] = {}
+        for row in rows:
+            groups.setdefault(rows_source.code(row), []).append(row)
+        return {code: self._output(rows_source, members) for code, members in groups.items()}
+
+    def __str__(self) -> str:
+        """String representation of the Query"""
+        return f"Query(steps={len(self._steps)}, projection={list(self._projection)})"
+
+    def __repr__(self) -> str:
+        """String representation of the Query"""
+        return f"steps={len(self._steps)}, projection={list(self._projection)}"
@@ -0,0 +1,168 @@
+"""Test cases for the Query class"""
+
+import pytest
+
+from shapes import Circle, Rectangle, RightTriangle, ShapeFrame, ShapeType, Square
+from shapes.generate import ShapeGenerator
+from shapes.query import Metric, Query
+
+
+class CountingCircle(Circle):
+    """Circle that counts how often its area is computed"""
+
+    calls = 0
+
+    def area(self):
+        """Count the call and compute the area"""
+        CountingCircle.calls += 1
+        return super().area()
+
+
+def mixed_shapes():
+    """Create a small mix of shapes with distinct areas"""
+    return [Circle(1), Rectangle(2, 3), Square(4), RightTriangle(3, 4), Circle(3), Square(1)]
+
+
+class TestQueryShapes:
+    """Test queries over lists of shapes"""
+
+    def test_filter_sort_limit_map(self):
+        """Test a full chain over shapes"""
+        result = (
+            Query(mixed_shapes())
+            .filter(Metric("area") > 3)
+            .sort_by("area", reverse=True)
+            .limit(2)
+            .map("area")
+            .collect()
+        )
+        assert result == pytest.approx([Circle(3).area(), 16.0])
+
+    def test_without_map_returns_shapes(self):
+        """Test that unmapped queries yield the shapes themselves"""
+        shapes = mixed_shapes()
+        assert list(Query(shapes).filter(Metric("area") < 4)) == [shapes[0], shapes[5]]
+
+    def test_map_several_metrics(self):
+        """Test projecting several metrics into tuples"""
+        rows = Query([Square(2), Rectangle(1, 3)]).map("area", "perimeter").collect()
+        assert rows == [(4.0, 8.0), (3.0, 8.0)]
+
+    def test_metric_computed_once(self):
+        """Test that a metric used in the filter, the sort and the map is computed once per row"""
+        shapes = [CountingCircle(radius) for radius in (1, 2, 3, 4)]
+        CountingCircle.calls = 0
+        Query(shapes).filter(Metric("area") > 5).sort_by("area").map("area").collect()
+        assert CountingCircle.calls == 4
+
+    def test_short_circuit(self):
+        """Test that a failed comparison skips the metrics after it"""
+        shapes = [CountingCircle(1), CountingCircle(2)]
+        CountingCircle.calls = 0
+        query = Query(shapes).filter((Metric("radius") > 1.5) & (Metric("area") > 0))
+        assert query.count() == 1
+        assert CountingCircle.calls == 1
+
+    def test_predicate_function(self):
+        """Test filtering with a plain function of the shape"""
+        query = Query(mixed_shapes()).filter(lambda shape: isinstance(shape, Square))
+        assert query.map("side").collect() == [4.0, 1.0]
+
+    def test_combined_conditions(self):
+        """Test and, or and not over comparisons"""
+        shapes = mixed_shapes()
+        condition = (Metric("area") < 4) | ~(Metric("area") <= 10)
+        assert Query(shapes).filter(condition).count() == 4
+
+    def test_undefined_metric(self):
+        """Test that a metric missing on a row raises ValueError"""
+        with pytest.raises(ValueError):
+            Query([Circle(1)]).map("perimeter").collect()
+
+    def test_group_by_type(self):
+        """Test grouping results by shape type in order"""
+        groups = Query(mixed_shapes()).map("area").group_by_type()
+        assert list(groups) == [
+            ShapeType.CIRCLE,
+            ShapeType.RECTANGLE,
+            ShapeType.SQUARE,
+            ShapeType.RIGHT_TRIANGLE,
+        ]
+        assert groups[ShapeType.SQUARE] == [16.0, 1.0]
+
+
+    def test_generator_source(self):
+        """Test that a query over a generator can be evaluated more than once"""
+        query = Query(shape for shape in mixed_shapes()).filter(Metric("area") > 3)
+        assert query.count() == 5
+        assert len(query.collect()) == 5
+        assert len(list(query)) == 5
+        assert query.limit(1).count() == 1
+
+
+class TestQueryFrame:
+    """Test queries pushed down to ShapeFrame columns"""
+
+    def test_matches_shape_query(self):
+        """Test that frame and shape sources give the same results"""
+        frame = ShapeGenerator(seed=4).frame(3000)
+        shapes = list(frame)
+
+        def build(source):
+            return (
+                Query(source)
+                .filter((Metric("area") > 10) & (Metric("area") < 60))
+                .sort_by("area")
+                .limit(25)
+                .map("area")
+            )
+
+        assert build(frame).collect() == build(shapes).collect()
+
+    def test_of_type_avoids_undefined_metric(self):
+        """Test that metrics are only computed for type groups that survive the filters"""
+        frame = ShapeFrame(mixed_shapes())
+        query = Query(frame).of_type(ShapeType.SQUARE).map("diagonal")
+        assert query.collect() == pytest.approx([4 * 2**0.5, 2**0.5])
+
+    def test_sort_without_limit(self):
+        """Test a full sort over a frame"""
+        frame = ShapeFrame(mixed_shapes())
+        areas = Query(frame).sort_by("area").map("area").collect()
+        assert areas == sorted(frame.metric("area"))
+
+    def test_query_is_lazy(self):
+        """Test that building a query evaluates nothing"""
+        query = Query(ShapeFrame([Circle(1)])).map("perimeter")
+        with pytest.raises(ValueError):
+            query.collect()
+
+
+class TestQueryBuilding:
+    """Test the construction of queries and conditions"""
+
+    def test_steps_return_new_queries(self):
+        """Test that each step leaves the original query unchanged"""
+        base = Query(mixed_shapes())
+        limited = base.limit(1)
+        assert base.count() == 6
+        assert limited.count() == 1
+
+    def test_invalid_steps(self):
+        """Test that a negative limit or an empty map raises ValueError"""
+        with pytest.raises(ValueError):
+            Query([]).limit(-1)
+        with pytest.raises(ValueError):
+            Query([]).map()
+
+    def test_condition_str(self):
+        """Test the str of combined conditions"""
+        condition = (Metric("area") > 2) & ~(Metric("radius") == 1)
+        assert str(condition) == "(area > 2 & ~(radius == 1))"
+
+    def test_str(self):
+        """Test the str and repr of a Query and a Metric"""
+        query = Query([]).filter(Metric("area") > 1).map("area")
+        assert str(query) == "Query(steps=1, projection=['area'])"
+        assert repr(query) == "steps=1, projection=['area']"
+        assert str(Metric("area")) == "Metric(name=area)"
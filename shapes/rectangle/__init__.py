@@ -1,5 +1,5 @@
 """Rectangle module"""
 
-from .rectangle import Rectangle, Square
+from .rectangle import PositionedRectangle, Rectangle, Square
 
-__all__ = ["Rectangle", "Square"]
+__all__ = ["Rectangle", "Square", "PositionedRectangle"]
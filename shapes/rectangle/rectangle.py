@@ -144,6 +144,10 @@ class Rectangle:
             return False
         return area_diff < 0
 
+    def __reduce__(self) -> tuple[type, tuple[float, ...]]:
+        """Pickle the Rectangle as its constructor arguments instead of its instance dictionary"""
+        return (type(self), (self._width, self._height))
+
     def __str__(self) -> str:
         """String representation of the Rectangle"""
         return f"Rectangle(width={self._width}, height={self._height})"
@@ -206,6 +210,10 @@ class Square(Rectangle):
         new /= scale
         return new
 
+    def __reduce__(self) -> tuple[type, tuple[float, ...]]:
+        """Pickle the Square as its constructor arguments"""
+        return (type(self), (self._side,))
+
     def __str__(self) -> str:
         """String representation of the Square"""
         return f"Square(side={self._side})"
@@ -213,3 +221,96 @@ class Square(Rectangle):
     def __repr__(self) -> str:
         """String representation of the Square"""
         return f"side={self._side}"
+
+
+@total_ordering
+class PositionedRectangle(Rectangle):
+    """PositionedRectangle class to represent an axis-aligned rectangle placed at an origin
+    Note:
+        == compares the origin only when both shapes are positioned; against a Rectangle without a
+        position only the size is compared. Equality is therefore not transitive: two shapes
+        placed apart both equal the same unplaced shape but not each other.
+    """
+
+    def __init__(
+        self, width: int | float, height: int | float, x: int | float = 0.0, y: int | float = 0.0
+    ) -> None:
+        """Initialize the PositionedRectangle with width, height and an origin
+        Args:
+            width: width of the rectangle, along the x axis
+            height: height of the rectangle, along the y axis
+            x: x coordinate of the lower-left corner
+            y: y coordinate of the lower-left corner
+        Raises:
+            ValueError: if width or height is not positive
+        """
+        super().__init__(width, height)
+        self._x: float = float(x)
+        self._y: float = float(y)
+
+    def origin(self) -> tuple[float, float]:
+        """Get the lower-left corner of the rectangle"""
+        return (self._x, self._y)
+
+    def center(self) -> tuple[float, float]:
+        """Get the center of the rectangle"""
+        return (self._x + self._width / 2, self._y + self._height / 2)
+
+    def move_to(self, x: int | float, y: int | float) -> None:
+        """Move the lower-left corner of the rectangle to a new point"""
+        self._x = float(x)
+        self._y = float(y)
+
+    def translate(self, dx: int | float, dy: int | float) -> None:
+        """Move the rectangle by an offset"""
+        self._x += dx
+        self._y += dy
+
+    def __reduce__(self) -> tuple[type, tuple[float, ...]]:
+        """Pickle the PositionedRectangle as its constructor arguments"""
+        return (type(self), (self._width, self._height, self._x, self._y))
+
+    def bounds(self) -> tuple[float, float, float, float]:
+        """Get the bounding box as (min_x, min_y, max_x, max_y)"""
+        return (self._x, self._y, self._x + self._width, self._y + self._height)
+
+    def contains_point(self, x: int | float, y: int | float) -> bool:
+        """Check if a point lies inside or on the rectangle"""
+        return self._x <= x <= self._x + self._width and self._y <= y <= self._y + self._height
+
+    def distance_to(self, x: int | float, y: int | float) -> float:
+        """Calculate the distance from a point to the rectangle, 0 if the point is inside"""
+        dx = max(self._x - x, 0.0, x - self._x - self._width)
+        dy = max(self._y - y, 0.0, y - self._y - self._height)
+        return math.hypot(dx, dy)
+
+    def __mul__(self, scale: int | float) -> "PositionedRectangle":
+        """Scale the area of the rectangle by a factor, keeping the origin"""
+        new = PositionedRectangle(self._width, self._height, self._x, self._y)
+        new *= scale
+        return new
+
+    def __truediv__(self, scale: int | float) -> "PositionedRectangle":
+        """Scale the area of the rectangle down by a factor, keeping the origin"""
+        new = PositionedRectangle(self._width, self._height, self._x, self._y)
+        new /= scale
+        return new
+
+    def __eq__(self, other: object) -> bool:
+        """Equality comparison for PositionedRectangle, including the origin when both are placed"""
+        if not super().__eq__(other):
+            return False
+        if isinstance(other, PositionedRectangle):
+            return math.isclose(self._x, other._x) and math.isclose(self._y, other._y)
+        return True
+
+    def __str__(self) -> str:
+        """String representation of the PositionedRectangle"""
+        return (
+            f"PositionedRectangle(width={self._width}, height={self._height}, "
+            f"origin=({self._x}, {self._y}))"
+        )
+
+    def __repr__(self) -> str:
+        """String representation of the PositionedRectangle"""
+        return f"width={self._width}, height={self._height}, origin=({self._x}, {self._y})"
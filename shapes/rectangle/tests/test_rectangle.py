@@ -1,10 +1,11 @@
 """Test cases for Rectangle and Square classes"""
 
 import math
+import pickle
 
 import pytest
 
-from shapes import Rectangle, Square
+from shapes import PositionedRectangle, Rectangle, Square
 
 
 class TestRectangleBasics:
@@ -609,3 +610,90 @@ class TestSquareEdgeCases:
         assert rotated.width() == 5
         assert rotated.height() == 5
         assert rotated.area() == square.area()
+
+
+# PositionedRectangle Tests
+
+
+class TestPositionedRectangle:
+    """Test rectangles placed at an origin"""
+
+    def test_initialization(self):
+        """Test positioned rectangle initialization"""
+        rect = PositionedRectangle(4, 2, 1, 1)
+        assert rect.width() == 4
+        assert rect.height() == 2
+        assert rect.origin() == (1, 1)
+        assert rect.center() == (3, 2)
+
+    def test_invalid_dimensions(self):
+        """Test that non-positive dimensions raise ValueError"""
+        with pytest.raises(ValueError):
+            PositionedRectangle(0, 1, 1, 1)
+
+    def test_bounds(self):
+        """Test the bounding box"""
+        assert PositionedRectangle(4, 2, 1, 1).bounds() == (1, 1, 5, 3)
+
+    def test_move(self):
+        """Test moving the origin"""
+        rect = PositionedRectangle(1, 1)
+        rect.move_to(2, 2)
+        rect.translate(-1, 3)
+        assert rect.origin() == (1, 5)
+
+    def test_contains_point(self):
+        """Test point containment, including the boundary"""
+        rect = PositionedRectangle(4, 2, 0, 0)
+        assert rect.contains_point(2, 1)
+        assert rect.contains_point(4, 2)
+        assert not rect.contains_point(4.1, 1)
+
+    def test_distance_to(self):
+        """Test the distance from a point"""
+        rect = PositionedRectangle(2, 2, 0, 0)
+        assert rect.distance_to(1, 1) == 0
+        assert rect.distance_to(5, 1) == 3
+        assert math.isclose(rect.distance_to(5, 6), 5)
+
+    def test_scaling_keeps_origin(self):
+        """Test that scaling keeps the type and the origin"""
+        scaled = PositionedRectangle(2, 3, 4, 5) * 4
+        assert isinstance(scaled, PositionedRectangle)
+        assert scaled.width() == 4
+        assert scaled.origin() == (4, 5)
+        assert (scaled / 4).origin() == (4, 5)
+
+    def test_equality(self):
+        """Test that origins are compared between positioned rectangles"""
+        assert PositionedRectangle(1, 2, 3, 4) == PositionedRectangle(1, 2, 3, 4)
+        assert PositionedRectangle(1, 2, 3, 4) != PositionedRectangle(1, 2, 0, 0)
+        assert PositionedRectangle(1, 2, 3, 4) == Rectangle(1, 2)
+
+    def test_equality_not_transitive(self):
+        """Test that unplaced rectangles equal positioned ones at any origin, as documented"""
+        placed, other = PositionedRectangle(1, 2, 3, 4), PositionedRectangle(1, 2, 0, 0)
+        plain = Rectangle(1, 2)
+        assert placed == plain and plain == other
+        assert placed != other
+
+    def test_str(self):
+        """Test string representations"""
+        rect = PositionedRectangle(1, 2, 3, 4)
+        assert str(rect) == "PositionedRectangle(width=1.0, height=2.0, origin=(3.0, 4.0))"
+        assert repr(rect) == "width=1.0, height=2.0, origin=(3.0, 4.0)"
+
+
+class TestRectanglePickling:
+    """Test pickling rectangles and squares"""
+
+    def test_roundtrip(self):
+        """Test that unpickled rectangles keep their class and values"""
+        for shape in (Rectangle(2, 3), Square(4), PositionedRectangle(1, 2, 3, 4)):
+            copy = pickle.loads(pickle.dumps(shape))
+            assert type(copy) is type(shape)
+            assert vars(copy) == vars(shape)
+
+    def test_pickle_holds_arguments_only(self):
+        """Test that the pickle stores constructor arguments rather than attribute names"""
+        assert b"_width" not in pickle.dumps(Square(4))
@@ -0,0 +1,5 @@
+"""Shared module"""
+
+from .shared import SharedFrame
+
+__all__ = ["SharedFrame"]
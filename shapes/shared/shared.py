@@ -0,0 +1,230 @@
+"""Module to share the columns of a ShapeFrame between processes without copying them"""
+
+from array import array
+from multiprocessing.shared_memory import SharedMemory
+from types import TracebackType
+from typing import TYPE_CHECKING
+
+from shapes.frame import ShapeFrame, ShapeType
+from shapes.frame.frame import compute_group
+
+if TYPE_CHECKING:
+    from typing_extensions import Self
+else:
+    try:
+        from typing import Self
+    except ImportError:
+        from typing_extensions import Self
+
+# Size in bytes of one value of a dimension column
+_ITEM_SIZE = array("d").itemsize
+
+
+def _offsets(counts: tuple[int, ...]) -> tuple[dict[ShapeType, list[int]], int]:
+    """Lay out the type codes and every dimension column in one block
+    Returns:
+        start offset of each dimension column per shape type, and the size of the block
+    Note:
+        The type codes come first, padded so that every column starts on an 8-byte boundary.
+    """
+    offset = -(-sum(counts) // _ITEM_SIZE) * _ITEM_SIZE
+    offsets: dict[ShapeType, list[int]] = {}
+    for code, count in zip(ShapeType, counts):
+        offsets[code] = []
+        for _ in ShapeFrame.layout(code):
+            offsets[code].append(offset)
+            offset += count * _ITEM_SIZE
+    return offsets, offset
+
+
+def _open(name: str) -> SharedMemory:
+    """Attach to an existing block without handing its cleanup to this process"""
+    try:
+        return SharedMemory(name=name, track=False)  # type: ignore[call-arg]
+    except TypeError:
+        # Before Python 3.13 attaching registers the block again; pool workers share the
+        # resource tracker of the process that created it, so the registration is harmless
+        return SharedMemory(name=name)
+
+
+class SharedFrame:
+    """Read-only copy of a ShapeFrame in shared memory that pickles as just its block name"""
+
+    def __init__(self, frame: ShapeFrame) -> None:
+        """Initialize the SharedFrame by copying a frame into a new shared memory block
+        Args:
+            frame: frame whose type codes and dimension columns are shared
+        Note:
+            The creating process owns the block and should unlink it once every worker is done,
+            e.g. by using the SharedFrame as a context manager.
+        """
+        frame_counts = frame.counts()
+        counts = tuple(frame_counts.get(code, 0) for code in ShapeType)
+        offsets, size = _offsets(counts)
+        self._memory: SharedMemory = SharedMemory(create=True, size=max(size, 1))
+        self._counts: tuple[int, ...] = counts
+        self._offsets: dict[ShapeType, list[int]] = offsets
+        self._owner: bool = True
+        buffer = self._memory.buf
+        buffer[: len(frame)] = frame.codes().tobytes()
+        for code in frame_counts:
+            for start, column in zip(offsets[code], frame.columns(code)):
+                data = column.tobytes()
+                buffer[start : start + len(data)] = data
+
+    @classmethod
+    def attach(cls, name: str, counts: tuple[int, ...]) -> "SharedFrame":
+        """Attach to a block created by another SharedFrame
+        Args:
+            name: name of the shared memory block
+            counts: number of rows of each shape type, in ShapeType order
+        Note:
+            Unpickling a SharedFrame calls this, so workers normally receive frames ready to use.
+        """
+        shared = cls.__new__(cls)
+        shared._memory = _open(name)
+        shared._counts = tuple(counts)
+        shared._offsets = _offsets(shared._counts)[0]
+        shared._owner = False
+        return shared
+
+    def __reduce__(self) -> tuple[object, tuple[object, ...]]:
+        """Pickle the SharedFrame as its block name and row counts instead of its data"""
+        return (SharedFrame.attach, (self._memory.name, self._counts))
+
+    def name(self) -> str:
+        """Get the name of the shared memory block"""
+        return self._memory.name
+
+    def __len__(self) -> int:
+        """Number of shapes in the frame"""
+        return sum(self._counts)
+
+    def counts(self) -> dict[ShapeType, int]:
+        """Get the number of rows of each shape type present in the frame"""
+        return {code: count for code, count in zip(ShapeType, self._counts) if count}
+
+    def codes(self) -> memoryview:
+        """Get a read-only view of the type-code column, one unsigned byte per row"""
+        return self._memory.buf[: len(self)].toreadonly()
+
+    def columns(self, code: ShapeType) -> tuple[memoryview, ...]:
+        """Get read-only views of the dimension columns of one shape type
+        Note:
+            The views point into the shared block and must be released before it is closed.
+        """
+        code = ShapeType(code)
+        size = self._counts[code] * _ITEM_SIZE
+        buffer = self._memory.buf
+        return tuple(
+            buffer[start : start + size].toreadonly().cast("d") for start in self._offsets[code]
+        )
+
+    def column(self, code: ShapeType, name: str) -> memoryview:
+        """Get a read-only view of one dimension column of a shape type
+        Args:
+            code: shape type the column belongs to
+            name: column name from ShapeFrame.layout(code), e.g. "radius"
+        Raises:
+            ValueError: if the shape type has no column of that name
+        Note:
+            The view points into the shared block and must be released before it is closed.
+        """
+        code = ShapeType(code)
+        names = ShapeFrame.layout(code)
+        if name not in names:
+            raise ValueError(f"{code.name} has no column '{name}'; columns are {names}")
+        start = self._offsets[code][names.index(name)]
+        stop = start + self._counts[code] * _ITEM_SIZE
+        return self._memory.buf[start:stop].toreadonly().cast("d")
+
+    def group_metric(self, metric: str) -> dict[ShapeType, array]:
+        """Evaluate a metric once per shape type group, reading the columns in place
+        Args:
+            metric: name of a no-argument shape method, e.g. "area"
+        Returns:
+            mapping of shape type to metric values in the group's row order
+        Raises:
+            ValueError: if the metric is not defined for a type present in the frame
+        """
+        groups = {}
+        for code in self.counts():
+            views = self.columns(code)
+            try:
+                groups[code] = compute_group(code, metric, views)
+            finally:
+                for view in views:
+                    view.release()
+        return groups
+
+    def metric(self, metric: str) -> array:
+        """Evaluate a metric for every row
+        Args:
+            metric: name of a no-argument shape method, e.g. "area"
+        Returns:
+            array of doubles in row order
+        Raises:
+            ValueError: if the metric is not defined for a type present in the frame
+        """
+        groups = self.group_metric(metric)
+        if len(groups) == 1:
+            return next(iter(groups.values()))
+        values = {code: iter(group) for code, group in groups.items()}
+        with self.codes() as codes:
+            return array("d", [next(values[code]) for code in map(ShapeType, codes)])
+
+    def to_frame(self) -> ShapeFrame:
+        """Copy the shared rows back into an ordinary ShapeFrame in the original row order"""
+        frame = ShapeFrame()
+        starts = {}
+        for code in self.counts():
+            starts[code] = len(frame)
+            views = self.columns(code)
+            frame.extend_columns(code, *views)
+            for view in views:
+                view.release()
+        order = []
+        with self.codes() as codes:
+            for code in map(ShapeType, codes):
+                order.append(starts[code])
+                starts[code] += 1
+        return frame.take(order)
+
+    def close(self) -> None:
+        """Detach this process from the shared block
+        Raises:
+            BufferError: if views returned by codes() or columns() are still held
+        """
+        self._memory.close()
+
+    def unlink(self) -> None:
+        """Free the shared block once every process has closed it
+        Raises:
+            ValueError: if called from a process that attached to the block
+        """
+        if not self._owner:
+            raise ValueError("Only the process that created the SharedFrame can unlink it")
+        self._memory.unlink()
+
+    def __enter__(self) -> Self:
+        """Use the SharedFrame as a context manager that releases its block on exit"""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Close the block, and unlink it in the process that created it"""
+        self.close()
+        if self._owner:
+            self.unlink()
+
+    def __str__(self) -> str:
+        """String representation of the SharedFrame"""
+        return f"SharedFrame(name={self._memory.name}, rows={len(self)})"
+
+    def __repr__(self) -> str:
+        """String representation of the SharedFrame"""
+        return f"name={self._memory.name}, rows={len(self)}"
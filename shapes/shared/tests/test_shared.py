@@ -0,0 +1,151 @@
+"""Test cases for the SharedFrame class"""
+
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+from shapes import Circle, ObtuseTriangle, Rectangle, RightTriangle, ShapeFrame, ShapeType, Square
+from shapes.shared import SharedFrame
+
+
+def mixed_frame():
+    """Create a frame with interleaved shape types"""
+    return ShapeFrame(
+        [
+            Circle(1),
+            Rectangle(2, 3),
+            Circle(2),
+            RightTriangle(3, 4),
+            Square(2),
+            ObtuseTriangle(3, 4, 6),
+        ]
+    )
+
+
+def total_area(shared):
+    """Sum the areas of a SharedFrame received by a worker process"""
+    with shared:
+        return sum(shared.metric("area"))
+
+
+class TestSharedFrameBasics:
+    """Test creating and reading a SharedFrame"""
+
+    def test_counts_and_length(self):
+        """Test that the shared frame reports the rows of the source frame"""
+        frame = mixed_frame()
+        with SharedFrame(frame) as shared:
+            assert len(shared) == 6
+            assert shared.counts() == frame.counts()
+
+    def test_codes_and_columns(self):
+        """Test reading the type codes and dimension columns in place"""
+        frame = mixed_frame()
+        with SharedFrame(frame) as shared:
+            with shared.codes() as codes:
+                assert list(codes) == list(frame.codes())
+            (radii,) = shared.columns(ShapeType.CIRCLE)
+            assert list(radii) == [1.0, 2.0]
+            radii.release()
+
+    def test_named_column(self):
+        """Test reading one named dimension column in place"""
+        with SharedFrame(mixed_frame()) as shared:
+            with shared.column(ShapeType.RECTANGLE, "height") as heights:
+                assert heights.tolist() == [3.0]
+            with pytest.raises(ValueError):
+                shared.column(ShapeType.RECTANGLE, "radius")
+
+    def test_columns_are_read_only(self):
+        """Test that the views cannot write into the shared block"""
+        with SharedFrame(mixed_frame()) as shared:
+            (radii,) = shared.columns(ShapeType.CIRCLE)
+            with pytest.raises(TypeError):
+                radii[0] = 5.0
+            radii.release()
+
+    def test_empty_frame(self):
+        """Test sharing a frame without rows"""
+        with SharedFrame(ShapeFrame()) as shared:
+            assert len(shared) == 0
+            assert shared.counts() == {}
+            assert len(shared.metric("area")) == 0
+
+
+class TestSharedFrameMetrics:
+    """Test evaluating metrics over a SharedFrame"""
+
+    def test_metric_matches_frame(self):
+        """Test that metrics come back in row order and match the source frame"""
+        frame = mixed_frame()
+        with SharedFrame(frame) as shared:
+            assert list(shared.metric("area")) == list(frame.metric("area"))
+
+    def test_group_metric_matches_frame(self):
+        """Test that group metrics match the source frame"""
+        frame = mixed_frame()
+        with SharedFrame(frame) as shared:
+            assert shared.group_metric("area") == frame.group_metric("area")
+
+    def test_unknown_metric(self):
+        """Test that an undefined metric raises ValueError"""
+        with SharedFrame(mixed_frame()) as shared:
+            with pytest.raises(ValueError):
+                shared.metric("volume")
+
+    def test_to_frame(self):
+        """Test copying the shared rows back into a ShapeFrame"""
+        frame = mixed_frame()
+        with SharedFrame(frame) as shared:
+            copy = shared.to_frame()
+        assert list(copy.codes()) == list(frame.codes())
+        assert list(copy.metric("area")) == list(frame.metric("area"))
+
+
+class TestSharedFramePickling:
+    """Test sending a SharedFrame to other processes"""
+
+    def test_pickle_is_small(self):
+        """Test that the pickle holds the block name rather than the columns"""
+        frame = ShapeFrame(Circle(radius) for radius in range(1, 1001))
+        with SharedFrame(frame) as shared:
+            assert len(pickle.dumps(shared)) < 200
+
+    def test_unpickled_frame_attaches(self):
+        """Test that unpickling attaches to the same block"""
+        frame = mixed_frame()
+        with SharedFrame(frame) as shared:
+            attached = pickle.loads(pickle.dumps(shared))
+            assert attached.name() == shared.name()
+            assert list(attached.metric("area")) == list(frame.metric("area"))
+            attached.close()
+
+    def test_attached_frame_cannot_unlink(self):
+        """Test that only the creating process may free the block"""
+        with SharedFrame(mixed_frame()) as shared:
+            attached = pickle.loads(pickle.dumps(shared))
+            with pytest.raises(ValueError):
+                attached.unlink()
+            attached.close()
+
+    def test_process_pool(self):
+        """Test that worker processes read the shared columns"""
+        frame = mixed_frame()
+        with SharedFrame(frame) as shared, ProcessPoolExecutor(2) as pool:
+            results = list(pool.map(total_area, [shared] * 4))
+        assert results == [sum(frame.metric("area"))] * 4
+
+
+class TestSharedFrameStringRepresentation:
+    """Test string representations of SharedFrame"""
+
+    def test_str(self):
+        """Test the str of a SharedFrame"""
+        with SharedFrame(mixed_frame()) as shared:
+            assert str(shared) == f"SharedFrame(name={shared.name()}, rows=6)"
+
+    def test_repr(self):
+        """Test the repr of a SharedFrame"""
+        with SharedFrame(mixed_frame()) as shared:
+            assert repr(shared) == f"name={shared.name()}, rows=6"
@@ -0,0 +1,5 @@
+"""Similarity module"""
+
+from .similarity import SimilarityIndex, descriptor
+
+__all__ = ["SimilarityIndex", "descriptor"]
@@ -0,0 +1,228 @@
+"""Module to group triangles and rectangles by shape regardless of size or side order"""
+
+import math
+from collections.abc import Iterable
+from itertools import product
+
+from shapes.rectangle import Rectangle
+from shapes.spatial import RTree
+from shapes.triangle import Triangle
+
+# Families that are never similar to each other, keyed by the base class
+_FAMILIES: tuple[tuple[type, str], ...] = ((Triangle, "triangle"), (Rectangle, "rectangle"))
+
+
+def _family(shape: object) -> str:
+    """Get the family name of a shape
+    Raises:
+        TypeError: if the shape is not a Triangle or a Rectangle
+    """
+    for cls, family in _FAMILIES:
+        if isinstance(shape, cls):
+            return family
+    name = type(shape).__name__
+    raise TypeError(f"Similarity is defined for triangles and rectangles, not {name}")
+
+
+def _sides(shape: object) -> list[float]:
+    """Get the sides of a triangle, or the width and height of a rectangle, shortest first"""
+    if isinstance(shape, Triangle):
+        return sorted((shape.a, shape.b, shape.c))
+    return sorted((shape.width(), shape.height()))  # type: ignore[attr-defined]
+
+
+def descriptor(shape: object) -> tuple[float, ...]:
+    """Get the canonical shape descriptor, equal for similar shapes
+    Returns:
+        for a triangle, its two shorter sides divided by the longest, in ascending order; for a
+        rectangle, its aspect ratio as the shorter side divided by the longer
+    Raises:
+        TypeError: if the shape is not a Triangle or a Rectangle
+    Note:
+        Sorting the sides first makes the descriptor independent of the order sides are given
+        in, so a 3-4-5 and a 4-3-5 triangle get the same descriptor.
+    """
+    _family(shape)
+    sides = _sides(shape)
+    longest = sides[-1]
+    return tuple(side / longest for side in sides[:-1])
+
+
+class _Classes:
+    """Classes of nearly equal vectors, found through a grid with cells twice the tolerance"""
+
+    def __init__(self, tolerance: float) -> None:
+        """Initialize the empty grid"""
+        self._tolerance: float = tolerance
+        self._width: float = 2 * tolerance
+        self._cells: dict[tuple, list[int]] = {}
+        # Class of every distinct vector seen, so repeated shapes skip the grid entirely
+        self._exact: dict[tuple, int] = {}
+        self.vectors: list[tuple[str, tuple[float, ...]]] = []
+        self.members: list[list[object]] = []
+
+    def _cell(self, family: str, vector: tuple[float, ...]) -> tuple:
+        """Get the grid cell of a vector"""
+        return (family, *(math.floor(value / self._width) for value in vector))
+
+    def find(self, family: str, vector: tuple[float, ...]) -> int | None:
+        """Find a class whose first vector is within the tolerance in every component"""
+        index = self._exact.get((family, *vector))
+        if index is not None:
+            return index
+        for index in self._cells.get(self._cell(family, vector), ()):
+            if all(abs(x - y) <= self._tolerance for x, y in zip(vector, self.vectors[index][1])):
+                return index
+        return None
+
+    def add(self, family: str, vector: tuple[float, ...], shape: object) -> int:
+        """Add a shape to the matching class, creating one if none matches
+        Note:
+            A new class is registered in every cell its tolerance box overlaps, at most two per
+            axis, so that find() only reads the cell of the vector it is given.
+        """
+        index = self.find(family, vector)
+        if index is None:
+            index = len(self.members)
+            reach = [
+                range(
+                    math.floor((value - self._tolerance) / self._width),
+                    math.floor((value + self._tolerance) / self._width) + 1,
+                )
+                for value in vector
+            ]
+            for cell in product(*reach):
+                self._cells.setdefault((family, *cell), []).append(index)
+            self.vectors.append((family, vector))
+            self.members.append([])
+        self._exact[(family, *vector)] = index
+        self.members[index].append(shape)
+        return index
+
+
+class SimilarityIndex:
+    """Index of triangles and rectangles grouped into similarity and congruence classes"""
+
+    def __init__(self, shapes: Iterable[object] = (), tolerance: int | float = 1e-9) -> None:
+        """Initialize the SimilarityIndex
+        Args:
+            shapes: triangles and rectangles to index
+            tolerance: largest difference in any descriptor value, and in the logarithm of the
+                longest side for congruence, between shapes of the same class
+        Raises:
+            ValueError: if tolerance is not positive
+            TypeError: if a shape is not a Triangle or a Rectangle
+        Note:
+            A shape joins the first class whose first member is within the tolerance, so classes
+            do not chain together shapes that drift apart in small steps.
+        """
+        if not tolerance > 0:
+            raise ValueError("Tolerance must be positive")
+        self._tolerance: float = float(tolerance)
+        self._similar: _Classes = _Classes(self._tolerance)
+        self._congruent: _Classes = _Classes(self._tolerance)
+        self._trees: dict[str, RTree] = {}
+        self._size: int = 0
+        self.extend(shapes)
+
+    def _vectors(self, shape: object) -> tuple[str, tuple[float, ...], tuple[float, ...]]:
+        """Get the family, the similarity vector and the congruence vector of a shape"""
+        family = _family(shape)
+        sides = _sides(shape)
+        longest = sides[-1]
+        similar = tuple(side / longest for side in sides[:-1])
+        return family, similar, (*similar, math.log(longest))
+
+    def add(self, shape: object) -> None:
+        """Add a triangle or rectangle to the index
+        Raises:
+            TypeError: if the shape is not a Triangle or a Rectangle
+        """
+        family, similar, congruent = self._vectors(shape)
+        before = len(self._similar.members)
+        self._similar.add(family, similar, shape)
+        self._congruent.add(family, congruent, shape)
+        if len(self._similar.members) != before:
+            self._trees.pop(family, None)
+        self._size += 1
+
+    def extend(self, shapes: Iterable[object]) -> None:
+        """Add triangles and rectangles to the index"""
+        for shape in shapes:
+            self.add(shape)
+
+    def similar(self, shape: object) -> list[object]:
+        """Get the indexed shapes similar to a shape, in the order they were added
+        Raises:
+            TypeError: if the shape is not a Triangle or a Rectangle
+        """
+        family, vector, _ = self._vectors(shape)
+        index = self._similar.find(family, vector)
+        return [] if index is None else list(self._similar.members[index])
+
+    def congruent(self, shape: object) -> list[object]:
+        """Get the indexed shapes congruent to a shape, in the order they were added
+        Raises:
+            TypeError: if the shape is not a Triangle or a Rectangle
+        """
+        family, _, vector = self._vectors(shape)
+        index = self._congruent.find(family, vector)
+        return [] if index is None else list(self._congruent.members[index])
+
+    def similarity_groups(self) -> list[list[object]]:
+        """Get every similarity class, in the order their first shapes were added"""
+        return [list(members) for members in self._similar.members]
+
+    def congruence_groups(self) -> list[list[object]]:
+        """Get every congruence class, in the order their first shapes were added"""
+        return [list(members) for members in self._congruent.members]
+
+    def _tree(self, family: str) -> RTree:
+        """Get the R-tree over the descriptors of one family's similarity classes
+        Note:
+            Descriptors are stored as points; a rectangle's aspect ratio is placed on the x axis.
+            The tree is rebuilt only after a new similarity class was added.
+        """
+        if family not in self._trees:
+            entries = []
+            for index, (other, vector) in enumerate(self._similar.vectors):
+                if other == family:
+                    x, y = (*vector, 0.0)[:2]
+                    entries.append(((x, y, x, y), index))
+            self._trees[family] = RTree.from_entries(entries)
+        return self._trees[family]
+
+    def nearest(self, shape: object, k: int = 1) -> list[object]:
+        """Find the k indexed shapes of the same family with the closest descriptors
+        Args:
+            shape: triangle or rectangle to match; it does not need to be indexed
+            k: number of shapes to return
+        Returns:
+            shapes ordered from the most similar, members of one class in the order added
+        Raises:
+            TypeError: if the shape is not a Triangle or a Rectangle
+        Note:
+            The search walks an R-tree of similarity classes instead of scanning every shape.
+            Adding a shape that starts a new class rebuilds the tree of its family on the next
+            query, so batches of additions are cheaper than interleaving them with queries.
+        """
+        family, vector, _ = self._vectors(shape)
+        x, y = (*vector, 0.0)[:2]
+        found: list[object] = []
+        for index in self._tree(family).nearest(x, y, k):
+            found.extend(self._similar.members[index])  # type: ignore[call-overload]
+            if len(found) >= k:
+                break
+        return found[:k]
+
+    def __len__(self) -> int:
+        """Number of shapes in the index"""
+        return self._size
+
+    def __str__(self) -> str:
+        """String representation of the SimilarityIndex"""
+        return f"SimilarityIndex(shapes={self._size}, classes={len(self._similar.members)})"
+
+    def __repr__(self) -> str:
+        """String representation of the SimilarityIndex"""
+        return f"shapes={self._size}, classes={len(self._similar.members)}"
@@ -0,0 +1 @@
+"""Tests for Similarity package"""
@@ -0,0 +1,124 @@
+"""Test cases for the SimilarityIndex class and shape descriptors"""
+
+import pytest
+
+from shapes import (
+    AcuteTriangle,
+    Circle,
+    ObtuseTriangle,
+    PositionedRectangle,
+    PositionedTriangle,
+    Rectangle,
+    RightTriangle,
+    Square,
+)
+from shapes.similarity import SimilarityIndex, descriptor
+
+
+class TestDescriptor:
+    """Test canonical shape descriptors"""
+
+    def test_side_order_does_not_matter(self):
+        """Test that reordered sides give the same descriptor"""
+        assert descriptor(RightTriangle(3, 4)) == descriptor(RightTriangle(4, 3)) == (0.6, 0.8)
+        assert descriptor(AcuteTriangle(6, 4, 5)) == descriptor(AcuteTriangle(4, 5, 6))
+
+    def test_scale_does_not_matter(self):
+        """Test that similar shapes share a descriptor"""
+        assert descriptor(ObtuseTriangle(3, 4, 6)) == descriptor(ObtuseTriangle(6, 8, 12))
+        assert descriptor(Rectangle(2, 4)) == descriptor(Rectangle(8, 4)) == (0.5,)
+        assert descriptor(Square(3)) == (1.0,)
+
+    def test_positioned_shapes(self):
+        """Test that positioned shapes are described by their sides"""
+        triangle = PositionedTriangle((0, 0), (4, 0), (0, 3))
+        assert descriptor(triangle) == pytest.approx((0.6, 0.8))
+        assert descriptor(PositionedRectangle(1, 2, 5, 5)) == (0.5,)
+
+    def test_unsupported_shape(self):
+        """Test that other shapes raise TypeError"""
+        with pytest.raises(TypeError):
+            descriptor(Circle(1))
+
+
+class TestSimilarityIndex:
+    """Test grouping and querying shapes by similarity"""
+
+    SHAPES = [
+        RightTriangle(3, 4),
+        RightTriangle(4, 3),
+        RightTriangle(6, 8),
+        AcuteTriangle(4, 5, 6),
+        Rectangle(1, 2),
+        Rectangle(2, 1),
+        Rectangle(3, 6),
+        Square(2),
+    ]
+
+    def test_similarity_groups(self):
+        """Test that shapes group by shape regardless of size and side order"""
+        groups = SimilarityIndex(self.SHAPES).similarity_groups()
+        shapes = self.SHAPES
+        assert groups == [shapes[0:3], shapes[3:4], shapes[4:7], shapes[7:8]]
+
+    def test_congruence_groups(self):
+        """Test that congruent groups also match size"""
+        groups = SimilarityIndex(self.SHAPES).congruence_groups()
+        assert [len(group) for group in groups] == [2, 1, 1, 2, 1, 1]
+
+    def test_similar_and_congruent_queries(self):
+        """Test looking up the class of a shape that is not indexed"""
+        index = SimilarityIndex(self.SHAPES)
+        assert len(index.similar(RightTriangle(30, 40))) == 3
+        assert index.congruent(RightTriangle(4, 3)) == self.SHAPES[:2]
+        assert index.congruent(RightTriangle(30, 40)) == []
+        assert index.similar(ObtuseTriangle(3, 4, 6)) == []
+
+    def test_tolerance(self):
+        """Test that shapes within the tolerance share a class and others do not"""
+        index = SimilarityIndex([Rectangle(1, 2)], tolerance=1e-3)
+        assert len(index.similar(Rectangle(1, 1 / 0.5009))) == 1
+        assert len(index.similar(Rectangle(1, 1 / 0.4991))) == 1
+        assert index.similar(Rectangle(1, 1 / 0.5011)) == []
+
+    def test_rounding_is_absorbed(self):
+        """Test that sides with rounding errors group with exact ones"""
+        index = SimilarityIndex([RightTriangle.from_sides(1, 3**0.5, 2)])
+        scaled = RightTriangle(3**0.5, 1) * 7
+        assert descriptor(scaled) != descriptor(index.similarity_groups()[0][0])
+        assert len(index.similar(scaled)) == 1
+
+    def test_nearest(self):
+        """Test finding the most similar shapes of the same family"""
+        index = SimilarityIndex(self.SHAPES)
+        assert index.nearest(RightTriangle(5, 7), 1) == [self.SHAPES[0]]
+        assert index.nearest(AcuteTriangle(4, 5, 5.9), 2) == [self.SHAPES[3], self.SHAPES[0]]
+        assert index.nearest(Rectangle(1, 1.1), 2) == [self.SHAPES[7], self.SHAPES[4]]
+        assert index.nearest(Rectangle(1, 1), 0) == []
+
+    def test_nearest_after_add(self):
+        """Test that shapes added after a query are found by later queries"""
+        index = SimilarityIndex([Rectangle(1, 3)])
+        assert index.nearest(Rectangle(1, 1)) == [Rectangle(1, 3)]
+        index.add(Rectangle(1, 1.2))
+        assert index.nearest(Rectangle(1, 1)) == [Rectangle(1, 1.2)]
+
+    def test_empty_index(self):
+        """Test that an empty index finds nothing"""
+        index = SimilarityIndex()
+        assert index.nearest(Square(1)) == []
+        assert index.similarity_groups() == []
+        assert len(index) == 0
+
+    def test_invalid(self):
+        """Test that bad tolerances and shapes raise errors"""
+        with pytest.raises(ValueError):
+            SimilarityIndex(tolerance=0)
+        with pytest.raises(TypeError):
+            SimilarityIndex([Circle(1)])
+
+    def test_str(self):
+        """Test the str and repr of a SimilarityIndex"""
+        index = SimilarityIndex(self.SHAPES)
+        assert str(index) == "SimilarityIndex(shapes=8, classes=4)"
+        assert repr(index) == "shapes=8, classes=4"
@@ -0,0 +1,5 @@
+"""Sketch module"""
+
+from .sketch import KLLSketch, MetricSketch
+
+__all__ = ["KLLSketch", "MetricSketch"]
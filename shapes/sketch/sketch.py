@@ -0,0 +1,264 @@
+"""Module to approximate quantiles of metric streams in fixed memory"""
+
+import math
+import random
+from array import array
+from bisect import bisect_left
+from collections.abc import Iterable, Sequence
+from itertools import accumulate, islice
+from typing import TYPE_CHECKING
+
+from shapes.frame import metric_chunks
+
+if TYPE_CHECKING:
+    from typing_extensions import Self
+else:
+    try:
+        from typing import Self
+    except ImportError:
+        from typing_extensions import Self
+
+# Ratio between the capacities of neighbouring compactor levels
+_DECAY = 2 / 3
+
+# Number of values buffered from a plain iterator before they are folded in
+_BATCH_SIZE = 4096
+
+
+class KLLSketch:
+    """KLL quantile sketch with bounded memory that can be merged across processes"""
+
+    def __init__(self, k: int = 200, seed: int | None = None) -> None:
+        """Initialize the KLLSketch
+        Args:
+            k: accuracy parameter; the normalized rank error shrinks roughly as 1 / k
+            seed: seed for the coin flips used when compacting, for reproducible sketches
+        Raises:
+            ValueError: if k is less than 2
+        """
+        if k < 2:
+            raise ValueError("k must be at least 2")
+        self._k: int = k
+        self._random: random.Random = random.Random(seed)
+        self._compactors: list[list[float]] = []
+        self._size: int = 0
+        self._max_size: int = 0
+        self._count: int = 0
+        self._min: float = math.inf
+        self._max: float = -math.inf
+        self._grow()
+
+    def _grow(self) -> None:
+        """Add a compactor level on top and recompute the total capacity"""
+        self._compactors.append([])
+        self._max_size = sum(self._capacity(height) for height in range(len(self._compactors)))
+
+    def _capacity(self, height: int) -> int:
+        """Get the capacity of the compactor at a level"""
+        depth = len(self._compactors) - height - 1
+        return int(math.ceil(_DECAY**depth * self._k)) + 1
+
+    def _compress(self) -> None:
+        """Compact levels until the retained items fit in the total capacity"""
+        while self._size >= self._max_size:
+            for height, items in enumerate(self._compactors):
+                if len(items) >= self._capacity(height):
+                    if height + 1 == len(self._compactors):
+                        self._grow()
+                    items.sort()
+                    odd = len(items) % 2
+                    # Every other item moves up a level with twice the weight
+                    offset = odd + self._random.randint(0, 1)
+                    self._compactors[height + 1].extend(items[offset::2])
+                    del items[odd:]
+                    break
+            self._size = sum(len(items) for items in self._compactors)
+
+    def add(self, value: int | float) -> None:
+        """Fold a single value into the sketch"""
+        x = float(value)
+        self._compactors[0].append(x)
+        self._size += 1
+        self._count += 1
+        self._min = min(self._min, x)
+        self._max = max(self._max, x)
+        if self._size >= self._max_size:
+            self._compress()
+
+    def update(self, values: Iterable[float]) -> None:
+        """Fold an iterable of values into the sketch
+        Args:
+            values: a sequence is folded in as one chunk; other iterables are consumed in batches
+        """
+        if isinstance(values, (array, list, tuple, memoryview)):
+            self._add_chunk(values)
+            return
+        iterator = iter(values)
+        while batch := list(islice(iterator, _BATCH_SIZE)):
+            self._add_chunk(batch)
+
+    def _add_chunk(self, chunk: Sequence[float]) -> None:
+        """Fold a chunk in, compacting whenever the sketch fills up"""
+        if not len(chunk):
+            return
+        self._count += len(chunk)
+        self._min = min(self._min, min(chunk))
+        self._max = max(self._max, max(chunk))
+        start = 0
+        while start < len(chunk):
+            stop = start + max(self._max_size - self._size, 1)
+            part = chunk[start:stop]
+            self._compactors[0].extend(part)
+            self._size += len(part)
+            start = stop
+            if self._size >= self._max_size:
+                self._compress()
+
+    def merge(self, other: "KLLSketch") -> Self:
+        """Merge a sketch built elsewhere, e.g. by a parallel worker, into this one"""
+        while len(self._compactors) < len(other._compactors):
+            self._grow()
+        for items, other_items in zip(self._compactors, other._compactors):
+            items.extend(other_items)
+        self._size = sum(len(items) for items in self._compactors)
+        self._count += other._count
+        self._min = min(self._min, other._min)
+        self._max = max(self._max, other._max)
+        self._compress()
+        return self
+
+    def _weighted(self) -> tuple[list[float], list[int]]:
+        """Get the retained values in order with their cumulative weights"""
+        pairs = sorted(
+            (value, 1 << height) for height, items in enumerate(self._compactors) for value in items
+        )
+        return [value for value, _ in pairs], list(accumulate(weight for _, weight in pairs))
+
+    def count(self) -> int:
+        """Get the number of values seen"""
+        return self._count
+
+    def retained(self) -> int:
+        """Get the number of values held by the sketch"""
+        return self._size
+
+    def min(self) -> float:
+        """Get the exact smallest value
+        Raises:
+            ValueError: if the sketch is empty
+        """
+        if self._count == 0:
+            raise ValueError("Min requires at least one value")
+        return self._min
+
+    def max(self) -> float:
+        """Get the exact largest value
+        Raises:
+            ValueError: if the sketch is empty
+        """
+        if self._count == 0:
+            raise ValueError("Max requires at least one value")
+        return self._max
+
+    def rank(self, value: int | float) -> float:
+        """Estimate the fraction of values less than or equal to a value"""
+        if self._count == 0:
+            raise ValueError("Rank requires at least one value")
+        weight = sum(
+            (1 << height) * sum(1 for item in items if item <= value)
+            for height, items in enumerate(self._compactors)
+        )
+        return weight / self._count
+
+    def quantile(self, q: float) -> float:
+        """Estimate the value at a quantile
+        Args:
+            q: quantile between 0 and 1, e.g. 0.99 for p99
+        Raises:
+            ValueError: if q is outside [0, 1] or the sketch is empty
+        """
+        return self.quantiles([q])[0]
+
+    def quantiles(self, qs: Iterable[float]) -> list[float]:
+        """Estimate the values at several quantiles with a single sort of the sketch
+        Args:
+            qs: quantiles between 0 and 1
+        Raises:
+            ValueError: if a quantile is outside [0, 1] or the sketch is empty
+        """
+        qs = list(qs)
+        if any(not 0 <= q <= 1 for q in qs):
+            raise ValueError("Quantiles must be between 0 and 1")
+        if self._count == 0:
+            raise ValueError("Quantiles require at least one value")
+        values, weights = self._weighted()
+        total = weights[-1]
+        results = []
+        for q in qs:
+            if q == 0:
+                results.append(self._min)
+            elif q == 1:
+                results.append(self._max)
+            else:
+                results.append(values[bisect_left(weights, q * total)])
+        return results
+
+    def __str__(self) -> str:
+        """String representation of the KLLSketch"""
+        return f"KLLSketch(k={self._k}, count={self._count}, retained={self._size})"
+
+    def __repr__(self) -> str:
+        """String representation of the KLLSketch"""
+        return f"k={self._k}, count={self._count}, retained={self._size}"
+
+
+class MetricSketch(KLLSketch):
+    """KLL quantile sketch of one metric over shapes and ShapeFrame chunks"""
+
+    def __init__(
+        self,
+        metric: str = "area",
+        source: object = (),
+        k: int = 200,
+        seed: int | None = None,
+        chunk_size: int = 65536,
+    ) -> None:
+        """Initialize the MetricSketch for a metric
+        Args:
+            metric: name of a no-argument shape method, e.g. "aspect_ratio"
+            source: optional shapes or ShapeFrames to consume immediately
+            k: accuracy parameter; the normalized rank error shrinks roughly as 1 / k
+            seed: seed for the coin flips used when compacting
+            chunk_size: number of loose shapes evaluated per group-dispatched chunk
+        """
+        super().__init__(k, seed)
+        self._metric: str = metric
+        self._chunk_size: int = chunk_size
+        self.consume(source)
+
+    def metric(self) -> str:
+        """Get the name of the metric being sketched"""
+        return self._metric
+
+    def consume(self, source: object) -> Self:
+        """Fold the metric values of a shape, a ShapeFrame or an iterable of them into the sketch"""
+        for chunk in metric_chunks(source, self._metric, self._chunk_size):
+            self._add_chunk(chunk)
+        return self
+
+    def merge(self, other: KLLSketch) -> Self:
+        """Merge a sketch built elsewhere, e.g. by a parallel worker, into this one
+        Raises:
+            ValueError: if the other sketch summarizes a different metric
+        """
+        if isinstance(other, MetricSketch) and other.metric() != self._metric:
+            raise ValueError(f"Cannot merge '{other.metric()}' into '{self._metric}' sketch")
+        return super().merge(other)
+
+    def __str__(self) -> str:
+        """String representation of the MetricSketch"""
+        return f"MetricSketch(metric={self._metric}, k={self._k}, count={self._count})"
+
+    def __repr__(self) -> str:
+        """String representation of the MetricSketch"""
+        return f"metric={self._metric}, k={self._k}, count={self._count}"
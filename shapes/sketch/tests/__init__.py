@@ -0,0 +1 @@
+"""Tests for Sketch package"""
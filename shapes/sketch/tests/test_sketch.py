@@ -0,0 +1,154 @@
+"""Test cases for the KLLSketch and MetricSketch classes"""
+
+import math
+import pickle
+import random
+
+import pytest
+
+from shapes import Circle, Rectangle, RightTriangle, ShapeFrame, Square
+from shapes.sketch import KLLSketch, MetricSketch
+
+
+def uniform_values(count, seed=1):
+    """Create reproducible uniform values in [0, 1)"""
+    rng = random.Random(seed)
+    return [rng.random() for _ in range(count)]
+
+
+class TestKLLSketchBasics:
+    """Test basic sketch behaviour"""
+
+    def test_small_stream_is_exact(self):
+        """Test that streams below capacity are answered exactly"""
+        sketch = KLLSketch()
+        sketch.update(range(1, 101))
+        assert sketch.count() == 100
+        assert sketch.quantile(0.5) == 50
+        assert sketch.quantile(0.99) == 99
+
+    def test_min_and_max_are_exact(self):
+        """Test that the extremes are tracked exactly"""
+        sketch = KLLSketch(k=16, seed=1)
+        sketch.update(uniform_values(10000))
+        assert sketch.quantile(0) == sketch.min() == min(uniform_values(10000))
+        assert sketch.quantile(1) == sketch.max() == max(uniform_values(10000))
+
+    def test_add_single_values(self):
+        """Test folding in one value at a time"""
+        sketch = KLLSketch(seed=1)
+        for value in uniform_values(20000):
+            sketch.add(value)
+        assert sketch.count() == 20000
+        assert abs(sketch.quantile(0.5) - 0.5) < 0.03
+
+    def test_generator_input(self):
+        """Test that iterators are consumed in batches"""
+        sketch = KLLSketch(seed=1)
+        sketch.update(float(i) for i in range(10000))
+        assert sketch.count() == 10000
+
+    def test_invalid_k(self):
+        """Test that a too small k raises ValueError"""
+        with pytest.raises(ValueError):
+            KLLSketch(k=1)
+
+    def test_invalid_quantile(self):
+        """Test that quantiles outside [0, 1] raise ValueError"""
+        sketch = KLLSketch()
+        sketch.add(1)
+        with pytest.raises(ValueError):
+            sketch.quantile(1.5)
+
+    def test_empty_raises(self):
+        """Test that an empty sketch raises ValueError"""
+        sketch = KLLSketch()
+        for method in (sketch.min, sketch.max, lambda: sketch.quantile(0.5), lambda: sketch.rank(1)):
+            with pytest.raises(ValueError):
+                method()
+
+
+class TestKLLSketchAccuracy:
+    """Test the error and memory bounds"""
+
+    def test_memory_is_bounded(self):
+        """Test that the retained item count stays small"""
+        sketch = KLLSketch(k=100, seed=1)
+        sketch.update(uniform_values(200000))
+        assert sketch.retained() < 1000
+
+    @pytest.mark.parametrize("q", [0.5, 0.95, 0.99])
+    def test_quantile_rank_error(self, q):
+        """Test that the rank error of estimates is small"""
+        values = uniform_values(100000)
+        sketch = KLLSketch(seed=2)
+        sketch.update(values)
+        estimate = sketch.quantile(q)
+        true_rank = sum(1 for value in values if value <= estimate) / len(values)
+        assert abs(true_rank - q) < 0.02
+
+    def test_rank(self):
+        """Test the rank estimate"""
+        sketch = KLLSketch(seed=1)
+        sketch.update(uniform_values(50000))
+        assert abs(sketch.rank(0.25) - 0.25) < 0.02
+
+    def test_reproducible_with_seed(self):
+        """Test that equal seeds give equal sketches"""
+        first, second = KLLSketch(seed=5), KLLSketch(seed=5)
+        first.update(uniform_values(30000))
+        second.update(uniform_values(30000))
+        assert first.quantiles([0.1, 0.5, 0.9]) == second.quantiles([0.1, 0.5, 0.9])
+
+
+class TestKLLSketchMerge:
+    """Test merging sketches"""
+
+    def test_merge_workers(self):
+        """Test merging sketches of disjoint partitions"""
+        values = uniform_values(100000)
+        merged = KLLSketch(seed=0)
+        for worker in range(4):
+            part = KLLSketch(seed=worker + 1)
+            part.update(values[worker::4])
+            merged.merge(pickle.loads(pickle.dumps(part)))
+        assert merged.count() == 100000
+        assert merged.min() == min(values)
+        for q in (0.5, 0.95, 0.99):
+            assert abs(merged.quantile(q) - q) < 0.02
+        assert merged.retained() < 1000
+
+
+class TestMetricSketch:
+    """Test sketches over shape metrics"""
+
+    def test_area_quantiles(self):
+        """Test quantiles of square areas"""
+        sketch = MetricSketch("area", [Square(i) for i in range(1, 101)])
+        assert sketch.count() == 100
+        assert sketch.quantile(0.5) == 2500
+
+    def test_aspect_ratio(self):
+        """Test sketching another metric from frames"""
+        frame = ShapeFrame([Rectangle(1, 2), Rectangle(2, 1), Square(3)])
+        sketch = MetricSketch("aspect_ratio", frame)
+        assert sketch.quantiles([0, 0.5, 1]) == [0.5, 1.0, 2.0]
+
+    def test_angle_c(self):
+        """Test sketching triangle angles"""
+        sketch = MetricSketch("angle_c", [RightTriangle(3, 4)] * 10)
+        assert math.isclose(sketch.quantile(0.5), math.pi / 2)
+
+    def test_merge_different_metric(self):
+        """Test that merging different metrics raises ValueError"""
+        with pytest.raises(ValueError):
+            MetricSketch("area").merge(MetricSketch("perimeter"))
+
+    def test_undefined_metric(self):
+        """Test that undefined metrics raise ValueError"""
+        with pytest.raises(ValueError):
+            MetricSketch("aspect_ratio", [Circle(1)])
+
+    def test_str(self):
+        """Test str of a metric sketch"""
+        assert str(MetricSketch("area", k=8)) == "MetricSketch(metric=area, k=8, count=0)"
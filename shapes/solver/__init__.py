@@ -0,0 +1,14 @@
+"""Solver module"""
+
+from .solver import Sides, classify, solve_aas, solve_asa, solve_sas, solve_sss, to_frame, triangles
+
+__all__ = [
+    "Sides",
+    "classify",
+    "solve_aas",
+    "solve_asa",
+    "solve_sas",
+    "solve_sss",
+    "to_frame",
+    "triangles",
+]
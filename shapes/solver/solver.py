@@ -0,0 +1,230 @@
+"""Module to solve columns of triangles given by sides and angles and build them in bulk"""
+
+import math
+from array import array
+from collections.abc import Sequence
+from typing import NamedTuple
+
+from shapes.frame import ShapeFrame, ShapeType
+from shapes.triangle import AcuteTriangle, ObtuseTriangle, RightTriangle, Triangle
+
+# Relative tolerance within which the longest side is taken as the hypotenuse of a right angle
+_RIGHT_TOLERANCE = 1e-9
+
+# Classes built from the solved sides of the acute and obtuse groups
+_CLASSES: dict[ShapeType, type[Triangle]] = {
+    ShapeType.ACUTE_TRIANGLE: AcuteTriangle,
+    ShapeType.OBTUSE_TRIANGLE: ObtuseTriangle,
+}
+
+
+class Sides(NamedTuple):
+    """Solved side columns; side a is opposite angle A, b opposite B and c opposite C"""
+
+    a: array
+    b: array
+    c: array
+
+
+def _columns(*columns: Sequence[float]) -> list[array]:
+    """Copy input columns into arrays of doubles
+    Raises:
+        ValueError: if the columns differ in length
+    """
+    values = [array("d", column) for column in columns]
+    if any(len(column) != len(values[0]) for column in values):
+        raise ValueError("Columns must all have the same length")
+    return values
+
+
+def _radians(column: array, degrees: bool) -> array:
+    """Convert a column of angles to radians when they are given in degrees"""
+    return array("d", map(math.radians, column)) if degrees else column
+
+
+def _check_sides(*columns: array) -> None:
+    """Check that every side is positive and finite
+    Raises:
+        ValueError: naming the first invalid row
+    """
+    for column in columns:
+        for row, side in enumerate(column):
+            if not 0 < side < math.inf:
+                raise ValueError(f"Row {row}: sides must be positive, got {side}")
+
+
+def _check_angles(*columns: array) -> None:
+    """Check that the given angles of every row are positive and sum to less than 180 degrees
+    Raises:
+        ValueError: naming the first invalid row
+    """
+    for row, angles in enumerate(zip(*columns)):
+        if not (min(angles) > 0 and sum(angles) < math.pi):
+            raise ValueError(f"Row {row}: angles must be positive and sum to less than 180 degrees")
+
+
+def _law_of_sines(side: array, angle: array, *others: array) -> list[array]:
+    """Get the sides opposite other angles from one side and its opposite angle"""
+    ratios = [x / math.sin(t) for x, t in zip(side, angle)]
+    return [array("d", [k * math.sin(t) for k, t in zip(ratios, other)]) for other in others]
+
+
+def solve_sss(a: Sequence[float], b: Sequence[float], c: Sequence[float]) -> Sides:
+    """Check columns of three sides
+    Raises:
+        ValueError: if the columns differ in length, or a row has a side that is not positive
+            or that breaks the triangle inequality
+    """
+    a, b, c = _columns(a, b, c)
+    _check_sides(a, b, c)
+    for row, (x, y, z) in enumerate(zip(a, b, c)):
+        if not (x + y > z and x + z > y and y + z > x):
+            raise ValueError(f"Row {row}: sides must satisfy the triangle inequality")
+    return Sides(a, b, c)
+
+
+def solve_sas(
+    b: Sequence[float], angle_a: Sequence[float], c: Sequence[float], degrees: bool = False
+) -> Sides:
+    """Solve columns of two sides and the angle between them with the law of cosines
+    Args:
+        b: side next to angle A
+        angle_a: angle between sides b and c
+        c: other side next to angle A
+        degrees: angles are in degrees instead of radians
+    Raises:
+        ValueError: if the columns differ in length, or a row has a side that is not positive
+            or an angle outside (0, 180) degrees
+    """
+    b, angle, c = _columns(b, angle_a, c)
+    angle = _radians(angle, degrees)
+    _check_sides(b, c)
+    _check_angles(angle)
+    a = array(
+        "d", [math.sqrt(y * y + z * z - 2 * y * z * math.cos(t)) for y, t, z in zip(b, angle, c)]
+    )
+    return Sides(a, b, c)
+
+
+def solve_asa(
+    angle_b: Sequence[float], a: Sequence[float], angle_c: Sequence[float], degrees: bool = False
+) -> Sides:
+    """Solve columns of two angles and the side between them with the law of sines
+    Args:
+        angle_b: angle at one end of side a
+        a: side between angles B and C
+        angle_c: angle at the other end of side a
+        degrees: angles are in degrees instead of radians
+    Raises:
+        ValueError: if the columns differ in length, or a row has a side that is not positive
+            or angles that are not positive or sum to 180 degrees or more
+    """
+    angle_b, a, angle_c = _columns(angle_b, a, angle_c)
+    angle_b, angle_c = _radians(angle_b, degrees), _radians(angle_c, degrees)
+    _check_sides(a)
+    _check_angles(angle_b, angle_c)
+    angle_a = array("d", [math.pi - x - y for x, y in zip(angle_b, angle_c)])
+    b, c = _law_of_sines(a, angle_a, angle_b, angle_c)
+    return Sides(a, b, c)
+
+
+def solve_aas(
+    angle_a: Sequence[float], angle_b: Sequence[float], a: Sequence[float], degrees: bool = False
+) -> Sides:
+    """Solve columns of two angles and a side that is not between them with the law of sines
+    Args:
+        angle_a: angle opposite side a
+        angle_b: second known angle
+        a: side opposite angle A
+        degrees: angles are in degrees instead of radians
+    Raises:
+        ValueError: if the columns differ in length, or a row has a side that is not positive
+            or angles that are not positive or sum to 180 degrees or more
+    """
+    angle_a, angle_b, a = _columns(angle_a, angle_b, a)
+    angle_a, angle_b = _radians(angle_a, degrees), _radians(angle_b, degrees)
+    _check_sides(a)
+    _check_angles(angle_a, angle_b)
+    angle_c = array("d", [math.pi - x - y for x, y in zip(angle_a, angle_b)])
+    b, c = _law_of_sines(a, angle_a, angle_b, angle_c)
+    return Sides(a, b, c)
+
+
+def classify(sides: Sides) -> array:
+    """Get the ShapeType code of every solved triangle
+    Returns:
+        array of unsigned bytes holding RIGHT_TRIANGLE, ACUTE_TRIANGLE or OBTUSE_TRIANGLE
+    Note:
+        A row is right when the squares of its two shorter sides sum to the square of the
+        longest within a relative tolerance of 1e-9, which absorbs the rounding of the solvers.
+    """
+    right, acute, obtuse = (
+        ShapeType.RIGHT_TRIANGLE.value,
+        ShapeType.ACUTE_TRIANGLE.value,
+        ShapeType.OBTUSE_TRIANGLE.value,
+    )
+    # Sum of the squares of the shorter sides less the square of the longest, relative to it
+    excess = [
+        (x * x + y * y + z * z) / (m * m) - 2 for x, y, z, m in zip(*sides, map(max, *sides))
+    ]
+    codes = [right if abs(e) <= _RIGHT_TOLERANCE else acute if e > 0 else obtuse for e in excess]
+    return array("B", codes)
+
+
+def _grouped(sides: Sides, codes: array) -> dict[ShapeType, tuple[list[int], list[array]]]:
+    """Split solved rows into shape type groups of rows and ShapeFrame layout columns
+    Note:
+        Right triangles are stored with the hypotenuse last, as ShapeFrame expects.
+    """
+    groups = {}
+    for code in map(ShapeType, sorted(set(codes))):
+        rows = [row for row, value in enumerate(codes) if value == code]
+        columns = [array("d", [column[row] for row in rows]) for column in sides]
+        if code is ShapeType.RIGHT_TRIANGLE:
+            columns = _hypotenuse_last(*columns)
+        groups[code] = (rows, columns)
+    return groups
+
+
+def _hypotenuse_last(a: array, b: array, c: array) -> list[array]:
+    """Move the longest side of each right triangle last, keeping the legs in their order"""
+    columns = [array("d"), array("d"), array("d")]
+    for x, y, z in zip(a, b, c):
+        if x >= y and x >= z:
+            x, y, z = y, z, x
+        elif y >= z:
+            y, z = z, y
+        for column, value in zip(columns, (x, y, z)):
+            column.append(value)
+    return columns
+
+
+def to_frame(sides: Sides) -> ShapeFrame:
+    """Store solved triangles in a ShapeFrame in input row order, without building objects
+    Note:
+        Right triangles keep their solved hypotenuse rather than recomputing it from the legs.
+    """
+    groups = _grouped(sides, classify(sides))
+    frame = ShapeFrame()
+    order = [0] * len(sides.a)
+    for code, (rows, columns) in groups.items():
+        start = len(frame)
+        frame.extend_columns(code, *columns)
+        for slot, row in enumerate(rows):
+            order[row] = start + slot
+    if all(slot == row for row, slot in enumerate(order)):
+        return frame
+    return frame.take(order)
+
+
+def triangles(sides: Sides) -> list[Triangle]:
+    """Construct a RightTriangle, AcuteTriangle or ObtuseTriangle for every solved row"""
+    result: list[Triangle] = [None] * len(sides.a)  # type: ignore[list-item]
+    for code, (rows, columns) in _grouped(sides, classify(sides)).items():
+        if code is ShapeType.RIGHT_TRIANGLE:
+            shapes = map(RightTriangle, columns[0], columns[1])
+        else:
+            shapes = map(_CLASSES[code], *columns)
+        for row, shape in zip(rows, shapes):
+            result[row] = shape
+    return result
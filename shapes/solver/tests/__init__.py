@@ -0,0 +1 @@
+"""Tests for Solver package"""
@@ -0,0 +1,123 @@
+"""Test cases for the batch triangle solvers"""
+
+import math
+
+import pytest
+
+from shapes import AcuteTriangle, ObtuseTriangle, RightTriangle, ShapeType
+from shapes.solver import (
+    Sides,
+    classify,
+    solve_aas,
+    solve_asa,
+    solve_sas,
+    solve_sss,
+    to_frame,
+    triangles,
+)
+
+
+def assert_sides(sides: Sides, expected: list[tuple[float, float, float]]) -> None:
+    """Compare solved side columns with expected rows"""
+    assert len(sides.a) == len(expected)
+    for row, values in zip(zip(*sides), expected):
+        assert row == pytest.approx(values)
+
+
+class TestSolvers:
+    """Test resolving the missing sides"""
+
+    def test_sss(self):
+        """Test that three valid sides are returned as arrays"""
+        sides = solve_sss([3, 4], [4, 5], [5, 6])
+        assert_sides(sides, [(3, 4, 5), (4, 5, 6)])
+        assert sides.a.typecode == "d"
+
+    def test_sss_triangle_inequality(self):
+        """Test that sides breaking the triangle inequality raise ValueError"""
+        with pytest.raises(ValueError, match="Row 1"):
+            solve_sss([3, 1], [4, 2], [5, 3])
+
+    def test_sas(self):
+        """Test the law of cosines in radians and in degrees"""
+        assert_sides(solve_sas([3], [math.pi / 2], [4]), [(5, 3, 4)])
+        sides = solve_sas([2, 1], [60, 120], [2, 1], degrees=True)
+        assert_sides(sides, [(2, 2, 2), (3**0.5, 1, 1)])
+
+    def test_asa(self):
+        """Test the law of sines from the side between two angles"""
+        assert_sides(solve_asa([60], [2], [60], degrees=True), [(2, 2, 2)])
+        assert_sides(solve_asa([math.pi / 6], [3**0.5], [math.pi / 2]), [(3**0.5, 1, 2)])
+
+    def test_aas(self):
+        """Test the law of sines from a side opposite a known angle"""
+        assert_sides(solve_aas([30], [60], [1], degrees=True), [(1, 3**0.5, 2)])
+
+    @pytest.mark.parametrize(
+        "solve, columns",
+        [
+            (solve_sas, ([1], [0], [1])),
+            (solve_sas, ([1], [180], [1])),
+            (solve_sas, ([-1], [90], [1])),
+            (solve_sas, ([1], [math.nan], [1])),
+            (solve_asa, ([100], [1], [80])),
+            (solve_aas, ([30], [60], [0])),
+            (solve_aas, ([30, 30], [60], [1])),
+        ],
+    )
+    def test_invalid_rows(self, solve, columns):
+        """Test that bad angles, sides or column lengths raise ValueError"""
+        with pytest.raises(ValueError):
+            solve(*columns, degrees=True)
+
+    def test_error_names_row(self):
+        """Test that the first invalid row is reported"""
+        with pytest.raises(ValueError, match="Row 2"):
+            solve_sas([1, 1, 1], [30, 60, 0], [1, 1, 1], degrees=True)
+
+
+class TestBuilding:
+    """Test classifying and constructing solved triangles"""
+
+    SIDES = solve_sas([3, 4, 2, 3], [90, 60, 120, 30], [4, 4, 2, 3], degrees=True)
+
+    def test_classify(self):
+        """Test the type code of every row, with rounding in the right triangle"""
+        assert list(classify(self.SIDES)) == [
+            ShapeType.RIGHT_TRIANGLE,
+            ShapeType.ACUTE_TRIANGLE,
+            ShapeType.OBTUSE_TRIANGLE,
+            ShapeType.ACUTE_TRIANGLE,
+        ]
+
+    def test_triangles(self):
+        """Test constructing the matching subclass in input order"""
+        shapes = triangles(self.SIDES)
+        assert [type(shape) for shape in shapes] == [
+            RightTriangle,
+            AcuteTriangle,
+            ObtuseTriangle,
+            AcuteTriangle,
+        ]
+        assert shapes[0].hypotenuse() == pytest.approx(5)
+        assert shapes[2].area() == pytest.approx(3**0.5)
+
+    def test_to_frame(self):
+        """Test that the frame keeps the input order and stores the hypotenuse last"""
+        frame = to_frame(self.SIDES)
+        assert [frame.type_at(row) for row in range(4)] == list(classify(self.SIDES))
+        assert frame[0].c == pytest.approx(5)
+        expected = [shape.area() for shape in triangles(self.SIDES)]
+        assert list(frame.metric("area")) == pytest.approx(expected)
+
+    def test_right_hypotenuse_first(self):
+        """Test that a right triangle given with its hypotenuse first is reordered"""
+        frame = to_frame(solve_sss([5], [3], [4]))
+        columns = frame.columns(ShapeType.RIGHT_TRIANGLE)
+        assert [list(column) for column in columns] == [[3], [4], [5]]
+
+    def test_empty(self):
+        """Test that empty columns give an empty frame and no triangles"""
+        sides = solve_aas([], [], [])
+        assert len(to_frame(sides)) == 0
+        assert triangles(sides) == []
@@ -0,0 +1,5 @@
+"""Spatial module"""
+
+from .spatial import RTree, SpatialHash
+
+__all__ = ["RTree", "SpatialHash"]
@@ -0,0 +1,236 @@
+"""Module to index positioned shapes for fast spatial queries"""
+
+import heapq
+import math
+from collections.abc import Hashable, Iterable, Iterator, Sequence
+
+Bounds = tuple[float, float, float, float]
+
+
+def _union(boxes: Iterable[Bounds]) -> Bounds:
+    """Get the smallest box covering a set of boxes"""
+    min_xs, min_ys, max_xs, max_ys = zip(*boxes)
+    return (min(min_xs), min(min_ys), max(max_xs), max(max_ys))
+
+
+def _box_distance(box: Bounds, x: float, y: float) -> float:
+    """Calculate the distance from a point to a box, 0 if the point is inside"""
+    dx = max(box[0] - x, 0.0, x - box[2])
+    dy = max(box[1] - y, 0.0, y - box[3])
+    return math.hypot(dx, dy)
+
+
+class _Node:
+    """Node of an RTree holding either child nodes or (bounds, item) entries"""
+
+    __slots__ = ("bounds", "children", "leaf")
+
+    def __init__(self, children: list, leaf: bool) -> None:
+        """Initialize the node and compute its bounds from its children"""
+        self.children: list = children
+        self.leaf: bool = leaf
+        self.bounds: Bounds = _union(entry[0] if leaf else entry.bounds for entry in children)
+
+
+class RTree:
+    """Static R-tree over positioned shapes, bulk loaded with Sort-Tile-Recursive packing"""
+
+    def __init__(self, items: Iterable[object] = (), leaf_size: int = 16) -> None:
+        """Initialize the RTree from positioned shapes
+        Args:
+            items: objects with a bounds() method returning (min_x, min_y, max_x, max_y)
+            leaf_size: maximum number of entries per node
+        Raises:
+            ValueError: if leaf_size is less than 2
+        """
+        if leaf_size < 2:
+            raise ValueError("Leaf size must be at least 2")
+        self._leaf_size: int = leaf_size
+        self._root: _Node | None = None
+        self._size: int = 0
+        self._load([(tuple(item.bounds()), item) for item in items])  # type: ignore[attr-defined]
+
+    @classmethod
+    def from_entries(
+        cls, entries: Iterable[tuple[Sequence[float], object]], leaf_size: int = 16
+    ) -> "RTree":
+        """Create an RTree from explicit (bounds, item) pairs
+        Args:
+            entries: pairs of (min_x, min_y, max_x, max_y) and the item to return from queries
+            leaf_size: maximum number of entries per node
+        """
+        tree = cls(leaf_size=leaf_size)
+        tree._load([(tuple(bounds), item) for bounds, item in entries])
+        return tree
+
+    def _load(self, entries: list) -> None:
+        """Bulk load the tree bottom-up with Sort-Tile-Recursive packing"""
+        self._size = len(entries)
+        if not entries:
+            self._root = None
+            return
+        level = self._pack(entries, leaf=True)
+        while len(level) > 1:
+            level = self._pack(level, leaf=False)
+        self._root = level[0]
+
+    def _pack(self, entries: list, leaf: bool) -> list[_Node]:
+        """Group one level of entries into nodes of tiles sorted by x, then by y"""
+
+        def box(entry: object) -> Bounds:
+            return entry[0] if leaf else entry.bounds  # type: ignore[index, attr-defined]
+
+        size = self._leaf_size
+        node_count = math.ceil(len(entries) / size)
+        slice_size = math.ceil(math.sqrt(node_count)) * size
+        entries = sorted(entries, key=lambda entry: box(entry)[0] + box(entry)[2])
+        nodes = []
+        for start in range(0, len(entries), slice_size):
+            tile = sorted(
+                entries[start : start + slice_size], key=lambda entry: box(entry)[1] + box(entry)[3]
+            )
+            for offset in range(0, len(tile), size):
+                nodes.append(_Node(tile[offset : offset + size], leaf))
+        return nodes
+
+    def __len__(self) -> int:
+        """Number of items in the tree"""
+        return self._size
+
+    def bounds(self) -> Bounds:
+        """Get the bounding box of every item in the tree
+        Raises:
+            ValueError: if the tree is empty
+        """
+        if self._root is None:
+            raise ValueError("An empty tree has no bounds")
+        return self._root.bounds
+
+    def _search(self, min_x: float, min_y: float, max_x: float, max_y: float) -> Iterator[object]:
+        """Yield the items whose bounding boxes intersect a window"""
+        if self._root is None:
+            return
+        stack = [self._root]
+        while stack:
+            node = stack.pop()
+            for child in node.children:
+                b = child[0] if node.leaf else child.bounds
+                if b[0] <= max_x and b[2] >= min_x and b[1] <= max_y and b[3] >= min_y:
+                    if node.leaf:
+                        yield child[1]
+                    else:
+                        stack.append(child)
+
+    def window(
+        self, min_x: int | float, min_y: int | float, max_x: int | float, max_y: int | float
+    ) -> list[object]:
+        """Find the items whose bounding boxes intersect a window, including touching ones"""
+        return list(self._search(min_x, min_y, max_x, max_y))
+
+    def point(self, x: int | float, y: int | float) -> list[object]:
+        """Find the items containing a point
+        Note:
+            Items with a contains_point() method are tested exactly, others by bounding box.
+        """
+        return [
+            item
+            for item in self._search(x, y, x, y)
+            if not hasattr(item, "contains_point") or item.contains_point(x, y)
+        ]
+
+    def nearest(self, x: int | float, y: int | float, k: int = 1) -> list[object]:
+        """Find the k items nearest to a point, closest first
+        Note:
+            Items with a distance_to() method are ranked exactly, others by bounding box.
+        """
+        if self._root is None or k <= 0:
+            return []
+        counter = 0
+        heap: list[tuple[float, int, bool, object]] = [(0.0, counter, False, self._root)]
+        found: list[object] = []
+        while heap and len(found) < k:
+            _, _, is_item, entry = heapq.heappop(heap)
+            if is_item:
+                found.append(entry)
+                continue
+            node: _Node = entry  # type: ignore[assignment]
+            for child in node.children:
+                counter += 1
+                if node.leaf:
+                    bounds, item = child
+                    if hasattr(item, "distance_to"):
+                        distance = item.distance_to(x, y)
+                    else:
+                        distance = _box_distance(bounds, x, y)
+                    heapq.heappush(heap, (distance, counter, True, item))
+                else:
+                    heapq.heappush(heap, (_box_distance(child.bounds, x, y), counter, False, child))
+        return found
+
+    def __str__(self) -> str:
+        """String representation of the RTree"""
+        return f"RTree(size={self._size}, leaf_size={self._leaf_size})"
+
+    def __repr__(self) -> str:
+        """String representation of the RTree"""
+        return f"size={self._size}, leaf_size={self._leaf_size}"
+
+
+class SpatialHash:
+    """Uniform grid hash of items stored at points, for neighbourhood lookups"""
+
+    def __init__(self, cell_size: int | float) -> None:
+        """Initialize the SpatialHash
+        Args:
+            cell_size: width and height of a grid cell
+        Raises:
+            ValueError: if cell_size is not positive
+        """
+        if cell_size <= 0:
+            raise ValueError("Cell size must be positive")
+        self._cell_size: float = float(cell_size)
+        self._cells: dict[tuple[int, int], list[Hashable]] = {}
+        self._size: int = 0
+
+    def cell_size(self) -> float:
+        """Get the width and height of a grid cell"""
+        return self._cell_size
+
+    def cell_of(self, x: int | float, y: int | float) -> tuple[int, int]:
+        """Get the (column, row) of the cell holding a point"""
+        return (math.floor(x / self._cell_size), math.floor(y / self._cell_size))
+
+    def insert(self, x: int | float, y: int | float, item: Hashable) -> None:
+        """Store an item at a point"""
+        self._cells.setdefault(self.cell_of(x, y), []).append(item)
+        self._size += 1
+
+    def cell_items(self, column: int, row: int) -> list[Hashable]:
+        """Get the items stored in one cell"""
+        return self._cells.get((column, row), [])
+
+    def near(self, x: int | float, y: int | float, distance: int | float) -> Iterator[Hashable]:
+        """Yield the items stored in the cells overlapping a square around a point
+        Args:
+            x: x coordinate of the center of the square
+            y: y coordinate of the center of the square
+            distance: half the side of the square; every item within it is yielded
+        """
+        first_column, first_row = self.cell_of(x - distance, y - distance)
+        last_column, last_row = self.cell_of(x + distance, y + distance)
+        cells = self._cells
+        for column in range(first_column, last_column + 1):
+            for row in range(first_row, last_row + 1):
+                yield from cells.get((column, row), ())
+
+    def __len__(self) -> int:
+        """Number of items in the hash"""
+        return self._size
+
+    def __str__(self) -> str:
+        """String representation of the SpatialHash"""
+        return f"SpatialHash(cell_size={self._cell_size}, size={self._size})"
+
+    def __repr__(self) -> str:
+        """String representation of the SpatialHash"""
+        return f"cell_size={self._cell_size}, size={self._size}"
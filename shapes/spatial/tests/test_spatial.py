@@ -0,0 +1,157 @@
+"""Test cases for the RTree class"""
+
+import random
+
+import pytest
+
+from shapes import PositionedCircle, PositionedRectangle
+from shapes.spatial import RTree, SpatialHash
+
+
+def random_shapes(count, seed=1):
+    """Create a reproducible mix of positioned circles and rectangles"""
+    rng = random.Random(seed)
+    shapes = []
+    for i in range(count):
+        x, y = rng.uniform(0, 100), rng.uniform(0, 100)
+        if i % 2:
+            shapes.append(PositionedCircle(rng.uniform(0.1, 2), x, y))
+        else:
+            shapes.append(PositionedRectangle(rng.uniform(0.1, 3), rng.uniform(0.1, 3), x, y))
+    return shapes
+
+
+def intersects(shape, window):
+    """Check a bounding box against a window by brute force"""
+    b = shape.bounds()
+    return b[0] <= window[2] and b[2] >= window[0] and b[1] <= window[3] and b[3] >= window[1]
+
+
+class TestRTreeBasics:
+    """Test construction"""
+
+    def test_empty(self):
+        """Test an empty tree"""
+        tree = RTree()
+        assert len(tree) == 0
+        assert tree.window(0, 0, 1, 1) == []
+        assert tree.nearest(0, 0) == []
+        with pytest.raises(ValueError):
+            tree.bounds()
+
+    def test_bounds(self):
+        """Test the bounds of all items"""
+        tree = RTree([PositionedCircle(1, 0, 0), PositionedRectangle(2, 2, 5, 5)])
+        assert len(tree) == 2
+        assert tree.bounds() == (-1, -1, 7, 7)
+
+    def test_invalid_leaf_size(self):
+        """Test that a too small leaf size raises ValueError"""
+        with pytest.raises(ValueError):
+            RTree(leaf_size=1)
+
+    def test_from_entries(self):
+        """Test building from explicit bounds and payloads"""
+        tree = RTree.from_entries([((0, 0, 1, 1), "a"), ((5, 5, 6, 6), "b")])
+        assert tree.window(4, 4, 10, 10) == ["b"]
+        assert tree.point(0.5, 0.5) == ["a"]
+        assert tree.nearest(4, 4) == ["b"]
+
+
+class TestRTreeQueries:
+    """Test queries against brute force"""
+
+    @pytest.mark.parametrize("leaf_size", [2, 4, 16])
+    def test_window_matches_brute_force(self, leaf_size):
+        """Test window queries"""
+        shapes = random_shapes(2000)
+        tree = RTree(shapes, leaf_size=leaf_size)
+        windows = [(10, 10, 20, 20), (0, 0, 100, 100), (50, 50, 50.5, 50.5), (200, 200, 300, 300)]
+        for window in windows:
+            expected = {id(s) for s in shapes if intersects(s, window)}
+            assert {id(s) for s in tree.window(*window)} == expected
+
+    def test_window_includes_touching(self):
+        """Test that touching boxes are reported"""
+        tree = RTree([PositionedRectangle(1, 1, 0, 0)])
+        assert len(tree.window(1, 1, 2, 2)) == 1
+
+    def test_point_is_exact(self):
+        """Test that point queries use exact containment"""
+        circle = PositionedCircle(1, 0, 0)
+        tree = RTree([circle])
+        assert tree.point(0.5, 0.5) == [circle]
+        assert tree.point(0.9, 0.9) == []
+
+    def test_point_matches_brute_force(self):
+        """Test point queries"""
+        shapes = random_shapes(2000, seed=2)
+        tree = RTree(shapes)
+        rng = random.Random(3)
+        for _ in range(100):
+            x, y = rng.uniform(0, 100), rng.uniform(0, 100)
+            expected = {id(s) for s in shapes if s.contains_point(x, y)}
+            assert {id(s) for s in tree.point(x, y)} == expected
+
+    def test_nearest_matches_brute_force(self):
+        """Test k-nearest queries"""
+        shapes = random_shapes(2000, seed=4)
+        tree = RTree(shapes)
+        rng = random.Random(5)
+        for _ in range(50):
+            x, y = rng.uniform(-10, 110), rng.uniform(-10, 110)
+            found = tree.nearest(x, y, k=5)
+            expected = sorted(s.distance_to(x, y) for s in shapes)[:5]
+            assert [s.distance_to(x, y) for s in found] == expected
+
+    def test_nearest_more_than_size(self):
+        """Test asking for more neighbours than there are items"""
+        tree = RTree(random_shapes(3))
+        assert len(tree.nearest(0, 0, k=10)) == 3
+
+    def test_str(self):
+        """Test str of a tree"""
+        assert str(RTree(random_shapes(3), leaf_size=4)) == "RTree(size=3, leaf_size=4)"
+
+
+class TestSpatialHash:
+    """Test the uniform grid hash"""
+
+    def test_insert_and_near(self):
+        """Test that nearby items are found and far ones are not"""
+        grid = SpatialHash(1)
+        grid.insert(0.5, 0.5, "a")
+        grid.insert(5.5, 5.5, "b")
+        assert len(grid) == 2
+        assert list(grid.near(0, 0, 1)) == ["a"]
+        assert sorted(grid.near(3, 3, 3)) == ["a", "b"]
+
+    def test_near_matches_brute_force(self):
+        """Test that every point within the distance is yielded"""
+        rng = random.Random(1)
+        points = [(rng.uniform(-10, 10), rng.uniform(-10, 10)) for _ in range(500)]
+        grid = SpatialHash(1.5)
+        for index, (x, y) in enumerate(points):
+            grid.insert(x, y, index)
+        found = set(grid.near(1, -2, 2.5))
+        for index, (x, y) in enumerate(points):
+            if abs(x - 1) <= 2.5 and abs(y + 2) <= 2.5:
+                assert index in found
+
+    def test_cells(self):
+        """Test cell addressing, including negative coordinates"""
+        grid = SpatialHash(2)
+        grid.insert(-0.5, 3, "a")
+        assert grid.cell_of(-0.5, 3) == (-1, 1)
+        assert grid.cell_items(-1, 1) == ["a"]
+        assert grid.cell_items(0, 0) == []
+        assert grid.cell_size() == 2
+
+    def test_invalid_cell_size(self):
+        """Test that a non-positive cell size raises ValueError"""
+        with pytest.raises(ValueError):
+            SpatialHash(0)
+
+    def test_str(self):
+        """Test str of a hash"""
+        assert str(SpatialHash(1)) == "SpatialHash(cell_size=1.0, size=0)"
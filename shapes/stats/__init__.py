@@ -0,0 +1,5 @@
+"""Stats module"""
+
+from .stats import MetricStats, RunningStats
+
+__all__ = ["RunningStats", "MetricStats"]
@@ -0,0 +1,222 @@
+"""Module to compute single-pass, mergeable statistics over shape metrics"""
+
+import math
+from array import array
+from collections.abc import Iterable
+from itertools import islice
+from typing import TYPE_CHECKING
+
+from shapes.frame import metric_chunks
+
+if TYPE_CHECKING:
+    from typing_extensions import Self
+else:
+    try:
+        from typing import Self
+    except ImportError:
+        from typing_extensions import Self
+
+# Number of values buffered from a plain iterator before they are folded in
+_BATCH_SIZE = 4096
+
+
+class RunningStats:
+    """Streaming count, sum, mean, variance, min and max of a stream of values"""
+
+    def __init__(self, values: Iterable[float] = ()) -> None:
+        """Initialize the RunningStats with an optional iterable of values
+        Args:
+            values: values to fold into the statistics
+        """
+        self._count: int = 0
+        self._mean: float = 0.0
+        self._m2: float = 0.0
+        self._sum: float = 0.0
+        self._compensation: float = 0.0
+        self._min: float = math.inf
+        self._max: float = -math.inf
+        self.update(values)
+
+    def add(self, value: int | float) -> None:
+        """Fold a single value into the statistics using Welford's update"""
+        x = float(value)
+        self._count += 1
+        delta = x - self._mean
+        self._mean += delta / self._count
+        self._m2 += delta * (x - self._mean)
+        self._add_to_sum(x)
+        self._min = min(self._min, x)
+        self._max = max(self._max, x)
+
+    def update(self, values: Iterable[float]) -> None:
+        """Fold an iterable of values into the statistics
+        Args:
+            values: a sequence is folded in as one chunk; other iterables are consumed in batches
+        """
+        if isinstance(values, (array, list, tuple, memoryview)):
+            self._add_chunk(values)
+            return
+        iterator = iter(values)
+        while batch := list(islice(iterator, _BATCH_SIZE)):
+            self._add_chunk(batch)
+
+    def _add_chunk(self, chunk: array | list | tuple | memoryview) -> None:
+        """Fold a chunk in with a two-pass mean and variance, then merge it"""
+        n = len(chunk)
+        if n == 0:
+            return
+        total = math.fsum(chunk)
+        mean = total / n
+        m2 = math.fsum((x - mean) ** 2 for x in chunk)
+        self._combine(n, mean, m2, total, 0.0, min(chunk), max(chunk))
+
+    def _combine(
+        self, n: int, mean: float, m2: float, total: float, compensation: float, lo: float, hi: float
+    ) -> None:
+        """Merge partial statistics using the parallel variance formula of Chan et al."""
+        if n == 0:
+            return
+        count = self._count + n
+        delta = mean - self._mean
+        self._mean += delta * n / count
+        self._m2 += m2 + delta * delta * self._count * n / count
+        self._count = count
+        self._add_to_sum(total)
+        self._add_to_sum(compensation)
+        self._min = min(self._min, lo)
+        self._max = max(self._max, hi)
+
+    def _add_to_sum(self, x: float) -> None:
+        """Add to the running total with Neumaier compensated summation"""
+        total = self._sum + x
+        if abs(self._sum) >= abs(x):
+            self._compensation += (self._sum - total) + x
+        else:
+            self._compensation += (x - total) + self._sum
+        self._sum = total
+
+    def merge(self, other: "RunningStats") -> Self:
+        """Merge statistics gathered elsewhere, e.g. by a parallel worker, into these"""
+        self._combine(
+            other._count,
+            other._mean,
+            other._m2,
+            other._sum,
+            other._compensation,
+            other._min,
+            other._max,
+        )
+        return self
+
+    def count(self) -> int:
+        """Get the number of values seen"""
+        return self._count
+
+    def sum(self) -> float:
+        """Get the compensated sum of the values"""
+        return self._sum + self._compensation
+
+    def mean(self) -> float:
+        """Get the mean of the values
+        Raises:
+            ValueError: if no values have been seen
+        """
+        if self._count == 0:
+            raise ValueError("Mean requires at least one value")
+        return self.sum() / self._count
+
+    def variance(self, ddof: int = 0) -> float:
+        """Get the variance of the values
+        Args:
+            ddof: delta degrees of freedom; 0 for population, 1 for sample variance
+        Raises:
+            ValueError: if there are not more than ddof values
+        """
+        if self._count <= ddof:
+            raise ValueError(f"Variance requires more than {ddof} values")
+        return max(self._m2, 0.0) / (self._count - ddof)
+
+    def stdev(self, ddof: int = 0) -> float:
+        """Get the standard deviation of the values
+        Args:
+            ddof: delta degrees of freedom; 0 for population, 1 for sample deviation
+        """
+        return math.sqrt(self.variance(ddof))
+
+    def min(self) -> float:
+        """Get the smallest value
+        Raises:
+            ValueError: if no values have been seen
+        """
+        if self._count == 0:
+            raise ValueError("Min requires at least one value")
+        return self._min
+
+    def max(self) -> float:
+        """Get the largest value
+        Raises:
+            ValueError: if no values have been seen
+        """
+        if self._count == 0:
+            raise ValueError("Max requires at least one value")
+        return self._max
+
+    def __add__(self, other: "RunningStats") -> "RunningStats":
+        """Combine two sets of statistics into a new one"""
+        if not isinstance(other, RunningStats):
+            return NotImplemented
+        new = RunningStats()
+        new.merge(self)
+        new.merge(other)
+        return new
+
+    def __str__(self) -> str:
+        """String representation of the RunningStats"""
+        return f"RunningStats(count={self._count}, sum={self.sum()})"
+
+    def __repr__(self) -> str:
+        """String representation of the RunningStats"""
+        return f"count={self._count}, sum={self.sum()}"
+
+
+class MetricStats(RunningStats):
+    """Streaming statistics for one metric over shapes and ShapeFrame chunks"""
+
+    def __init__(self, metric: str = "area", source: object = (), chunk_size: int = 65536) -> None:
+        """Initialize the MetricStats for a metric
+        Args:
+            metric: name of a no-argument shape method, e.g. "area"
+            source: optional shapes or ShapeFrames to consume immediately
+            chunk_size: number of loose shapes evaluated per group-dispatched chunk
+        """
+        super().__init__()
+        self._metric: str = metric
+        self._chunk_size: int = chunk_size
+        self.consume(source)
+
+    def metric(self) -> str:
+        """Get the name of the metric being aggregated"""
+        return self._metric
+
+    def consume(self, source: object) -> Self:
+        """Fold the metric values of a shape, a ShapeFrame or an iterable of them into the statistics"""
+        for chunk in metric_chunks(source, self._metric, self._chunk_size):
+            self._add_chunk(chunk)
+        return self
+
+    def merge(self, other: RunningStats) -> Self:
+        """Merge statistics gathered elsewhere, e.g. by a parallel worker, into these
+        Raises:
+            ValueError: if the other statistics aggregate a different metric
+        """
+        if isinstance(other, MetricStats) and other.metric() != self._metric:
+            raise ValueError(f"Cannot merge '{other.metric()}' into '{self._metric}' statistics")
+        return super().merge(other)
+
+    def __str__(self) -> str:
+        """String representation of the MetricStats"""
+        return f"MetricStats(metric={self._metric}, count={self._count}, sum={self.sum()})"
+
+    def __repr__(self) -> str:
+        """String representation of the MetricStats"""
+        return f"metric={self._metric}, count={self._count}, sum={self.sum()}"
@@ -0,0 +1 @@
+"""Tests for Stats package"""
@@ -0,0 +1,166 @@
+"""Test cases for the RunningStats and MetricStats classes"""
+
+import math
+import pickle
+import random
+import statistics
+
+import pytest
+
+from shapes import Circle, Rectangle, RightTriangle, ShapeFrame, Square
+from shapes.stats import MetricStats, RunningStats
+
+
+class TestRunningStatsBasics:
+    """Test statistics over plain values"""
+
+    def test_matches_statistics_module(self):
+        """Test results agree with the statistics module"""
+        values = [random.Random(1).uniform(0, 100) for _ in range(1000)]
+        stats = RunningStats(values)
+        assert stats.count() == 1000
+        assert math.isclose(stats.mean(), statistics.fmean(values))
+        assert math.isclose(stats.variance(), statistics.pvariance(values))
+        assert math.isclose(stats.variance(ddof=1), statistics.variance(values))
+        assert math.isclose(stats.stdev(ddof=1), statistics.stdev(values))
+        assert stats.min() == min(values)
+        assert stats.max() == max(values)
+
+    def test_add_single_values(self):
+        """Test folding in one value at a time"""
+        stats = RunningStats()
+        for value in [2, 4, 4, 4, 5, 5, 7, 9]:
+            stats.add(value)
+        assert stats.mean() == 5
+        assert math.isclose(stats.variance(), 4)
+        assert stats.stdev() == 2
+
+    def test_generator_input(self):
+        """Test that iterators are consumed in batches"""
+        stats = RunningStats(float(i) for i in range(10001))
+        assert stats.count() == 10001
+        assert stats.mean() == 5000
+        assert stats.sum() == 50005000
+
+    def test_empty_raises(self):
+        """Test that statistics of no values raise ValueError"""
+        stats = RunningStats()
+        assert stats.count() == 0
+        assert stats.sum() == 0
+        for method in (stats.mean, stats.variance, stats.min, stats.max):
+            with pytest.raises(ValueError):
+                method()
+
+    def test_sample_variance_of_one_value(self):
+        """Test that sample variance needs two values"""
+        stats = RunningStats([3.0])
+        assert stats.variance() == 0
+        with pytest.raises(ValueError):
+            stats.variance(ddof=1)
+
+
+class TestRunningStatsAccuracy:
+    """Test numerical accuracy"""
+
+    def test_compensated_sum(self):
+        """Test that small values are not lost next to large ones"""
+        stats = RunningStats()
+        stats.add(1e16)
+        for _ in range(1000):
+            stats.add(1.0)
+        stats.add(-1e16)
+        assert stats.sum() == 1000
+
+    def test_variance_with_large_offset(self):
+        """Test that variance survives a large common offset"""
+        stats = RunningStats([1e9 + 4, 1e9 + 7, 1e9 + 13, 1e9 + 16])
+        assert math.isclose(stats.variance(ddof=1), 30)
+
+
+class TestRunningStatsMerge:
+    """Test merging partial results"""
+
+    def test_merge_matches_single_pass(self):
+        """Test that merged partitions equal one pass over everything"""
+        rng = random.Random(7)
+        values = [rng.gauss(50, 10) for _ in range(3000)]
+        parts = [RunningStats(values[i::3]) for i in range(3)]
+        merged = RunningStats()
+        for part in parts:
+            merged.merge(part)
+        whole = RunningStats(values)
+        assert merged.count() == whole.count()
+        assert math.isclose(merged.mean(), whole.mean())
+        assert math.isclose(merged.variance(), whole.variance())
+        assert merged.min() == whole.min()
+        assert merged.max() == whole.max()
+
+    def test_merge_empty(self):
+        """Test merging with empty statistics"""
+        stats = RunningStats([1, 2, 3])
+        stats.merge(RunningStats())
+        assert stats.count() == 3
+        empty = RunningStats().merge(stats)
+        assert empty.mean() == 2
+
+    def test_add_operator(self):
+        """Test combining with +"""
+        combined = RunningStats([1, 2]) + RunningStats([3, 4])
+        assert combined.count() == 4
+        assert combined.mean() == 2.5
+
+    def test_pickle_round_trip(self):
+        """Test that statistics can be shipped between processes"""
+        stats = RunningStats([1, 2, 3])
+        restored = pickle.loads(pickle.dumps(stats))
+        assert restored.count() == 3
+        assert restored.mean() == 2
+
+
+class TestMetricStats:
+    """Test statistics over shape metrics"""
+
+    def test_consume_shapes(self):
+        """Test consuming loose shapes"""
+        shapes = [Square(2), Rectangle(2, 3), RightTriangle(3, 4)]
+        stats = MetricStats("area", shapes)
+        assert stats.count() == 3
+        assert stats.sum() == 16
+        assert stats.max() == 6
+
+    def test_consume_frames_and_shapes(self):
+        """Test consuming a mix of frames and shapes in small chunks"""
+        stats = MetricStats("area", chunk_size=2)
+        stats.consume([Square(1), Square(2), ShapeFrame([Square(3)]), Square(4)])
+        stats.consume(Square(5))
+        assert stats.count() == 5
+        assert stats.sum() == 55
+
+    def test_circle_area(self):
+        """Test aggregating circle areas"""
+        stats = MetricStats("area", ShapeFrame([Circle(1), Circle(2)]))
+        assert math.isclose(stats.mean(), 2.5 * math.pi)
+
+    def test_other_metric(self):
+        """Test aggregating a metric other than area"""
+        stats = MetricStats("perimeter", [Square(1), Rectangle(1, 2)])
+        assert stats.metric() == "perimeter"
+        assert stats.sum() == 10
+
+    def test_merge_different_metric(self):
+        """Test that merging different metrics raises ValueError"""
+        with pytest.raises(ValueError):
+            MetricStats("area").merge(MetricStats("perimeter"))
+
+    def test_merge_workers(self):
+        """Test merging per-worker statistics"""
+        shapes = [Square(i) for i in range(1, 101)]
+        workers = [MetricStats("area", shapes[i::4]) for i in range(4)]
+        total = MetricStats("area")
+        for worker in workers:
+            total.merge(worker)
+        assert total.sum() == sum(i * i for i in range(1, 101))
+
+    def test_str(self):
+        """Test str of metric statistics"""
+        assert str(MetricStats("area", [Square(2)])) == "MetricStats(metric=area, count=1, sum=4.0)"
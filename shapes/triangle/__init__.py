@@ -1,5 +1,19 @@
 """Shapes module"""
 
-from .triangle import AcuteTriangle, ObtuseTriangle, RightTriangle, Triangle
+from .triangle import (
+    AcuteTriangle,
+    ObtuseTriangle,
+    PositionedTriangle,
+    RightTriangle,
+    Triangle,
+    classify_triangle,
+)
 
-__all__ = ["Triangle", "RightTriangle", "AcuteTriangle", "ObtuseTriangle"]
+__all__ = [
+    "Triangle",
+    "RightTriangle",
+    "AcuteTriangle",
+    "ObtuseTriangle",
+    "PositionedTriangle",
+    "classify_triangle",
+]
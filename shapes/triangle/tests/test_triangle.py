@@ -1,10 +1,12 @@
 """Test cases for Triangle classes"""
 
 import math
+import pickle
 
 import pytest
 
-from shapes import AcuteTriangle, ObtuseTriangle, RightTriangle
+from shapes import AcuteTriangle, ObtuseTriangle, PositionedTriangle, RightTriangle
+from shapes.triangle import classify_triangle
 
 
 class TestRightTriangleBasics:
@@ -37,6 +39,24 @@ class TestRightTriangleBasics:
         triangle = RightTriangle(1, 1)
         assert math.isclose(triangle.hypotenuse(), math.sqrt(2))
 
+    def test_from_sides(self):
+        """Test creating a triangle from exact integer sides"""
+        triangle = RightTriangle.from_sides(20, 21, 29)
+        assert (triangle.a, triangle.b, triangle.c) == (20, 21, 29)
+        assert isinstance(triangle.c, int)
+        assert triangle == RightTriangle(20, 21)
+
+    def test_from_sides_float(self):
+        """Test that float sides are checked within a tolerance"""
+        triangle = RightTriangle.from_sides(1, 1, math.sqrt(2))
+        assert math.isclose(triangle.area(), 0.5)
+
+    @pytest.mark.parametrize("sides", [(3, 4, 6), (0, 4, 4), (1.0, 1.0, 1.5), (3, 4, 5.001)])
+    def test_from_sides_invalid(self, sides):
+        """Test that sides that are not right raise ValueError"""
+        with pytest.raises(ValueError):
+            RightTriangle.from_sides(*sides)
+
 
 class TestRightTriangleGeometry:
     """Test geometric calculations"""
@@ -595,5 +615,123 @@ class TestTriangleCrossComparison:
         assert acute > obtuse  # acute has area ~14.7, obtuse has area ~5.3
 
 
+class TestClassifyTriangle:
+    """Test classification from squared side lengths"""
+
+    def test_right(self):
+        """Test a right triangle"""
+        assert classify_triangle(9, 16, 25) is RightTriangle
+
+    def test_acute(self):
+        """Test an acute triangle"""
+        assert classify_triangle(25, 36, 49) is AcuteTriangle
+
+    def test_obtuse(self):
+        """Test an obtuse triangle, whichever side is longest"""
+        assert classify_triangle(9, 16, 36) is ObtuseTriangle
+        assert classify_triangle(36, 9, 16) is ObtuseTriangle
+
+
+class TestPositionedTriangle:
+    """Test triangles placed by their vertices"""
+
+    def test_sides(self):
+        """Test that sides are opposite their vertices"""
+        triangle = PositionedTriangle((0, 0), (4, 0), (0, 3))
+        assert triangle.a == 5
+        assert triangle.b == 3
+        assert triangle.c == 4
+
+    def test_collinear(self):
+        """Test that collinear vertices raise ValueError"""
+        with pytest.raises(ValueError):
+            PositionedTriangle((0, 0), (1, 1), (2, 2))
+
+    def test_area_and_angles(self):
+        """Test shoelace area and inherited angle calculations"""
+        triangle = PositionedTriangle((0, 0), (4, 0), (0, 3))
+        assert triangle.area() == 6
+        assert math.isclose(triangle.angle_a(), math.pi / 2)
+        assert math.isclose(triangle.circumradius(), 2.5)
+        assert math.isclose(triangle.inradius(), 1)
+
+    def test_triangle_classification(self):
+        """Test conversion to the matching Triangle subclass"""
+        right = PositionedTriangle((0, 0), (4, 0), (0, 3)).triangle()
+        assert isinstance(right, RightTriangle)
+        assert right.hypotenuse() == 5
+        assert isinstance(PositionedTriangle((0, 0), (4, 0), (1, 3)).triangle(), AcuteTriangle)
+        assert isinstance(PositionedTriangle((0, 0), (4, 0), (-1, 1)).triangle(), ObtuseTriangle)
+
+    @pytest.mark.parametrize("vertices", [((0, 0), (4, 0), (0, 3)), ((0, 0), (0, 3), (4, 0))])
+    def test_contains_point_either_winding(self, vertices):
+        """Test containment for clockwise and counter-clockwise vertices"""
+        triangle = PositionedTriangle(*vertices)
+        assert triangle.contains_point(1, 1)
+        assert triangle.contains_point(0, 0)
+        assert triangle.contains_point(2, 0)
+        assert not triangle.contains_point(3, 3)
+
+    def test_distance_to(self):
+        """Test the distance from a point"""
+        triangle = PositionedTriangle((0, 0), (4, 0), (0, 3))
+        assert triangle.distance_to(1, 1) == 0
+        assert math.isclose(triangle.distance_to(2, -2), 2)
+        assert math.isclose(triangle.distance_to(-3, -4), 5)
+
+    def test_bounds_and_translate(self):
+        """Test the bounding box after moving"""
+        triangle = PositionedTriangle((0, 0), (4, 0), (0, 3))
+        triangle.translate(1, 2)
+        assert triangle.bounds() == (1, 2, 5, 5)
+        assert triangle.contains_point(2, 3)
+
+    def test_scaling_about_centroid(self):
+        """Test that scaling keeps the centroid and scales the area"""
+        triangle = PositionedTriangle((0, 0), (3, 0), (0, 3))
+        scaled = triangle * 4
+        assert isinstance(scaled, PositionedTriangle)
+        assert math.isclose(scaled.area(), 18)
+        xs, ys = zip(*scaled.vertices())
+        assert math.isclose(sum(xs) / 3, 1)
+        assert math.isclose(sum(ys) / 3, 1)
+        assert math.isclose((scaled / 4).area(), 4.5)
+
+    def test_str(self):
+        """Test string representations"""
+        triangle = PositionedTriangle((0, 0), (1, 0), (0, 1))
+        assert str(triangle) == "PositionedTriangle(vertices=((0.0, 0.0), (1.0, 0.0), (0.0, 1.0)))"
+        assert repr(triangle) == "vertices=((0.0, 0.0), (1.0, 0.0), (0.0, 1.0))"
+
+
+class TestTrianglePickling:
+    """Test pickling triangles"""
+
+    def test_roundtrip(self):
+        """Test that unpickled triangles keep their class and sides"""
+        shapes = (
+            RightTriangle(3, 4),
+            AcuteTriangle(5, 6, 7),
+            ObtuseTriangle(3, 4, 6),
+            PositionedTriangle((0, 0), (4, 0), (1, 3)),
+        )
+        for triangle in shapes:
+            copy = pickle.loads(pickle.dumps(triangle))
+            assert type(copy) is type(triangle)
+            assert (copy.a, copy.b, copy.c) == (triangle.a, triangle.b, triangle.c)
+
+    def test_scaled_right_triangle_keeps_hypotenuse(self):
+        """Test that the stored hypotenuse is restored rather than recomputed"""
+        triangle = RightTriangle(1, 1)
+        triangle *= 3
+        assert pickle.loads(pickle.dumps(triangle)).c == triangle.c
+
+    def test_batch_smaller_than_instance_dictionaries(self):
+        """Test that a batch pickles smaller than the classes and instance dictionaries"""
+        triangles = [AcuteTriangle(5 + i / 100, 6, 7) for i in range(100)]
+        full = [(type(triangle), vars(triangle)) for triangle in triangles]
+        assert len(pickle.dumps(triangles)) < len(pickle.dumps(full))
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -14,6 +14,13 @@ else:
         from typing_extensions import Self
 
 
+def _restore(cls: type, a: float, b: float, c: float) -> "Triangle":
+    """Rebuild a pickled triangle from its stored sides without re-deriving or re-checking them"""
+    triangle = cls.__new__(cls)
+    Triangle.__init__(triangle, a, b, c)
+    return triangle
+
+
 @total_ordering
 class Triangle(ABC):
     """Base Triangle class with common properties and methods"""
@@ -81,6 +88,14 @@ class Triangle(ABC):
             raise TypeError("Can only compare Triangle with another Triangle")
         return self.area() < other.area()
 
+    def __reduce__(self) -> tuple[object, tuple[object, ...]]:
+        """Pickle the triangle as its three sides instead of its instance dictionary
+        Note:
+            The sides are restored exactly as stored, so a RightTriangle keeps its hypotenuse
+            and the acute and obtuse checks are not repeated when unpickling.
+        """
+        return (_restore, (type(self), self.a, self.b, self.c))
+
     def __str__(self) -> str:
         """String representation of the Triangle"""
         return f"Triangle(a={self.a}, b={self.b}, c={self.c})"
@@ -103,6 +118,31 @@ class RightTriangle(Triangle):
         c = math.sqrt(a**2 + b**2)
         super().__init__(a, b, c)
 
+    @classmethod
+    def from_sides(cls, a: int | float, b: int | float, c: int | float) -> "RightTriangle":
+        """Create a RightTriangle from both legs and the hypotenuse without recomputing it
+        Args:
+            a: length of the side opposite the angle
+            b: length of the side adjacent to the angle
+            c: length of the hypotenuse
+        Raises:
+            ValueError: if a side is not positive or a² + b² does not equal c²
+        Note:
+            Integer sides are stored as given and checked exactly, so Pythagorean triples keep
+            an exact integer hypotenuse; other sides are checked with math.isclose.
+        """
+        if not (a > 0 and b > 0 and c > 0):
+            raise ValueError("Sides must be positive")
+        if isinstance(a, int) and isinstance(b, int) and isinstance(c, int):
+            is_right = a * a + b * b == c * c
+        else:
+            is_right = math.isclose(a * a + b * b, c * c)
+        if not is_right:
+            raise ValueError("The square of the hypotenuse must equal the sum of the squares")
+        triangle = cls.__new__(cls)
+        Triangle.__init__(triangle, a, b, c)
+        return triangle
+
     def adjacent(self) -> float:
         """Return the length of the adjacent side"""
         return self.b
@@ -348,3 +388,140 @@ class ObtuseTriangle(Triangle):
     def __repr__(self) -> str:
         """String representation of the ObtuseTriangle"""
         return f"a={self.a}, b={self.b}, c={self.c}"
+
+
+def classify_triangle(a2: float, b2: float, c2: float) -> type[Triangle]:
+    """Classify a triangle from its squared side lengths using the constructor rules
+    Args:
+        a2 (float): squared length of side a
+        b2 (float): squared length of side b
+        c2 (float): squared length of side c
+    Returns:
+        AcuteTriangle, ObtuseTriangle or RightTriangle
+    """
+    if a2 + b2 > c2 and a2 + c2 > b2 and b2 + c2 > a2:
+        return AcuteTriangle
+    if sum([a2 + b2 < c2, a2 + c2 < b2, b2 + c2 < a2]) == 1:
+        return ObtuseTriangle
+    return RightTriangle
+
+
+@total_ordering
+class PositionedTriangle(Triangle):
+    """PositionedTriangle class to represent a triangle placed by its three vertices"""
+
+    def __init__(
+        self, p1: tuple[float, float], p2: tuple[float, float], p3: tuple[float, float]
+    ) -> None:
+        """Initialize the PositionedTriangle with its vertices
+        Args:
+            p1 (tuple): vertex opposite side a
+            p2 (tuple): vertex opposite side b
+            p3 (tuple): vertex opposite side c
+        Raises:
+            ValueError: if the vertices are collinear
+        """
+        self._place(*((float(x), float(y)) for x, y in (p1, p2, p3)))
+
+    def _place(
+        self, p1: tuple[float, float], p2: tuple[float, float], p3: tuple[float, float]
+    ) -> None:
+        """Set the vertices and derive the sides and edge half-planes"""
+        cross = (p2[0] - p1[0]) * (p3[1] - p1[1]) - (p2[1] - p1[1]) * (p3[0] - p1[0])
+        if cross == 0:
+            raise ValueError("Vertices must not be collinear")
+        self._vertices: tuple[tuple[float, float], ...] = (p1, p2, p3)
+        self._cross: float = cross
+        super().__init__(math.dist(p2, p3), math.dist(p1, p3), math.dist(p1, p2))
+        # Orient each edge so that a * x + b * y + c >= 0 holds inside the triangle
+        sign = 1.0 if cross > 0 else -1.0
+        self._edges: tuple[tuple[float, float, float], ...] = tuple(
+            (sign * (s[1] - e[1]), sign * (e[0] - s[0]), sign * (s[0] * e[1] - e[0] * s[1]))
+            for s, e in ((p1, p2), (p2, p3), (p3, p1))
+        )
+
+    def __reduce__(self) -> tuple[object, tuple[object, ...]]:
+        """Pickle the PositionedTriangle as its vertices"""
+        return (type(self), self._vertices)
+
+    def vertices(self) -> tuple[tuple[float, float], ...]:
+        """Get the three vertices of the triangle"""
+        return self._vertices
+
+    def edges(self) -> tuple[tuple[float, float, float], ...]:
+        """Get the edge half-planes as (a, b, c) triples, inside when a * x + b * y + c >= 0"""
+        return self._edges
+
+    def area(self) -> float:
+        """Calculate the area of the triangle with the shoelace formula"""
+        return abs(self._cross) / 2
+
+    def circumradius(self) -> float:
+        """Calculate the circumradius of the triangle"""
+        return (self.a * self.b * self.c) / (4 * self.area())
+
+    def triangle(self) -> Triangle:
+        """Create the RightTriangle, AcuteTriangle or ObtuseTriangle with the same sides"""
+        p1, p2, p3 = self._vertices
+        squares = [
+            (p2[0] - p3[0]) ** 2 + (p2[1] - p3[1]) ** 2,
+            (p1[0] - p3[0]) ** 2 + (p1[1] - p3[1]) ** 2,
+            (p1[0] - p2[0]) ** 2 + (p1[1] - p2[1]) ** 2,
+        ]
+        kind = classify_triangle(*squares)
+        if kind is RightTriangle:
+            legs = sorted(squares)[:2]
+            return RightTriangle(math.sqrt(legs[0]), math.sqrt(legs[1]))
+        return kind(self.a, self.b, self.c)  # type: ignore[call-arg]
+
+    def translate(self, dx: int | float, dy: int | float) -> None:
+        """Move the triangle by an offset"""
+        self._place(*((x + dx, y + dy) for x, y in self._vertices))
+
+    def bounds(self) -> tuple[float, float, float, float]:
+        """Get the axis-aligned bounding box as (min_x, min_y, max_x, max_y)"""
+        xs, ys = zip(*self._vertices)
+        return (min(xs), min(ys), max(xs), max(ys))
+
+    def contains_point(self, x: int | float, y: int | float) -> bool:
+        """Check if a point lies inside or on the triangle"""
+        return all(a * x + b * y + c >= 0 for a, b, c in self._edges)
+
+    def distance_to(self, x: int | float, y: int | float) -> float:
+        """Calculate the distance from a point to the triangle, 0 if the point is inside"""
+        if self.contains_point(x, y):
+            return 0.0
+        distances = []
+        for (sx, sy), (ex, ey) in zip(self._vertices, self._vertices[1:] + self._vertices[:1]):
+            dx, dy = ex - sx, ey - sy
+            t = max(0.0, min(1.0, ((x - sx) * dx + (y - sy) * dy) / (dx * dx + dy * dy)))
+            distances.append(math.hypot(x - sx - t * dx, y - sy - t * dy))
+        return min(distances)
+
+    def __imul__(self, scale: float) -> Self:
+        """In-place scale the area of the triangle by a factor, about its centroid"""
+        factor = math.sqrt(scale)
+        xs, ys = zip(*self._vertices)
+        cx, cy = sum(xs) / 3, sum(ys) / 3
+        self._place(*((cx + (x - cx) * factor, cy + (y - cy) * factor) for x, y in self._vertices))
+        return self
+
+    def __mul__(self, scale: int | float) -> "PositionedTriangle":
+        """Scale the area of the triangle by a factor, about its centroid"""
+        new = PositionedTriangle(*self._vertices)
+        new *= scale
+        return new
+
+    def __truediv__(self, scale: int | float) -> "PositionedTriangle":
+        """Scale the area of the triangle down by a factor, about its centroid"""
+        new = PositionedTriangle(*self._vertices)
+        new /= scale
+        return new
+
+    def __str__(self) -> str:
+        """String representation of the PositionedTriangle"""
+        return f"PositionedTriangle(vertices={self._vertices})"
+
+    def __repr__(self) -> str:
+        """String representation of the PositionedTriangle"""
+        return f"vertices={self._vertices}"
@@ -0,0 +1,5 @@
+"""Triples module"""
+
+from .triples import right_triangles, triangle_frame, triple_columns, triples
+
+__all__ = ["right_triangles", "triangle_frame", "triple_columns", "triples"]
@@ -0,0 +1,83 @@
+"""Test cases for the Pythagorean triple enumerators"""
+
+import math
+
+import pytest
+
+from shapes import RightTriangle, ShapeType
+from shapes.triples import right_triangles, triangle_frame, triple_columns, triples
+
+
+def brute_force(limit: int) -> set[tuple[int, int, int]]:
+    """Every triple with c at most limit, legs in ascending order"""
+    found = set()
+    for c in range(5, limit + 1):
+        for a in range(1, c):
+            b = math.isqrt(c * c - a * a)
+            if a < b and a * a + b * b == c * c:
+                found.add((a, b, c))
+    return found
+
+
+def normalized(rows) -> list[tuple[int, int, int]]:
+    """Triples with their legs in ascending order"""
+    return [(min(a, b), max(a, b), c) for a, b, c in rows]
+
+
+class TestTriples:
+    """Test lazily enumerated triples"""
+
+    def test_tree_order(self):
+        """Test the depth-first Berggren tree order of the smallest primitive triples"""
+        assert list(triples(30)) == [(3, 4, 5), (5, 12, 13), (7, 24, 25), (21, 20, 29), (15, 8, 17)]
+
+    def test_lazy(self):
+        """Test that the first triples come without walking the whole tree"""
+        found = triples(2**62)
+        assert [next(found) for _ in range(3)] == [(3, 4, 5), (5, 12, 13), (7, 24, 25)]
+
+    def test_all_triples_found_once(self):
+        """Test that scaled enumeration matches a brute-force search without duplicates"""
+        rows = normalized(triples(400, primitive=False))
+        assert len(rows) == len(set(rows))
+        assert set(rows) == brute_force(400)
+
+    def test_primitive_triples(self):
+        """Test that primitive enumeration keeps exactly the coprime triples"""
+        expected = {row for row in brute_force(400) if math.gcd(*row) == 1}
+        assert set(normalized(triples(400))) == expected
+
+    @pytest.mark.parametrize("limit", [0, 4])
+    def test_small_limit(self, limit):
+        """Test that limits below the smallest hypotenuse give nothing"""
+        assert not list(triples(limit))
+
+    def test_limit_too_large(self):
+        """Test that limits beyond 64-bit integers raise ValueError"""
+        with pytest.raises(ValueError):
+            list(triples(2**63))
+
+
+class TestBatches:
+    """Test columnar batches and right triangles built from triples"""
+
+    @pytest.mark.parametrize("primitive", [True, False])
+    def test_columns_match_triples(self, primitive):
+        """Test that the columns hold the triples in the same order"""
+        columns = triple_columns(500, primitive)
+        assert all(column.typecode == "q" for column in columns)
+        assert list(zip(*columns)) == list(triples(500, primitive))
+
+    def test_right_triangles_are_exact(self):
+        """Test that the triangles keep integer hypotenuses"""
+        shapes = list(right_triangles(100, primitive=False))
+        assert all(isinstance(shape, RightTriangle) for shape in shapes)
+        assert all(isinstance(shape.c, int) for shape in shapes)
+        assert all(shape.a**2 + shape.b**2 == shape.c**2 for shape in shapes)
+
+    def test_frame(self):
+        """Test storing the triples as right triangle rows"""
+        frame = triangle_frame(100, primitive=False)
+        assert frame.counts() == {ShapeType.RIGHT_TRIANGLE: len(list(triples(100, False)))}
+        areas = [shape.area() for shape in right_triangles(100, primitive=False)]
+        assert list(frame.metric("area")) == areas
@@ -0,0 +1,112 @@
+"""Module to enumerate Pythagorean triples as exact-integer right triangles"""
+
+from array import array
+from collections.abc import Iterator
+
+from shapes.frame import ShapeFrame, ShapeType
+from shapes.triangle import RightTriangle
+
+# Largest hypotenuse that fits in the signed 64-bit columns
+_MAX_LIMIT = 2**63 - 1
+
+# Signs applied to a and b by the three Berggren matrices
+_BRANCHES: tuple[tuple[int, int], ...] = ((1, -1), (1, 1), (-1, 1))
+
+
+def _walk(limit: int) -> Iterator[tuple[int, int, int]]:
+    """Walk the Berggren tree of primitive triples depth first, one triple at a time
+    Returns:
+        iterator of every primitive (a, b, c) with c at most limit, each parent before its
+        children and the children in branch order
+    Raises:
+        ValueError: if limit does not fit in a signed 64-bit integer
+    Note:
+        Every child has a larger hypotenuse than its parent, so branches are cut at the limit.
+        Only the unvisited siblings along the current path are held, so memory grows with the
+        depth of the tree rather than its width, and stopping the iteration stops the walk.
+    """
+    if limit > _MAX_LIMIT:
+        raise ValueError(f"Limit must be at most {_MAX_LIMIT}")
+    if limit < 5:
+        return
+    stack = [(3, 4, 5)]
+    while stack:
+        x, y, z = stack.pop()
+        yield (x, y, z)
+        # Pushed last branch first so the first branch is visited next
+        for sa, sb in reversed(_BRANCHES):
+            h = 2 * sa * x + 2 * sb * y + 3 * z
+            if h <= limit:
+                stack.append((sa * x + 2 * sb * y + 2 * z, 2 * sa * x + sb * y + 2 * z, h))
+
+
+def triples(limit: int, primitive: bool = True) -> Iterator[tuple[int, int, int]]:
+    """Lazily generate Pythagorean triples (a, b, c) with c at most limit
+    Args:
+        limit: largest hypotenuse to generate
+        primitive: only triples whose sides share no factor; otherwise each primitive triple
+            is followed by its multiples up to the limit
+    Raises:
+        ValueError: if limit does not fit in a signed 64-bit integer
+    Note:
+        Triples come in depth-first Berggren tree order, with a odd and b even for the
+        primitive ones. The order is the same as in triple_columns.
+    """
+    for x, y, z in _walk(limit):
+        if primitive:
+            yield (x, y, z)
+            continue
+        for k in range(1, limit // z + 1):
+            yield (k * x, k * y, k * z)
+
+
+def triple_columns(limit: int, primitive: bool = True) -> tuple[array, array, array]:
+    """Get the Pythagorean triples with c at most limit as exact-integer columns
+    Args:
+        limit: largest hypotenuse to generate
+        primitive: only triples whose sides share no factor, or also their multiples
+    Returns:
+        columns a, b and c as arrays of signed 64-bit integers, in the order of triples()
+    Raises:
+        ValueError: if limit does not fit in a signed 64-bit integer
+    """
+    columns = (array("q"), array("q"), array("q"))
+    if primitive:
+        found = list(_walk(limit))
+        if found:
+            for column, values in zip(columns, zip(*found)):
+                column.extend(values)
+        return columns
+    for x, y, z in _walk(limit):
+        count = limit // z
+        # Multiples of one triple are arithmetic progressions, written without a Python loop
+        for column, side in zip(columns, (x, y, z)):
+            column.extend(range(side, side * count + 1, side))
+    return columns
+
+
+def right_triangles(limit: int, primitive: bool = True) -> Iterator[RightTriangle]:
+    """Lazily generate a RightTriangle with exact integer sides for every triple
+    Args:
+        limit: largest hypotenuse to generate
+        primitive: only triples whose sides share no factor, or also their multiples
+    Raises:
+        ValueError: if limit does not fit in a signed 64-bit integer
+    """
+    for a, b, c in triples(limit, primitive):
+        yield RightTriangle.from_sides(a, b, c)
+
+
+def triangle_frame(limit: int, primitive: bool = True) -> ShapeFrame:
+    """Store the right triangles of every triple in a ShapeFrame without building objects
+    Args:
+        limit: largest hypotenuse to generate
+        primitive: only triples whose sides share no factor, or also their multiples
+    Raises:
+        ValueError: if limit does not fit in a signed 64-bit integer
+    Note:
+        The frame holds doubles, which represent every side exactly up to 2**53.
+    """
+    frame = ShapeFrame()
+    frame.extend_columns(ShapeType.RIGHT_TRIANGLE, *triple_columns(limit, primitive))
+    return frame